@@ -0,0 +1,77 @@
+"""
+Cost of the block operations of ArrayR against the element by element loops they replace: shifting
+every element by one position (as in ArraySortedList._shuffle_right), copying into a larger array
+(as in _resize) and filling, at 1k to 1M elements.
+
+Run from the repository root: python -m benchmarks.bench_array_moves
+"""
+import argparse
+import time
+
+from data_structures.referential_array import ArrayR
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+
+
+def filled(size: int) -> ArrayR:
+    array = ArrayR(size + 1)
+    array.copy_from(ArrayR(size))
+    return array
+
+
+def shift_loop(array: ArrayR, size: int) -> None:
+    for i in range(size, 0, -1):
+        array[i] = array[i - 1]
+
+
+def shift_block(array: ArrayR, size: int) -> None:
+    array.move(0, 1, size)
+
+
+def copy_loop(array: ArrayR, size: int) -> None:
+    new_array = ArrayR(2 * size)
+    for i in range(size):
+        new_array[i] = array[i]
+
+
+def copy_block(array: ArrayR, size: int) -> None:
+    new_array = ArrayR(2 * size)
+    new_array.copy_from(array, 0, 0, size)
+
+
+def fill_loop(array: ArrayR, size: int) -> None:
+    for i in range(size):
+        array[i] = 0
+
+
+def fill_block(array: ArrayR, size: int) -> None:
+    array.fill(0, 0, size)
+
+
+def best_time(function, size: int, repeat: int) -> float:
+    array = filled(size)
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(array, size)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main() -> None:
+    p = argparse.ArgumentParser()
+    p.add_argument("--repeat", type=int, default=3)
+    args = p.parse_args()
+
+    print(f"{'operation':>9} {'size':>9} {'loop':>11} {'block':>11} {'speedup':>8}")
+    for name, loop, block in (("shift", shift_loop, shift_block), ("copy", copy_loop, copy_block),
+                              ("fill", fill_loop, fill_block)):
+        for size in SIZES:
+            looped = best_time(loop, size, args.repeat)
+            blocked = best_time(block, size, args.repeat)
+            print(f"{name:>9} {size:>9} {looped * 1e3:>9.3f}ms {blocked * 1e3:>9.3f}ms {looped / blocked:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Memory blocks allocated per game for its cards, measured with tracemalloc: the blocks still held
+after dealing a game, and the peak traced memory while dealing it.
+
+Run from the repository root: python -m benchmarks.bench_card_alloc
+"""
+import argparse
+import time
+import tracemalloc
+
+from constants import Constants
+from data_structures.referential_array import ArrayR
+from events import NullSink
+from game import Game, generate_cards
+from player import Player
+from random_gen import RandomGen
+
+
+def deal(seed: int, num_players: int) -> Game:
+    RandomGen.set_seed(seed)
+    players: ArrayR[Player] = ArrayR(num_players)
+    for i in range(num_players):
+        players[i] = Player(f"Player {i}", i)
+    game = Game(NullSink())
+    game.initialise_game(players)
+    return game
+
+
+def card_blocks(snapshot: tracemalloc.Snapshot, before: tracemalloc.Snapshot) -> tuple[int, int]:
+    """ Number and size of the blocks allocated by card.py and game.py between the two snapshots. """
+    blocks = size = 0
+    for stat in snapshot.compare_to(before, "filename"):
+        if stat.traceback[0].filename.endswith(("card.py", "game.py")):
+            blocks += stat.count_diff
+            size += stat.size_diff
+    return blocks, size
+
+
+def main() -> None:
+    p = argparse.ArgumentParser()
+    p.add_argument("--games", type=int, default=50)
+    p.add_argument("--players", type=int, default=4)
+    args = p.parse_args()
+    Constants.NUM_CARDS_AT_INIT = 7
+
+    # Warm up caches so that only the cost of each game is measured
+    generate_cards()
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    games = [deal(seed, args.players) for seed in range(args.games)]
+    blocks, size = card_blocks(tracemalloc.take_snapshot(), before)
+    tracemalloc.stop()
+    print(f"held per game: {blocks / args.games:.1f} blocks, {size / args.games:,.0f} bytes from card.py/game.py")
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    cards = generate_cards()
+    peak = tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+    print(f"generate_cards peak: {peak:,} bytes")
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        generate_cards()
+    print(f"generate_cards: {(time.perf_counter() - start) * 1000:.1f} us per deck")
+    del games, cards
+
+
+if __name__ == "__main__":
+    main()
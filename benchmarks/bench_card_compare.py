@@ -0,0 +1,64 @@
+"""
+Cost of Card comparisons: raw comparisons, filling a hand with Player.add_card, and the memory
+taken by one Card object.
+
+Run from the repository root: python -m benchmarks.bench_card_compare
+"""
+import argparse
+import time
+import tracemalloc
+
+from card import Card, CardColor, CardLabel
+from game import generate_cards
+from player import Player
+from random_gen import RandomGen
+
+
+def bench_compare(cards: list[Card], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for i in range(len(cards) - 1):
+            a, b = cards[i], cards[i + 1]
+            a < b
+            a <= b
+            a == b
+            a > b
+    return time.perf_counter() - start
+
+
+def bench_add_card(cards: list[Card], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        player = Player("Player", 0)
+        for card in cards:
+            player.add_card(card)
+    return time.perf_counter() - start
+
+
+def card_size() -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    cards = [Card(CardColor.RED, CardLabel.ONE) for _ in range(1000)]
+    size = (tracemalloc.get_traced_memory()[0] - before) / len(cards)
+    tracemalloc.stop()
+    del cards
+    return size
+
+
+def main() -> None:
+    p = argparse.ArgumentParser()
+    p.add_argument("--repeat", type=int, default=200)
+    args = p.parse_args()
+
+    RandomGen.set_seed(1)
+    deck = generate_cards()
+    cards = [deck[i] for i in range(len(deck))]
+    comparisons = 4 * (len(cards) - 1) * args.repeat
+    print(f"comparisons: {bench_compare(cards, args.repeat) / comparisons * 1e9:.0f} ns each")
+    print(f"add_card: {bench_add_card(cards, args.repeat) / (len(cards) * args.repeat) * 1e6:.2f} us each "
+          f"(hand grown to {len(cards)} cards)")
+    print(f"memory per Card: {card_size():.0f} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Cost of dealing big hands: every card added with Player.add_card against every hand added in one
+merge with Player.add_cards, from a pile of several shuffled decks dealt round the table.
+
+Run from the repository root: python -m benchmarks.bench_deal
+"""
+import argparse
+import time
+
+from constants import Constants
+from game import generate_cards
+from player import Player
+from random_gen import RandomGen
+
+# (decks, players) dealt, most of the pile goes into the hands
+CONFIGS = ((1, 4), (2, 4), (4, 8), (8, 8), (16, 8))
+
+
+def multi_deck(decks: int) -> list:
+    """ The cards of several decks, each shuffled on its own, one after the other. """
+    cards = []
+    for _ in range(decks):
+        deck = generate_cards()
+        cards.extend(deck[i] for i in range(len(deck)))
+    return cards
+
+
+def deal_one_by_one(cards: list, num_players: int, hand_size: int) -> float:
+    players = [Player(f"Player {i}", i) for i in range(num_players)]
+    start = time.perf_counter()
+    for i in range(hand_size * num_players):
+        players[i % num_players].add_card(cards[i])
+    return time.perf_counter() - start
+
+
+def deal_batched(cards: list, num_players: int, hand_size: int) -> float:
+    players = [Player(f"Player {i}", i) for i in range(num_players)]
+    start = time.perf_counter()
+    end = hand_size * num_players
+    for seat in range(num_players):
+        players[seat].add_cards([cards[i] for i in range(seat, end, num_players)])
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    p = argparse.ArgumentParser()
+    p.add_argument("--repeat", type=int, default=5)
+    args = p.parse_args()
+
+    RandomGen.set_seed(1)
+    print(f"{'decks':>5} {'players':>7} {'hand':>5} {'add_card':>12} {'add_cards':>12} {'speedup':>8}")
+    for decks, num_players in CONFIGS:
+        cards = multi_deck(decks)
+        hand_size = len(cards) * 3 // (4 * num_players)
+        single = min(deal_one_by_one(cards, num_players, hand_size) for _ in range(args.repeat))
+        batched = min(deal_batched(cards, num_players, hand_size) for _ in range(args.repeat))
+        print(f"{decks:>5} {num_players:>7} {hand_size:>5} {single * 1e3:>10.2f}ms {batched * 1e3:>10.2f}ms "
+              f"{single / batched:>7.1f}x")
+    print(f"(a deck is {Constants.DECK_SIZE} cards, best of {args.repeat} deals)")
+
+
+if __name__ == "__main__":
+    main()
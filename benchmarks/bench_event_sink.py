@@ -0,0 +1,53 @@
+"""
+Rounds per second of full seeded games, printing to a throwaway stream versus running headless.
+
+Run from the repository root: python -m benchmarks.bench_event_sink
+"""
+import argparse
+import io
+import time
+
+from constants import Constants
+from data_structures.referential_array import ArrayR
+from events import NullSink, PrintSink
+from game import Game
+from player import Player
+from random_gen import RandomGen
+
+
+def play_games(num_games: int, num_players: int, make_sink) -> tuple[int, float]:
+    """ Plays num_games seeded games and returns (total rounds, elapsed seconds). """
+    Constants.NUM_CARDS_AT_INIT = 7
+    rounds = 0
+    elapsed = 0.0
+    for seed in range(num_games):
+        RandomGen.set_seed(seed)
+        players: ArrayR[Player] = ArrayR(num_players)
+        for i in range(num_players):
+            players[i] = Player(f"Player {i}", i)
+        game = Game(make_sink())
+        game.initialise_game(players)
+        start = time.perf_counter()
+        game.play_game()
+        elapsed += time.perf_counter() - start
+        rounds += game.round_count
+    return rounds, elapsed
+
+
+def main() -> None:
+    p = argparse.ArgumentParser()
+    p.add_argument("--games", type=int, default=200)
+    p.add_argument("--players", type=int, default=4)
+    args = p.parse_args()
+
+    sinks: list[tuple[str, callable]] = [
+        ("print", lambda: PrintSink(io.StringIO())),
+        ("null", NullSink),
+    ]
+    for name, make_sink in sinks:
+        rounds, elapsed = play_games(args.games, args.players, make_sink)
+        print(f"{name:>6}: {rounds} rounds in {elapsed:.3f}s -> {rounds / elapsed:,.0f} rounds/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Memory taken per game, measured with tracemalloc: many games are dealt and kept alive at once, as
+when thousands of games run side by side, then played to the end and kept again.
+
+Run from the repository root: python -m benchmarks.bench_game_memory
+"""
+import argparse
+import time
+import tracemalloc
+
+from constants import Constants
+from data_structures.referential_array import ArrayR
+from events import NullSink
+from game import Game, generate_cards
+from player import Player
+from random_gen import RandomStream
+
+
+def new_game(seed: int, num_players: int) -> Game:
+    players: ArrayR[Player] = ArrayR(num_players)
+    for i in range(num_players):
+        players[i] = Player(f"Player {i}", i)
+    game = Game(NullSink(), RandomStream(seed))
+    game.initialise_game(players)
+    return game
+
+
+def measure(games: int, num_players: int) -> tuple[float, float, float]:
+    """ Bytes per game once dealt and once played, and microseconds to create and deal a game. """
+    generate_cards()  # The deck template is shared by every game, keep it out of the measure
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [new_game(seed, num_players) for seed in range(games)]
+    dealt = (tracemalloc.get_traced_memory()[0] - before) / games
+    for game in kept:
+        game.play_game()
+    played = (tracemalloc.get_traced_memory()[0] - before) / games
+    tracemalloc.stop()
+    del kept
+
+    start = time.perf_counter()
+    for seed in range(games):
+        new_game(seed, num_players)
+    return dealt, played, (time.perf_counter() - start) / games * 1e6
+
+
+def main() -> None:
+    p = argparse.ArgumentParser()
+    p.add_argument("--games", type=int, default=1000)
+    args = p.parse_args()
+
+    Constants.NUM_CARDS_AT_INIT = 7
+    print(f"{'players':>7} {'dealt':>10} {'played':>10} {'deal time':>10}")
+    for num_players in (2, 4, 8):
+        dealt, played, micros = measure(args.games, num_players)
+        print(f"{num_players:>7} {dealt / 1024:>8.1f}KB {played / 1024:>8.1f}KB {micros:>8.1f}us")
+    print(f"(per game, {args.games} games alive at once)")
+
+
+if __name__ == "__main__":
+    main()
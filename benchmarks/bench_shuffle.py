@@ -0,0 +1,59 @@
+"""
+RandomGen.random_shuffle: the legacy sort on random keys versus the in-place Fisher-Yates mode,
+on an ArrayR of several sizes. Also reports the peak memory allocated by each shuffle.
+
+Run from the repository root: python -m benchmarks.bench_shuffle
+"""
+import argparse
+import time
+import tracemalloc
+
+from data_structures.referential_array import ArrayR
+from random_gen import RandomGen
+
+
+def filled(size: int) -> ArrayR[int]:
+    array = ArrayR(size)
+    for i in range(size):
+        array[i] = i
+    RandomGen.set_seed(size)
+    return array
+
+
+def bench(size: int, mode: str) -> tuple[float, int]:
+    """
+    Mean time of one shuffle, repeated for small sizes, then its peak allocation in a separate
+    run since tracing slows it down.
+    """
+    repeat = max(1, 100_000 // size)
+    array = filled(size)
+    RandomGen.random_shuffle(array, mode=mode)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        RandomGen.random_shuffle(array, mode=mode)
+    elapsed = (time.perf_counter() - start) / repeat
+
+    array = filled(size)
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    RandomGen.random_shuffle(array, mode=mode)
+    peak = tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    p = argparse.ArgumentParser()
+    p.add_argument("--sizes", type=int, nargs="+", default=[112, 10_000, 1_000_000])
+    args = p.parse_args()
+
+    print(f"{'size':>9} {'legacy':>12} {'fisher-yates':>14} {'legacy peak':>13} {'f-y peak':>10}")
+    for size in args.sizes:
+        legacy, legacy_peak = bench(size, RandomGen.LEGACY)
+        fisher_yates, fisher_yates_peak = bench(size, RandomGen.FISHER_YATES)
+        print(f"{size:>9} {legacy * 1000:>10.2f}ms {fisher_yates * 1000:>12.2f}ms "
+              f"{legacy_peak:>12,}B {fisher_yates_peak:>9,}B")
+
+
+if __name__ == "__main__":
+    main()
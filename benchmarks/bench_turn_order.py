@@ -0,0 +1,59 @@
+"""
+Cost of finding and moving to the next player: linear scan of the players (the previous
+Game.next_player) versus the TurnOrder ring, at several table sizes.
+
+Run from the repository root: python -m benchmarks.bench_turn_order
+"""
+import argparse
+import time
+
+from data_structures.referential_array import ArrayR
+from data_structures.turn_order import TurnOrder
+from player import Player
+
+
+def linear_next(players: ArrayR[Player], num_players: int, current: Player, direction: int) -> Player:
+    """ The previous Game.next_player: scan for the current player, then step. """
+    current_index = 0
+    for i in range(num_players):
+        if players[i] == current:
+            current_index = i
+            break
+    return players[(current_index + direction) % num_players]
+
+
+def bench_linear(num_players: int, turns: int) -> float:
+    players: ArrayR[Player] = ArrayR(num_players)
+    for i in range(num_players):
+        players[i] = Player(f"Player {i}", i)
+    current = players[0]
+    start = time.perf_counter()
+    for _ in range(turns):
+        current = linear_next(players, num_players, current, 1)
+    return time.perf_counter() - start
+
+
+def bench_ring(num_players: int, turns: int) -> float:
+    ring: TurnOrder[Player] = TurnOrder(num_players)
+    for i in range(num_players):
+        ring.append(Player(f"Player {i}", i))
+    start = time.perf_counter()
+    for _ in range(turns):
+        ring.advance()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    p = argparse.ArgumentParser()
+    p.add_argument("--turns", type=int, default=20000)
+    args = p.parse_args()
+
+    for num_players in (8, 64, 1024):
+        linear = bench_linear(num_players, args.turns)
+        ring = bench_ring(num_players, args.turns)
+        print(f"{num_players:>5} seats: linear {args.turns / linear:>12,.0f} turns/sec, "
+              f"ring {args.turns / ring:>12,.0f} turns/sec ({linear / ring:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
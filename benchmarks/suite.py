@@ -0,0 +1,282 @@
+"""
+Benchmark suite of the data structures and the game, with regression checks against a baseline.
+
+Every metric is the time of one operation in seconds (lower is better), the best of several runs.
+
+Run from the repository root:
+    python -m benchmarks.suite run --output baseline.json
+    python -m benchmarks.suite compare baseline.json --threshold 0.25
+    python -m benchmarks.suite compare baseline.json current.json
+
+compare runs the suite when no current results are given, prints every metric against the
+baseline and exits with status 1 if one got slower by more than the threshold, or if a metric of
+the baseline is missing from the current results, e.g. because its benchmark was renamed.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+
+from constants import Constants
+from data_structures.array_sorted_list import ArraySortedList
+from data_structures.aset import ASet
+from data_structures.bset import BSet
+from data_structures.queue_adt import CircularQueue
+from data_structures.referential_array import ArrayR
+from data_structures.stack_adt import ArrayStack
+from game import generate_cards
+from random_gen import RandomGen
+from simulate import derive_seed, play_seeded_game
+
+SIZES = (100, 1_000, 5_000)
+SHUFFLE_SIZES = (112, 10_000)
+SET_SIZE = 64
+
+
+def scrambled(size: int) -> list[int]:
+    """ The integers 0 to size - 1 in a fixed scrambled order. """
+    return [(i * 7919) % size for i in range(size)]
+
+
+def bench_sorted_list_add(size: int) -> tuple[float, int]:
+    items = scrambled(size)
+    sorted_list = ArraySortedList(size)
+    start = time.perf_counter()
+    for item in items:
+        sorted_list.add(item)
+    return time.perf_counter() - start, size
+
+
+def bench_sorted_list_add_all(size: int) -> tuple[float, int]:
+    # Half the items already in the list, the other half merged in as one batch
+    items = scrambled(size)
+    sorted_list = ArraySortedList(size)
+    sorted_list.add_all(items[:size // 2])
+    start = time.perf_counter()
+    sorted_list.add_all(items[size // 2:])
+    return time.perf_counter() - start, size - size // 2
+
+
+def bench_sorted_list_contains(size: int) -> tuple[float, int]:
+    sorted_list = ArraySortedList(size)
+    sorted_list.add_all(range(0, 2 * size, 2))
+    # Every other item is missing, so half the lookups are misses, the worst case of a linear scan
+    items = scrambled(2 * size)
+    start = time.perf_counter()
+    for item in items:
+        item in sorted_list
+    return time.perf_counter() - start, 2 * size
+
+
+def bench_sorted_list_delete(size: int) -> tuple[float, int]:
+    sorted_list = ArraySortedList(size)
+    for item in range(size):
+        sorted_list.add(item)
+    positions = [(i * 7919) % (size - i) for i in range(size)]
+    start = time.perf_counter()
+    for position in positions:
+        sorted_list.delete_at_index(position)
+    return time.perf_counter() - start, size
+
+
+def bench_stack(size: int) -> tuple[float, int]:
+    stack = ArrayStack(size)
+    start = time.perf_counter()
+    for item in range(size):
+        stack.push(item)
+    while not stack.is_empty():
+        stack.pop()
+    return time.perf_counter() - start, 2 * size
+
+
+def bench_queue(size: int) -> tuple[float, int]:
+    queue = CircularQueue(size)
+    start = time.perf_counter()
+    # Half full, then round and round the array
+    for item in range(size // 2):
+        queue.append(item)
+    for item in range(size):
+        queue.append(queue.serve())
+    while not queue.is_empty():
+        queue.serve()
+    return time.perf_counter() - start, size // 2 + 2 * size + size // 2
+
+
+def bench_set(set_class, size: int) -> tuple[float, int]:
+    """ Adds, membership tests, union, intersection, difference and removes on sets of 1 to size. """
+    first, second = set_class(size), set_class(size)
+    items = [item + 1 for item in scrambled(size)]
+    start = time.perf_counter()
+    for item in items:
+        first.add(item)
+        if item % 2:
+            second.add(item)
+    for item in items:
+        item in first
+    first.union(second)
+    first.intersection(second)
+    first.difference(second)
+    for item in items:
+        first.remove(item)
+    return time.perf_counter() - start, 4 * size + 3
+
+
+def bench_shuffle(size: int, mode: str) -> tuple[float, int]:
+    array = ArrayR(size)
+    for i in range(size):
+        array[i] = i
+    RandomGen.set_seed(size)
+    start = time.perf_counter()
+    RandomGen.random_shuffle(array, mode=mode)
+    return time.perf_counter() - start, 1
+
+
+def bench_generate_cards(decks: int) -> tuple[float, int]:
+    RandomGen.set_seed(decks)
+    start = time.perf_counter()
+    for _ in range(decks):
+        generate_cards()
+    return time.perf_counter() - start, decks
+
+
+def bench_games(games: int, num_players: int) -> tuple[float, int]:
+    start = time.perf_counter()
+    for i in range(games):
+        play_seeded_game(derive_seed(0, i), num_players)
+    return time.perf_counter() - start, games
+
+
+def benchmarks() -> list:
+    """ (metric name, function, arguments) of every benchmark of the suite. """
+    cases = []
+    for size in SIZES:
+        cases.append((f"sorted_list.add[{size}]", bench_sorted_list_add, (size,)))
+        cases.append((f"sorted_list.add_all[{size}]", bench_sorted_list_add_all, (size,)))
+        cases.append((f"sorted_list.contains[{size}]", bench_sorted_list_contains, (size,)))
+        cases.append((f"sorted_list.delete_at_index[{size}]", bench_sorted_list_delete, (size,)))
+        cases.append((f"stack.push_pop[{size}]", bench_stack, (size,)))
+        cases.append((f"queue.append_serve[{size}]", bench_queue, (size,)))
+    cases.append((f"aset.ops[{SET_SIZE}]", bench_set, (ASet, SET_SIZE)))
+    cases.append((f"bset.ops[{SET_SIZE}]", bench_set, (BSet, SET_SIZE)))
+    for size in SHUFFLE_SIZES:
+        for mode in (RandomGen.LEGACY, RandomGen.FISHER_YATES):
+            cases.append((f"random_shuffle.{mode}[{size}]", bench_shuffle, (size, mode)))
+    cases.append(("generate_cards", bench_generate_cards, (200,)))
+    for num_players in (2, 4, 8):
+        cases.append((f"game.headless[{num_players}p]", bench_games, (50, num_players)))
+    return cases
+
+
+def run(repeat: int = 3, only: str = None) -> dict:
+    """
+    Runs the suite and returns the results, as written to JSON
+
+    Args:
+        repeat (int): Runs of every benchmark, the best is kept
+        only (str): If given, only the metrics whose name contains it are run
+
+    Returns:
+        dict: {"python": version, "repeat": repeat, "metrics": {name: {"seconds_per_op": float, "ops": int}}}
+    """
+    Constants.NUM_CARDS_AT_INIT = 7
+    metrics = {}
+    for name, function, arguments in benchmarks():
+        if only is not None and only not in name:
+            continue
+        best = None
+        for _ in range(repeat):
+            elapsed, ops = function(*arguments)
+            best = elapsed if best is None else min(best, elapsed)
+        metrics[name] = {"seconds_per_op": best / ops, "ops": ops}
+    return {"python": platform.python_version(), "repeat": repeat, "metrics": metrics}
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[str]:
+    """
+    Compares two results of run
+
+    Args:
+        baseline (dict): The reference results
+        current (dict): The results to check
+        threshold (float): Largest accepted slowdown, e.g. 0.25 for 25% slower
+
+    Returns:
+        list[str]: Names of the metrics of both results that got slower by more than the threshold,
+            then of the metrics of the baseline missing from the current results
+    """
+    regressions = []
+    for name, metric in current["metrics"].items():
+        reference = baseline["metrics"].get(name)
+        if reference is None:
+            continue
+        if metric["seconds_per_op"] > reference["seconds_per_op"] * (1 + threshold):
+            regressions.append(name)
+    for name in baseline["metrics"]:
+        if name not in current["metrics"]:
+            regressions.append(name)
+    return regressions
+
+
+def report(baseline: dict, current: dict, regressions: list[str]) -> str:
+    lines = [f"{'metric':<40} {'baseline':>12} {'current':>12} {'change':>8}"]
+    for name, metric in current["metrics"].items():
+        reference = baseline["metrics"].get(name)
+        if reference is None:
+            lines.append(f"{name:<40} {'-':>12} {metric['seconds_per_op'] * 1e6:>10.3f}us {'new':>8}")
+            continue
+        change = metric["seconds_per_op"] / reference["seconds_per_op"] - 1
+        flag = "  REGRESSION" if name in regressions else ""
+        lines.append(f"{name:<40} {reference['seconds_per_op'] * 1e6:>10.3f}us "
+                     f"{metric['seconds_per_op'] * 1e6:>10.3f}us {change:>+8.1%}{flag}")
+    for name, reference in baseline["metrics"].items():
+        if name not in current["metrics"]:
+            lines.append(f"{name:<40} {reference['seconds_per_op'] * 1e6:>10.3f}us {'-':>12} {'':>8}  MISSING")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Benchmark suite with regression checks.")
+    commands = p.add_subparsers(dest="command", required=True)
+    run_command = commands.add_parser("run", help="run the suite and write the results as JSON")
+    run_command.add_argument("--output", default=None, help="JSON file to write, printed if not given")
+    compare_command = commands.add_parser("compare", help="check results against a baseline")
+    compare_command.add_argument("baseline")
+    compare_command.add_argument("current", nargs="?", default=None, help="results to check, the suite is run if not given")
+    compare_command.add_argument("--threshold", type=float, default=0.25)
+    for command in (run_command, compare_command):
+        command.add_argument("--repeat", type=int, default=3)
+        command.add_argument("--only", default=None, help="only run the metrics whose name contains this")
+    args = p.parse_args()
+
+    if args.command == "run":
+        results = run(args.repeat, args.only)
+        if args.output is None:
+            print(json.dumps(results, indent=2))
+        else:
+            with open(args.output, "w") as f:
+                json.dump(results, f, indent=2)
+            for name, metric in results["metrics"].items():
+                print(f"{name:<40} {metric['seconds_per_op'] * 1e6:>10.3f}us")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if args.only is not None:
+        # Only the selected metrics are expected
+        baseline["metrics"] = {name: metric for name, metric in baseline["metrics"].items() if args.only in name}
+    if args.current is None:
+        current = run(args.repeat, args.only)
+    else:
+        with open(args.current) as f:
+            current = json.load(f)
+    regressions = compare(baseline, current, args.threshold)
+    print(report(baseline, current, regressions))
+    if regressions:
+        print(f"\n{len(regressions)} metric(s) slower than the baseline by more than {args.threshold:.0%} or missing")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
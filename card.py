@@ -7,6 +7,8 @@ __student_ID__ = "34857613"
 
 from enum import auto, IntEnum
 
+from constants import Constants
+
 class CardColor(IntEnum):
     """
     Enum class for the color of the card
@@ -38,6 +40,17 @@ class CardLabel(IntEnum):
     DRAW_FOUR = auto()
 
 class Card:
+    """
+    A card of the deck. Cards are never modified once created, so the cards of a deck are shared
+    between games: use Card.of to get the interned card of a color and label.
+
+    Attributes:
+        color (CardColor): The color of the card
+        label (CardLabel): The label of the card
+        rank (int): Position of the card in the (color, label) order, color * NUM_MAX_VALS + label
+    """
+    __slots__ = ("color", "label", "rank")
+
     def __init__(self, color: CardColor, label: CardLabel) -> None:
         """
         Constructor for the Card class
@@ -55,6 +68,25 @@ class Card:
         """
         self.color = color
         self.label = label
+        self.rank = color * Constants.NUM_MAX_VALS + label
+
+    @classmethod
+    def of(cls, color: CardColor, label: CardLabel) -> 'Card':
+        """
+        Method to get the interned card of a color and label
+
+        Args:
+            color (CardColor): The color of the card
+            label (CardLabel): The label of the card
+
+        Returns:
+            Card: The one shared Card object with this color and label
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return _INTERNED[color * Constants.NUM_MAX_VALS + label]
 
     def __str__(self) -> str:
         """
@@ -83,9 +115,7 @@ class Card:
             Best Case Complexity: O(1)
             Worst Case Complexity: O(1)
         """
-        if self.color != other.color:
-            return self.color.value < other.color.value
-        return self.label.value < other.label.value
+        return self.rank < other.rank
 
     def __le__(self, other: 'Card') -> bool:
         """
@@ -101,7 +131,7 @@ class Card:
             Best Case Complexity: O(1)
             Worst Case Complexity: O(1)
         """
-        return self < other or self == other
+        return self.rank <= other.rank
 
     def __eq__(self, other: 'Card') -> bool:
         """
@@ -117,7 +147,20 @@ class Card:
             Best Case Complexity: O(1)
             Worst Case Complexity: O(1)
         """
-        return self.color == other.color and self.label == other.label
+        return self.rank == other.rank
+
+    def __hash__(self) -> int:
+        """
+        Hash of the card, consistent with equality
+
+        Returns:
+            int: The rank of the card
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return self.rank
 
     def __ne__(self, other: 'Card') -> bool:
         """
@@ -133,7 +176,7 @@ class Card:
             Best Case Complexity: O(1)
             Worst Case Complexity: O(1)
         """
-        return not self == other
+        return self.rank != other.rank
 
     def __gt__(self, other: 'Card') -> bool:
         """
@@ -149,7 +192,7 @@ class Card:
             Best Case Complexity: O(1)
             Worst Case Complexity: O(1)
         """
-        return not self <= other
+        return self.rank > other.rank
 
     def __ge__(self, other: 'Card') -> bool:
         """
@@ -165,4 +208,64 @@ class Card:
             Best Case Complexity: O(1)
             Worst Case Complexity: O(1)
         """
-        return not self < other
+        return self.rank >= other.rank
+
+
+# Enum members by value, indexing these is much cheaper than calling the enum classes
+_COLORS = tuple(CardColor)
+_LABELS = tuple(CardLabel)
+
+# One shared card per (color, label) pair, indexed by card id
+_INTERNED = tuple(Card(color, label) for color in _COLORS for label in _LABELS)
+
+
+def card_id(card: Card) -> int:
+    """
+    Method to get the compact id of a card, its position in the (color, label) order
+
+    Args:
+        card (Card): The card
+
+    Returns:
+        int: color * NUM_MAX_VALS + label, fits in a byte
+
+    Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1)
+    """
+    return card.rank
+
+
+def card_from_id(card_id: int) -> Card:
+    """
+    Method to get the card with the given compact id
+
+    Args:
+        card_id (int): The id, as returned by card_id
+
+    Returns:
+        Card: The interned card with the matching color and label
+
+    Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1)
+    """
+    return _INTERNED[card_id]
+
+
+def cards_from_ids(card_ids) -> list[Card]:
+    """
+    Method to get the cards with the given compact ids, e.g. the card bytes of a snapshot
+
+    Args:
+        card_ids: The ids, as returned by card_id, for instance a bytes object
+
+    Returns:
+        list[Card]: The interned cards, in the same order
+
+    Complexity:
+        Best Case Complexity: O(n) where n is the number of ids
+        Worst Case Complexity: O(n) where n is the number of ids
+    """
+    interned = _INTERNED
+    return [interned[card_id] for card_id in card_ids]
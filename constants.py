@@ -4,6 +4,7 @@ class Constants:
     """
     DECK_SIZE = 112
     NUM_MAX_VALS = 15
+    NUM_COLORS = 5
     NUM_CARDS_AT_INIT = 7
     MAX_PLAYERS = 8
     MAX_ROUNDS_PER_PLAYER = 100
@@ -1,5 +1,6 @@
 """ Array-based implementation of SortedList ADT. """
 
+from data_structures.array_view import ArrayView
 from data_structures.referential_array import ArrayR
 from data_structures.sorted_list_adt import *
 
@@ -8,10 +9,17 @@ __docformat__ = 'reStructuredText'
 
 
 class ArraySortedList(SortedList[T]):
-    """ SortedList ADT implemented with arrays. """
+    """ SortedList ADT implemented with arrays.
+
+    The array starts with the given capacity and doubles when full. If shrink is set, it
+    halves when a deletion leaves it at most a quarter full, never below the initial
+    capacity. Growing at full and shrinking at a quarter leaves the list half full after
+    either, so a list going back and forth around a size does not resize every time.
+    """
     MIN_CAPACITY = 1
+    SHRINK_OCCUPANCY = 4
 
-    def __init__(self, max_capacity: int) -> None:
+    def __init__(self, max_capacity: int, shrink: bool = False) -> None:
         """ ArraySortedList object initialiser. """
 
         # first, calling the basic initialiser
@@ -20,10 +28,14 @@ class ArraySortedList(SortedList[T]):
         # initialising the internal array
         size = max(self.MIN_CAPACITY, max_capacity)
         self.array = ArrayR(size)
+        self.initial_capacity = size
+        self.shrink = shrink
 
     def reset(self) -> None:
-        """ Reset the list. """
+        """ Reset the list. With shrink set, the array goes back to the initial capacity. """
         SortedList.__init__(self)
+        if self.shrink and len(self.array) > self.initial_capacity:
+            self.array = ArrayR(self.initial_capacity)
 
     def __getitem__(self, index: int) -> T:
         """ Magic method. Return the element at a given position. """
@@ -48,30 +60,80 @@ class ArraySortedList(SortedList[T]):
             raise IndexError('Element should be inserted in sorted order')
 
     def __contains__(self, item: T) -> bool:
-        """ Checks if value is in the list. """
-        for i in range(len(self)):
-            if self.array[i] == item:
-                return True
-        return False
+        """ Checks if value is in the list.
+            :complexity: O(log n) comparisons
+        """
+        position = self.bisect_left(item)
+        return position < len(self) and self.array[position] == item
+
+    def bisect_left(self, item: T) -> int:
+        """ Position of the first element not smaller than item, i.e. of the leftmost
+            element equal to item if there is one.
+            :complexity: O(log n) comparisons
+        """
+        low = 0
+        high = len(self)
+        array = self.array
+        while low < high:
+            mid = (low + high) // 2
+            if array[mid] < item:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def bisect_right(self, item: T) -> int:
+        """ Position after the last element not larger than item, i.e. after the rightmost
+            element equal to item if there is one.
+            :complexity: O(log n) comparisons
+        """
+        low = 0
+        high = len(self)
+        array = self.array
+        while low < high:
+            mid = (low + high) // 2
+            if item < array[mid]:
+                high = mid
+            else:
+                low = mid + 1
+        return low
+
+    def count(self, item: T) -> int:
+        """ Number of elements equal to item.
+            :complexity: O(log n) comparisons
+        """
+        return self.bisect_right(item) - self.bisect_left(item)
+
+    def view(self) -> ArrayView[T]:
+        """ View of every element of the list, in order, without copying them.
+            The view is only valid until the list is next changed.
+        """
+        return ArrayView(self.array, 0, len(self))
+
+    def range(self, lo: T, hi: T) -> ArrayView[T]:
+        """ View of the elements x with lo <= x < hi, in order, without copying them.
+            The view is only valid until the list is next changed.
+            :complexity: O(log n) comparisons, then O(1) per element read
+        """
+        start = self.bisect_left(lo)
+        stop = max(start, self.bisect_left(hi))
+        return ArrayView(self.array, start, stop - start)
 
     def _shuffle_right(self, index: int) -> None:
-        """ Shuffle items to the right up to a given position. """
-        for i in range(len(self), index, -1):
-            self.array[i] = self.array[i - 1]
+        """ Shuffle items to the right up to a given position, as one block move. """
+        self.array.move(index, index + 1, len(self) - index)
 
     def _shuffle_left(self, index: int) -> None:
-        """ Shuffle items starting at a given position to the left. """
-        for i in range(index, len(self)):
-            self.array[i] = self.array[i + 1]
+        """ Shuffle items starting at a given position to the left, as one block move. """
+        self.array.move(index + 1, index, len(self) - index)
 
-    def _resize(self) -> None:
-        """ Resize the list. """
+    def _resize(self, min_capacity: int = 0) -> None:
+        """ Resize the list, to at least min_capacity. """
         # doubling the size of our list
-        new_array = ArrayR(2 * len(self.array))
+        new_array = ArrayR(max(2 * len(self.array), min_capacity))
 
         # copying the contents
-        for i in range(self.length):
-            new_array[i] = self.array[i]
+        new_array.copy_from(self.array, 0, 0, self.length)
 
         # referring to the new array
         self.array = new_array
@@ -83,11 +145,21 @@ class ArraySortedList(SortedList[T]):
         item = self.array[index]
         self.length -= 1
         self._shuffle_left(index)
+        if self.shrink:
+            self._shrink_if_sparse()
         return item
 
+    def _shrink_if_sparse(self) -> None:
+        """ Halve the array if it is at most a quarter full, down to the initial capacity. """
+        capacity = len(self.array)
+        if capacity > self.initial_capacity and len(self) * self.SHRINK_OCCUPANCY <= capacity:
+            new_array = ArrayR(max(capacity // 2, self.initial_capacity))
+            new_array.copy_from(self.array, 0, 0, self.length)
+            self.array = new_array
+
     def index(self, item: T) -> int:
-        """ Find the position of a given item in the list. """
-        pos = self._index_to_add(item)
+        """ Find the position of a given item in the list, the leftmost one if there are several. """
+        pos = self.bisect_left(item)
         if pos < len(self) and self[pos] == item:
             return pos
         raise ValueError('item not in list')
@@ -101,24 +173,83 @@ class ArraySortedList(SortedList[T]):
         if self.is_full():
             self._resize()
 
-        # find where to place it
-        position = self._index_to_add(item)
+        # find where to place it, after any equal element so that fewer elements move
+        position = self.bisect_right(item)
 
         self[position] = item
         self.length += 1
 
-    def _index_to_add(self, item: T) -> int:
-        """ Find the position where the new item should be placed. """
-        low = 0
-        high = len(self) - 1
-
-        while low <= high:
-            mid = (low + high) // 2
-            if self.array[mid] < item:
-                low = mid + 1
-            elif self.array[mid] > item:
-                high = mid - 1
+    def extend_sorted(self, items) -> None:
+        """ Append the elements of items, a sequence already in order, without comparing them,
+            e.g. to load back a list saved in order.
+            :pre: items is sorted and its first element is not smaller than the last element of the list
+            :complexity: O(m) where m is the number of items, resizing the array at most once
+        """
+        total = len(self) + len(items)
+        if total > len(self.array):
+            self._resize(total)
+        self.array.assign(len(self), items)
+        self.length = total
+
+    def add_all(self, items) -> None:
+        """ Add every element of items, any iterable, to the list at once.
+            The items are copied into an array sorted with _merge_sort, then merged into the list
+            from the back, so every element of the list moves at most once and the array is
+            resized at most once.
+            :complexity: O(m log m + n) where m is the number of items and n the length of the list
+        """
+        if not hasattr(items, '__len__'):
+            # an iterator can only be gone through once, and its length is only known after
+            items = list(items)
+        if len(items) == 0:
+            return
+        batch = ArrayR(len(items))
+        for i, item in enumerate(items):
+            batch[i] = item
+        batch = _merge_sort(batch)
+        length = len(self)
+        total = length + len(batch)
+        if total > len(self.array):
+            self._resize(total)
+
+        # merge from the largest elements down, into the free space at the end of the array
+        array = self.array
+        i = length - 1
+        j = len(batch) - 1
+        for k in range(total - 1, -1, -1):
+            if j < 0:
+                break
+            if i >= 0 and array[i] > batch[j]:
+                array[k] = array[i]
+                i -= 1
             else:
-                return mid
-
-        return low
+                array[k] = batch[j]
+                j -= 1
+        self.length = total
+
+
+def _merge_sort(source: ArrayR[T]) -> ArrayR[T]:
+    """ Returns the elements of source sorted by a stable bottom-up merge sort, either in source
+        itself or in a new array. Runs of width 1, 2, 4, ... are merged from one array into the
+        other in turn.
+        :complexity: O(m log m) where m is the length of source
+    """
+    length = len(source)
+    target = ArrayR(length)
+    width = 1
+    while width < length:
+        for lo in range(0, length, 2 * width):
+            mid = min(lo + width, length)
+            hi = min(lo + 2 * width, length)
+            i, j = lo, mid
+            for k in range(lo, hi):
+                # taking from the left run on ties keeps equal elements in their order
+                if j < hi and (i >= mid or source[j] < source[i]):
+                    target[k] = source[j]
+                    j += 1
+                else:
+                    target[k] = source[i]
+                    i += 1
+        source, target = target, source
+        width *= 2
+    return source
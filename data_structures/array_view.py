@@ -0,0 +1,77 @@
+""" Read-only view of a range of an array.
+
+Gives access to length elements of an array, starting at offset and
+step positions apart, without copying them. The view reads the array it
+was made from, so it shows later changes to those positions and is only
+meaningful until the structure owning the array changes its layout
+(e.g. an insertion into a sorted list or a resize).
+"""
+__author__ = "Ter Jing Hao"
+__docformat__ = 'reStructuredText'
+
+from typing import Generic, TypeVar, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Only for the annotations: referential_array imports T from this module
+    from data_structures.referential_array import ArrayR
+
+T = TypeVar('T')
+
+
+class ArrayView(Generic[T]):
+    """ Window of an ArrayR.
+
+    Attributes:
+         array (ArrayR[T]): the array viewed
+         offset (int): position in the array of the first element of the view
+         length (int): number of elements in the view
+         step (int): distance in the array between two elements of the view, negative to go backwards
+
+    All methods are O(1) best/worst case unless stated otherwise.
+    """
+
+    def __init__(self, array: 'ArrayR[T]', offset: int, length: int, step: int = 1) -> None:
+        """ Creates a view of the elements array[offset + i * step] for i from 0 to length - 1.
+        :raises ValueError: if step is 0
+        :raises IndexError: if an element of the view is not within the array
+        """
+        if step == 0:
+            raise ValueError('View step cannot be zero')
+        if length < 0 or length > 0 and not (0 <= offset < len(array) and 0 <= offset + (length - 1) * step < len(array)):
+            raise IndexError('View out of the bounds of the array')
+        self.array = array
+        self.offset = offset
+        self.length = length
+        self.step = step
+
+    def __len__(self) -> int:
+        """ Returns the number of elements in the view. """
+        return self.length
+
+    def __getitem__(self, index):
+        """ Returns the element at the given position of the view, negative positions count from the end.
+        A slice gives a view of the view, still without copying.
+        :raises IndexError: if the position is not within the view
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.length)
+            return ArrayView(self.array, self.offset + start * self.step, len(range(start, stop, step)), self.step * step)
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError('Index out of the bounds of the view')
+        return self.array[self.offset + index * self.step]
+
+    def __iter__(self):
+        """ Iterates over the elements of the view in order, without copying them.
+        :complexity: O(1) per element
+        """
+        array = self.array
+        for i in range(self.offset, self.offset + self.length * self.step, self.step):
+            yield array[i]
+
+    def __str__(self) -> str:
+        """ Returns the elements of the view like a list.
+        :complexity: O(n) where n is the length of the view
+        """
+        return "[" + ", ".join(str(item) for item in self) + "]"
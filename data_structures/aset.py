@@ -80,8 +80,7 @@ class ASet(Set[T]):
         """
         res = ASet(len(self.array) + len(other.array))
 
-        for i in range(len(self)):
-            res.array[i] = self.array[i]
+        res.array.copy_from(self.array, 0, 0, self.size)
         res.size = self.size
 
         for j in range(len(other)):
@@ -61,23 +61,28 @@ class CircularQueue(Queue[T]):
          array (ArrayR[T]): array storing the elements of the queue
 
     ArrayR cannot create empty arrays. So MIN_CAPACITY used to avoid this.
+    The array doubles when an append finds it full. If shrink is set, it halves when a
+    serve leaves it at most a quarter full, never below the initial capacity, so that it
+    is half full after either resize.
     """
     MIN_CAPACITY = 1
+    SHRINK_OCCUPANCY = 4
 
-    def __init__(self, max_capacity: int) -> None:
+    def __init__(self, max_capacity: int, shrink: bool = False) -> None:
         Queue.__init__(self)
         self.front = 0
         self.rear = 0
         self.array = ArrayR(max(self.MIN_CAPACITY,max_capacity))
+        self.initial_capacity = len(self.array)
+        self.shrink = shrink
 
 
     def append(self, item: T) -> None:
         """ Adds an element to the rear of the queue.
-        :pre: queue is not full
-        :raises Exception: if the queue is full
+        :complexity: O(1) amortised, O(N) when the array has to grow
         """
         if self.is_full():
-            raise Exception("Queue is full")
+            self._resize(2 * len(self.array))
 
         self.array[self.rear] = item
         self.length += 1
@@ -87,6 +92,7 @@ class CircularQueue(Queue[T]):
         """ Deletes and returns the element at the queue's front.
         :pre: queue is not empty
         :raises Exception: if the queue is empty
+        :complexity: O(1) amortised, O(N) when the array shrinks
         """
         if self.is_empty():
             raise Exception("Queue is empty")
@@ -94,8 +100,24 @@ class CircularQueue(Queue[T]):
         self.length -= 1
         item = self.array[self.front]
         self.front = (self.front+1) % len(self.array)
+        if self.shrink and len(self.array) > self.initial_capacity and \
+                self.length * self.SHRINK_OCCUPANCY <= len(self.array):
+            self._resize(max(len(self.array) // 2, self.initial_capacity))
         return item
 
+    def _resize(self, capacity: int) -> None:
+        """ Moves the elements, from the front, to the start of a new array of the given capacity.
+        :complexity: O(capacity)
+        """
+        new_array = ArrayR(capacity)
+        # The elements may wrap around the end of the array: copy up to the end, then from the start
+        first = min(self.length, len(self.array) - self.front)
+        new_array.copy_from(self.array, self.front, 0, first)
+        new_array.copy_from(self.array, 0, first, self.length - first)
+        self.array = new_array
+        self.front = 0
+        self.rear = self.length % capacity
+
     def peek(self) -> T:
         """ Returns the element at the queue's front.
         :pre: queue is not empty
@@ -107,7 +129,7 @@ class CircularQueue(Queue[T]):
         return self.array[self.front]
 
     def is_full(self) -> bool:
-        """ True if the queue is full and no element can be appended. """
+        """ True if the array is full, the next append grows it. """
         return len(self) == len(self.array)
 
     def clear(self) -> None:
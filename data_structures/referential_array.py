@@ -17,9 +17,9 @@ __author__ = "Julian Garcia for the __init__ code, Maria Garcia de la Banda for
 __docformat__ = 'reStructuredText'
 
 from ctypes import py_object
-from typing import TypeVar, Generic
+from typing import Generic
 
-T = TypeVar('T')
+from data_structures.array_view import ArrayView, T
 
 
 class ArrayR(Generic[T]):
@@ -31,7 +31,7 @@ class ArrayR(Generic[T]):
         if length <= 0:
             raise ValueError("Array length should be larger than 0.")
         self.array = (length * py_object)() # initialises the space
-        self.array[:] =  [None for _ in range(length)]
+        self.array[:] = [None] * length
 
     def __len__(self) -> int:
         """ Returns the length of the array
@@ -53,6 +53,83 @@ class ArrayR(Generic[T]):
         """
         self.array[index] = value
     
+    def view(self, start: int = None, stop: int = None, step: int = 1) -> ArrayView[T]:
+        """ Returns a view of the positions range(start, stop, step), without copying them.
+        The arguments are read like those of a slice: start and stop default to the two ends
+        (swapped for a negative step) and negative positions count from the end.
+        :complexity: O(1)
+        """
+        start, stop, step = slice(start, stop, step).indices(len(self.array))
+        return ArrayView(self, start, len(range(start, stop, step)), step)
+
+    def move(self, src: int, dst: int, count: int) -> None:
+        """ Moves count elements starting at position src to start at position dst.
+        The two ranges may overlap, e.g. to shift elements by one position.
+        :complexity: O(count), done natively by one slice assignment of the underlying
+            ctypes array, which also keeps the reference counts right
+        :raises IndexError: if either range is not within the array
+        """
+        if count <= 0:
+            return
+        self._check_range(src, count)
+        self._check_range(dst, count)
+        self.array[dst:dst + count] = self.array[src:src + count]
+
+    def copy_from(self, other: 'ArrayR[T]', src: int = 0, dst: int = 0, count: int = None) -> None:
+        """ Copies count elements of other, starting at position src, into this array from position dst.
+        count defaults to the rest of other from src.
+        :complexity: O(count), done natively like move
+        :raises IndexError: if either range is not within its array
+        """
+        if count is None:
+            count = len(other) - src
+        if count <= 0:
+            return
+        other._check_range(src, count)
+        self._check_range(dst, count)
+        self.array[dst:dst + count] = other.array[src:src + count]
+
+    def fill(self, value: T, start: int = 0, stop: int = None) -> None:
+        """ Sets every position from start up to stop (excluded, defaults to the length) to value.
+        :complexity: O(stop - start), done natively like move
+        :raises IndexError: if the range is not within the array
+        """
+        if stop is None:
+            stop = len(self.array)
+        if stop <= start:
+            return
+        self._check_range(start, stop - start)
+        self.array[start:stop] = [value] * (stop - start)
+
+    def assign(self, start: int, items) -> None:
+        """ Sets the positions from start on to the elements of items, a sequence, in order.
+        :complexity: O(len(items)), done natively like move
+        :raises IndexError: if the range is not within the array
+        """
+        count = len(items)
+        if count == 0:
+            return
+        self._check_range(start, count)
+        self.array[start:start + count] = items
+
+    def reverse(self, start: int = 0, stop: int = None) -> None:
+        """ Reverses the order of the elements from start up to stop (excluded, defaults to the length).
+        :complexity: O(stop - start), done natively like move
+        :raises IndexError: if the range is not within the array
+        """
+        if stop is None:
+            stop = len(self.array)
+        if stop - start <= 1:
+            return
+        self._check_range(start, stop - start)
+        items = self.array[start:stop]
+        items.reverse()
+        self.array[start:stop] = items
+
+    def _check_range(self, start: int, count: int) -> None:
+        if start < 0 or start + count > len(self.array):
+            raise IndexError("Range out of the bounds of the array.")
+
     def index(self, item: T) -> int:
         for index, arr_item in enumerate(self.array):
             if arr_item == item:
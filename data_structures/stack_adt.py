@@ -9,6 +9,7 @@ __docformat__ = 'reStructuredText'
 import unittest
 from abc import ABC, abstractmethod
 from typing import TypeVar, Generic
+from data_structures.array_view import ArrayView
 from data_structures.referential_array import ArrayR, T
 
 
@@ -55,41 +56,70 @@ class ArrayStack(Stack[T]):
     Attributes:
          length (int): number of elements in the stack (inherited)
          array (ArrayR[T]): array storing the elements of the queue
+         initial_capacity (int): capacity of the array when created, it never shrinks below
+         shrink (bool): whether the array shrinks when it gets sparse
 
     ArrayR cannot create empty arrays. So MIN_CAPACITY used to avoid this.
+    The array doubles when a push finds it full. If shrink is set, it halves when a pop
+    leaves it at most a quarter full, so that it is half full after either resize.
     """
     MIN_CAPACITY = 1
+    SHRINK_OCCUPANCY = 4
 
-    def __init__(self, max_capacity: int) -> None:
+    def __init__(self, max_capacity: int, shrink: bool = False) -> None:
         """ Initialises the length and the array with the given capacity.
             If max_capacity is 0, the array is created with MIN_CAPACITY.
         """
         Stack.__init__(self)
         self.array = ArrayR(max(self.MIN_CAPACITY, max_capacity))
+        self.initial_capacity = len(self.array)
+        self.shrink = shrink
 
     def is_full(self) -> bool:
-        """ True if the stack is full and no element can be pushed. """
+        """ True if the array is full, the next push grows it. """
         return len(self) == len(self.array)
 
     def push(self, item: T) -> None:
         """ Pushes an element to the top of the stack.
-        :pre: stack is not full
-        :raises Exception: if the stack is full
+        :complexity: O(1) amortised, O(N) when the array has to grow
         """
         if self.is_full():
-            raise Exception("Stack is full")
+            self._resize(2 * len(self.array))
         self.array[len(self)] = item
         self.length += 1
 
+    def push_all(self, items) -> None:
+        """ Pushes the elements of items, a sequence, in order, so the last one ends on top.
+        :complexity: O(m) where m is the number of items, growing the array at most once
+        """
+        total = self.length + len(items)
+        if total > len(self.array):
+            self._resize(max(2 * len(self.array), total))
+        self.array.assign(self.length, items)
+        self.length = total
+
     def pop(self) -> T:
         """ Pops the element at the top of the stack.
         :pre: stack is not empty
         :raises Exception: if the stack is empty
+        :complexity: O(1) amortised, O(N) when the array shrinks
         """
         if self.is_empty():
             raise Exception("Stack is empty")
         self.length -= 1
-        return self.array[self.length]
+        item = self.array[self.length]
+        if self.shrink and len(self.array) > self.initial_capacity and \
+                self.length * self.SHRINK_OCCUPANCY <= len(self.array):
+            self._resize(max(len(self.array) // 2, self.initial_capacity))
+        return item
+
+    def _resize(self, capacity: int) -> None:
+        """ Moves the elements to a new array of the given capacity.
+        :complexity: O(capacity)
+        """
+        new_array = ArrayR(capacity)
+        new_array.copy_from(self.array, 0, 0, self.length)
+        self.array = new_array
 
     def peek(self) -> T:
         """ Returns the element at the top, without popping it from stack.
@@ -100,6 +130,31 @@ class ArrayStack(Stack[T]):
             raise Exception("Stack is empty")
         return self.array[self.length-1]
 
+    def view(self) -> ArrayView[T]:
+        """ Returns a view of the elements from the bottom to the top of the stack, without copying them.
+        The view is only valid until the stack is next changed.
+        :complexity: O(1)
+        """
+        return ArrayView(self.array, 0, self.length)
+
+    def swap(self, other: 'ArrayStack[T]') -> None:
+        """ Exchanges the contents of this stack with those of another one
+            by swapping their arrays, without moving any element. The initial capacity
+            and shrink setting go with the array, so each stack keeps the policy its
+            array was sized under.
+        :complexity: O(1)
+        """
+        self.array, other.array = other.array, self.array
+        self.length, other.length = other.length, self.length
+        self.initial_capacity, other.initial_capacity = other.initial_capacity, self.initial_capacity
+        self.shrink, other.shrink = other.shrink, self.shrink
+
+    def reverse(self) -> None:
+        """ Reverses the order of the elements in place, the top becomes the bottom.
+        :complexity: O(N) where N is the number of elements
+        """
+        self.array.reverse(0, self.length)
+
 
 class TestStack(unittest.TestCase):
     """ Tests for the above class."""
@@ -185,6 +240,18 @@ class TestStack(unittest.TestCase):
             self.assertEqual(len(stack), 0)
             self.assertTrue(stack.is_empty())
 
+    def test_swap(self) -> None:
+        self.empty_stack.swap(self.large_stack)
+        self.assertEqual(len(self.empty_stack), self.LARGE)
+        self.assertTrue(self.large_stack.is_empty())
+        self.assertEqual(self.empty_stack.peek(), self.LARGE - 1)
+
+    def test_reverse(self) -> None:
+        for stack, length in zip(self.stacks, self.lengths):
+            stack.reverse()
+            for i in range(length):
+                self.assertEqual(stack.pop(), i)
+
 
 if __name__ == '__main__':
     testtorun = TestStack()
@@ -0,0 +1,108 @@
+""" Turn order of a table of players.
+
+Keeps the seats in an array together with the index of the current seat
+and the direction of play, so that moving around the table never needs
+to search for the current seat.
+"""
+__author__ = "Ter Jing Hao"
+__docformat__ = 'reStructuredText'
+
+from typing import Generic
+from data_structures.referential_array import ArrayR, T
+
+
+class TurnOrder(Generic[T]):
+    """ Ring of seats with a cursor on the current seat.
+
+    Attributes:
+         length (int): number of seats taken
+         index (int): seat of the current item
+         direction (int): 1 when play moves to increasing seats, -1 otherwise
+         array (ArrayR[T]): array storing the items in seat order
+
+    ArrayR cannot create empty arrays. So MIN_CAPACITY used to avoid this.
+    All methods are O(1) best/worst case unless stated otherwise.
+    """
+    MIN_CAPACITY = 1
+
+    def __init__(self, max_capacity: int) -> None:
+        """ Initialises an empty ring. The capacity grows if more seats are added. """
+        self.array = ArrayR(max(self.MIN_CAPACITY, max_capacity))
+        self.length = 0
+        self.index = 0
+        self.direction = 1
+
+    def __len__(self) -> int:
+        """ Returns the number of seats. """
+        return self.length
+
+    def __getitem__(self, seat: int) -> T:
+        """ Returns the item at the given seat.
+        :pre: 0 <= seat < len(self)
+        """
+        return self.array[seat]
+
+    def append(self, item: T) -> None:
+        """ Seats an item after the last seat.
+        :complexity: O(1) amortised, O(N) when the array has to grow
+        """
+        if self.length == len(self.array):
+            new_array = ArrayR(2 * len(self.array))
+            new_array.copy_from(self.array, 0, 0, self.length)
+            self.array = new_array
+        self.array[self.length] = item
+        self.length += 1
+
+    def clear(self) -> None:
+        """ Removes every seat and resets the cursor and direction. """
+        self.length = 0
+        self.index = 0
+        self.direction = 1
+
+    def current(self) -> T:
+        """ Returns the item at the current seat.
+        :raises IndexError: if there are no seats
+        """
+        if self.length == 0:
+            raise IndexError("No seats at the table")
+        return self.array[self.index]
+
+    def seat_after(self, k: int = 1) -> int:
+        """ Returns the seat k turns after the current one in the direction of play. """
+        return (self.index + k * self.direction) % self.length
+
+    def peek(self, k: int = 1) -> T:
+        """ Returns the item k turns after the current one, without moving. """
+        return self.array[self.seat_after(k)]
+
+    def advance(self, k: int = 1) -> T:
+        """ Moves the cursor k turns in the direction of play and returns the new current item. """
+        self.index = self.seat_after(k)
+        return self.array[self.index]
+
+    def skip(self) -> T:
+        """ Skips the next seat, i.e. moves two turns ahead. """
+        return self.advance(2)
+
+    def reverse(self) -> None:
+        """ Reverses the direction of play. """
+        self.direction = -self.direction
+
+    def move_to(self, seat: int) -> T:
+        """ Moves the cursor to the given seat and returns its item.
+        :raises IndexError: if the seat does not exist
+        """
+        if not 0 <= seat < self.length:
+            raise IndexError(f"No seat {seat} at the table")
+        self.index = seat
+        return self.array[seat]
+
+    def seat_of(self, item: T) -> int:
+        """ Returns the seat of the given item.
+        :complexity: O(N) worst case, where N is the number of seats
+        :raises ValueError: if the item is not seated
+        """
+        for seat in range(self.length):
+            if self.array[seat] is item:
+                return seat
+        raise ValueError("Item is not seated")
@@ -0,0 +1,247 @@
+"""
+Fit 1008 Assignment 1
+"""
+__FILE__ = "events.py"
+__author__ = "<Ter Jing Hao>"
+__student_ID__ = "34857613"
+
+import sys
+
+from card import Card, CardColor, CardLabel
+from player import Player
+
+
+class EventSink:
+    """
+    Base class for the receivers of the events raised by a Game.
+
+    Every hook receives the raw game objects and does nothing with them, so this
+    class doubles as the no-op sink. Subclasses override the hooks they care about.
+    None of the hooks are expected to return anything.
+    """
+    def game_dealt(self, game) -> None:
+        """ The game was initialised: hands are dealt and the piles are set up. """
+        pass
+
+    def game_started(self, player: Player, color: CardColor, label: CardLabel) -> None:
+        """ The game starts with the given player and starting card. """
+        pass
+
+    def round_started(self, round_count: int, player: Player, color: CardColor, label: CardLabel) -> None:
+        """ A new round starts for the given player. """
+        pass
+
+    def card_played(self, player: Player, card: Card) -> None:
+        """ The player played a card from their hand. """
+        pass
+
+    def cannot_play(self, player: Player) -> None:
+        """ The player has no playable card and must draw. """
+        pass
+
+    def turn_draw(self, player: Player, card: Card, playable: bool) -> None:
+        """ The player drew a card on their turn, which may or may not be playable. """
+        pass
+
+    def card_drawn(self, player: Player, card: Card) -> None:
+        """ A card was taken from the draw pile for the player (turn draws and penalties alike). """
+        pass
+
+    def reshuffled(self, num_cards: int) -> None:
+        """ The discard pile was shuffled back into the draw pile. """
+        pass
+
+    def top_card_changed(self, color: CardColor, label: CardLabel) -> None:
+        """ A card was put on top of the discard pile. """
+        pass
+
+    def direction_reversed(self) -> None:
+        """ The direction of play was reversed. """
+        pass
+
+    def player_skipped(self, player: Player) -> None:
+        """ The player loses their turn. """
+        pass
+
+    def color_chosen(self, color: CardColor) -> None:
+        """ A new color was chosen after a crazy card. """
+        pass
+
+    def penalty(self, player: Player, num_cards: int) -> None:
+        """ The player must draw the given number of cards and skip a turn. """
+        pass
+
+    def out_of_cards(self, player: Player) -> None:
+        """ The player has no cards left. """
+        pass
+
+    def final_penalty(self, player: Player, num_cards: int) -> None:
+        """ The player must draw the given number of cards before the game ends. """
+        pass
+
+    def game_won(self, player: Player, next_player: Player) -> None:
+        """ The player won the game. """
+        pass
+
+    def turn_passed(self, player: Player) -> None:
+        """ The turn moves to the given player. """
+        pass
+
+    def game_drawn(self, result, round_count: int) -> None:
+        """ The game ended without a winner, for the given GameResult. """
+        pass
+
+
+class NullSink(EventSink):
+    """
+    Sink that ignores every event. Used to run headless games.
+    """
+    pass
+
+
+class CollectingSink(EventSink):
+    """
+    Sink that keeps every event in memory as a (name, args) tuple, in the order they happened.
+    """
+    def __init__(self) -> None:
+        """
+        Constructor for the CollectingSink class
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.events = []
+
+    def clear(self) -> None:
+        """ Forget every collected event. """
+        self.events = []
+
+    def game_dealt(self, game):
+        self.events.append(("game_dealt", (game,)))
+
+    def game_started(self, player, color, label):
+        self.events.append(("game_started", (player, color, label)))
+
+    def round_started(self, round_count, player, color, label):
+        self.events.append(("round_started", (round_count, player, color, label)))
+
+    def card_played(self, player, card):
+        self.events.append(("card_played", (player, card)))
+
+    def cannot_play(self, player):
+        self.events.append(("cannot_play", (player,)))
+
+    def turn_draw(self, player, card, playable):
+        self.events.append(("turn_draw", (player, card, playable)))
+
+    def card_drawn(self, player, card):
+        self.events.append(("card_drawn", (player, card)))
+
+    def reshuffled(self, num_cards):
+        self.events.append(("reshuffled", (num_cards,)))
+
+    def top_card_changed(self, color, label):
+        self.events.append(("top_card_changed", (color, label)))
+
+    def direction_reversed(self):
+        self.events.append(("direction_reversed", ()))
+
+    def player_skipped(self, player):
+        self.events.append(("player_skipped", (player,)))
+
+    def color_chosen(self, color):
+        self.events.append(("color_chosen", (color,)))
+
+    def penalty(self, player, num_cards):
+        self.events.append(("penalty", (player, num_cards)))
+
+    def out_of_cards(self, player):
+        self.events.append(("out_of_cards", (player,)))
+
+    def final_penalty(self, player, num_cards):
+        self.events.append(("final_penalty", (player, num_cards)))
+
+    def game_won(self, player, next_player):
+        self.events.append(("game_won", (player, next_player)))
+
+    def turn_passed(self, player):
+        self.events.append(("turn_passed", (player,)))
+
+    def game_drawn(self, result, round_count):
+        self.events.append(("game_drawn", (result, round_count)))
+
+
+class PrintSink(EventSink):
+    """
+    Sink that prints the progress of the game as text. This is the default sink of a Game.
+    """
+    def __init__(self, stream=None) -> None:
+        """
+        Constructor for the PrintSink class
+
+        Args:
+            stream: File-like object to print to. If None, whatever sys.stdout is at the time of printing is used
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.stream = stream
+
+    def _print(self, text) -> None:
+        print(text, file=self.stream if self.stream is not None else sys.stdout)
+
+    def game_started(self, player, color, label):
+        self._print(f"Game starts with {player.name}")
+        self._print(f"Starting card: {color} {label}")
+
+    def round_started(self, round_count, player, color, label):
+        self._print(f"\nRound: {round_count}")
+        self._print(f"Current player: {player.name}")
+        self._print(f"Current card: {color} {label}")
+        self._print(f"{player.name}'s hand: {player.hand_text()}")
+
+    def card_played(self, player, card):
+        self._print(f"{player.name} plays {card}")
+
+    def cannot_play(self, player):
+        self._print(f"{player.name} cannot play, drawing a card")
+
+    def turn_draw(self, player, card, playable):
+        self._print(f"Draw card: {card}")
+        if playable:
+            self._print(f"{player.name} draws and can play: {card}")
+        else:
+            self._print(f"{player.name} draws a card and cannot play it")
+
+    def top_card_changed(self, color, label):
+        self._print(f"New top card: {color} {label}")
+
+    def direction_reversed(self):
+        self._print("Direction reversed")
+
+    def player_skipped(self, player):
+        self._print(f"{player.name} is skipped")
+
+    def color_chosen(self, color):
+        self._print(f"New color chosen: {color}")
+
+    def penalty(self, player, num_cards):
+        self._print(f"{player.name} must draw {num_cards} cards and skip a turn")
+
+    def out_of_cards(self, player):
+        self._print(f"{player.name} has no cards left!")
+
+    def final_penalty(self, player, num_cards):
+        self._print(f"{player.name} must draw {num_cards} cards before the game ends")
+
+    def game_won(self, player, next_player):
+        self._print(next_player)
+        self._print(f"{player.name} wins!")
+
+    def turn_passed(self, player):
+        self._print(f"Turn moves to {player.name}")
+
+    def game_drawn(self, result, round_count):
+        self._print(f"Game ends in a draw after {round_count} rounds ({result.name})")
@@ -5,24 +5,29 @@ __FILE__ = "game.py"
 __author__ = "<Ter Jing Hao>"
 __student_ID__ = "34857613"
 
+import struct
+from enum import auto, IntEnum, IntFlag
+
 from data_structures.referential_array import ArrayR
 from player import Player
-from card import CardColor, CardLabel, Card
+from card import CardColor, CardLabel, Card, card_id, cards_from_ids
 from random_gen import RandomGen
 from constants import Constants
 from data_structures.stack_adt import ArrayStack
 from data_structures.array_sorted_list import ArraySortedList
+from data_structures.turn_order import TurnOrder
+from events import EventSink, PrintSink
 
 
-def generate_cards() -> ArrayR[Card]:
+def build_deck() -> ArrayR[Card]:
     """
-        Method to generate the cards for the game
+        Method to build the cards of a deck, in their order before shuffling
 
         Args:
             None
 
         Returns:
-            ArrayR[Card]: The array of Card objects generated
+            ArrayR[Card]: The array of Card objects, not shuffled
 
         Complexity:
             Best Case Complexity: O(N) - Where N is the number of cards in the deck
@@ -35,39 +40,139 @@ def generate_cards() -> ArrayR[Card]:
         if color != CardColor.CRAZY:
             # Generate 4 sets of cards from 0 to 9 for each color
             for i in range(10):
-                list_of_cards[idx] = Card(color, CardLabel(i))
+                list_of_cards[idx] = Card.of(color, CardLabel(i))
                 idx += 1
-                list_of_cards[idx] = Card(color, CardLabel(i))
+                list_of_cards[idx] = Card.of(color, CardLabel(i))
                 idx += 1
 
             # Generate 2 of each special card for each color
             for i in range(2):
-                list_of_cards[idx] = Card(color, CardLabel.SKIP)
+                list_of_cards[idx] = Card.of(color, CardLabel.SKIP)
                 idx += 1
-                list_of_cards[idx] = Card(color, CardLabel.REVERSE)
+                list_of_cards[idx] = Card.of(color, CardLabel.REVERSE)
                 idx += 1
-                list_of_cards[idx] = Card(color, CardLabel.DRAW_TWO)
+                list_of_cards[idx] = Card.of(color, CardLabel.DRAW_TWO)
                 idx += 1
         else:
             # Generate the crazy and crazy draw 4 cards
             for i in range(4):
-                list_of_cards[idx] = Card(CardColor.CRAZY, CardLabel.CRAZY)
+                list_of_cards[idx] = Card.of(CardColor.CRAZY, CardLabel.CRAZY)
                 idx += 1
-                list_of_cards[idx] = Card(CardColor.CRAZY, CardLabel.DRAW_FOUR)
+                list_of_cards[idx] = Card.of(CardColor.CRAZY, CardLabel.DRAW_FOUR)
                 idx += 1
 
+    return list_of_cards
+
+
+# Unshuffled deck every new game is copied from, built on first use
+_template_deck: ArrayR[Card] | None = None
+
+
+def generate_cards(rng=RandomGen) -> ArrayR[Card]:
+    """
+        Method to generate the cards for the game
+
+        Args:
+            rng: The random number generator to shuffle with, RandomGen or a RandomStream
+
+        Returns:
+            ArrayR[Card]: The array of Card objects generated
+
+        Complexity:
+            Best Case Complexity: O(N) - Where N is the number of cards in the deck
+            Worst Case Complexity: O(N) - Where N is the number of cards in the deck
+    """
+    global _template_deck
+    if _template_deck is None:
+        _template_deck = build_deck()
+
+    # Copy the shared template, its cards are interned so no Card is allocated per game
+    list_of_cards: ArrayR[Card] = ArrayR(len(_template_deck))
+    list_of_cards.copy_from(_template_deck)
+
     # Randomly shuffle the cards
-    RandomGen.random_shuffle(list_of_cards)
+    rng.random_shuffle(list_of_cards)
     return list_of_cards
 
 
+class GameResult(IntEnum):
+    """
+    Enum class for how a game ended. Anything but WIN is a draw.
+    """
+    WIN = 0
+    ROUND_LIMIT = auto()  # The round budget of the game ran out
+    STALLED = auto()  # The game was not making progress, or ran out of cards to draw
+
+
+class OutOfCards(Exception):
+    """ A card has to be drawn, but the draw pile is empty and there is nothing to reshuffle. """
+    pass
+
+
+class Effect(IntFlag):
+    """
+    Flags for the effects of a round
+    """
+    NONE = 0
+    REVERSE = auto()
+    SKIP = auto()
+    DRAW_TWO = auto()
+    DRAW_FOUR = auto()
+    COLOR = auto()
+    WIN = auto()
+
+
+class Turn:
+    """
+    Record of one round of a game, as yielded by Game.steps
+    """
+    __slots__ = ("round_count", "player", "played", "drawn", "effects")
+
+    def __init__(self, round_count: int, player: Player, played: Card | None, drawn: Card | None, effects: Effect) -> None:
+        """
+        Constructor for the Turn class
+
+        Args:
+            round_count (int): The number of the round
+            player (Player): The player whose turn it was
+            played (Card | None): The card put on the discard pile, if any
+            drawn (Card | None): The card drawn because nothing could be played, if any
+            effects (Effect): The effects of the round
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.round_count = round_count
+        self.player = player
+        self.played = played
+        self.drawn = drawn
+        self.effects = effects
+
+    def __str__(self) -> str:
+        return f"Round {self.round_count}: {self.player.name} played {self.played}, drew {self.drawn} ({self.effects!r})"
+
+
 class Game:
-    def __init__(self) -> None:
+    # Snapshot header: color, label, direction, seat, number of players, round count, seed, draw and
+    # discard pile sizes, number of reshuffles
+    SNAPSHOT_HEADER = "<BBbHHIQHHI"
+    NO_VALUE = 0xFF
+    NO_SEAT = 0xFFFF
+    INITIAL_PILE_CAPACITY = 16
+    # Reshuffles in a run of rounds leaving every hand unchanged that make the game STALLED: from the
+    # first to the second, every card of the recycled pile was drawn without any progress
+    STALL_RESHUFFLES = 2
+
+    def __init__(self, sink: EventSink = None, rng=None) -> None:
         """
         Method to initialize the Game object
 
         Args:
             self: The Game instance
+            sink (EventSink): Receiver of the game events. Defaults to a PrintSink, pass a NullSink to play headless
+            rng: Random number generator of the game. Defaults to the global RandomGen, pass a
+                RandomStream to play independently of other games
 
         Returns:
             None
@@ -77,16 +182,27 @@ class Game:
             Worst Case: O(1)
         """
         # Initialize game components
-        self.players = ArraySortedList(Constants.MAX_PLAYERS)
-        self.draw_pile = ArrayStack(Constants.DECK_SIZE)
-        self.discard_pile = ArrayStack(Constants.DECK_SIZE)
+        # Every container starts small and grows as needed, initialise_game sizes them for the table
+        self.players = ArraySortedList(1)
+        self.draw_pile = ArrayStack(self.INITIAL_PILE_CAPACITY)
+        self.discard_pile = ArrayStack(self.INITIAL_PILE_CAPACITY)
+
+        # Seats in playing order, with the current seat and the direction of play
+        self.turn_order = TurnOrder(1)
+        # Whether the cursor of turn_order is on the current player, i.e. the game has started
+        self._started = False
 
         # Initialize game state variables
-        self.current_player = None
         self.current_color = None
         self.current_label = None
         self.num_players = 0
-        self.direction = 1  # 1 for clockwise, -1 for counterclockwise
+        self.round_count = 0
+        self.winner = None
+        self.result = None
+        self.max_rounds = 0
+        self.reshuffles = 0
+        self.sink = sink if sink is not None else PrintSink()
+        self.rng = rng if rng is not None else RandomGen
 
     def initialise_game(self, players: ArrayR[Player]) -> None:
         """
@@ -108,23 +224,33 @@ class Game:
             O(P + D + P * C + (D - P * C)) = O(2D), which simplifies to O(D)
         """
         # Populate players
+        if len(players) > len(self.players.array):
+            self.players = ArraySortedList(len(players))
         self.num_players = 0
+        self.turn_order.clear()
+        self._started = False
         for player in players:
             if player is not None:
                 self.players[self.num_players] = player
+                self.turn_order.append(player)
                 self.num_players += 1
 
-        # Generate and shuffle cards
-        cards = generate_cards()
-
-        # Deal initial cards to players
-        card_index = 0
-        for _ in range(Constants.NUM_CARDS_AT_INIT):
-            for player_index in range(self.num_players):
-                self.players[player_index].add_card(cards[card_index])
-                card_index += 1
+        # Round budget, after which the game ends in a draw
+        self.max_rounds = Constants.MAX_ROUNDS_PER_PLAYER * self.num_players
 
-        # Add remaining cards to draw pile
+        # Generate and shuffle cards
+        cards = generate_cards(self.rng)
+
+        # Deal initial cards to players, one at a time round the table, each hand added in one merge
+        num_players = self.num_players
+        card_index = Constants.NUM_CARDS_AT_INIT * num_players
+        for player_index in range(num_players):
+            self.players[player_index].add_cards(cards.view(player_index, card_index, num_players))
+
+        # Add remaining cards to draw pile, grown to hold them all at once
+        remaining = Constants.DECK_SIZE - card_index
+        if len(self.draw_pile.array) < remaining:
+            self.draw_pile = ArrayStack(remaining)
         for i in range(card_index, Constants.DECK_SIZE):
             self.draw_pile.push(cards[i])
 
@@ -138,6 +264,7 @@ class Game:
         # Set current color and label
         self.current_color = self.discard_pile.peek().color
         self.current_label = self.discard_pile.peek().label
+        self.sink.game_dealt(self)
 
     def draw_card(self, player: Player, playing: bool) -> Card:
         """
@@ -151,40 +278,139 @@ class Game:
         Returns:
             Card: The drawn card
 
+        Raises:
+            OutOfCards: If the draw pile is empty and the discard pile only has its top card
+
         Complexity:
             Best Case: O(1) when draw pile is not empty
-            Worst Case: O(N) when reshuffling is needed, where N is the number of cards in discard pile
+            Worst Case: O(N log N) when reshuffling is needed, where N is the number of cards in discard pile
+        """
+        card = self._take_card(player)
+
+        # Add card to player's hand if not playing or can't play the card
+        if not (playing and self.can_play_card(card)):
+            player.add_card(card)
+
+        return card
+
+    def draw_cards(self, player: Player, count: int) -> None:
+        """
+        Method to make a player draw penalty cards, added to the hand in one merge
+
+        Args:
+            self: The Game instance
+            player (Player): The player drawing the cards
+            count (int): The number of cards to draw
+
+        Returns:
+            None
+
+        Raises:
+            OutOfCards: If the cards run out, once the cards drawn so far are in the hand
+
+        Complexity:
+            Best Case: O(C log C + H) where C is count and H the size of the hand
+            Worst Case: O(C log C + H + N log N) when reshuffling is needed, where N is the number of cards in discard pile
         """
+        cards = []
+        try:
+            for _ in range(count):
+                cards.append(self._take_card(player))
+        finally:
+            player.add_cards(cards)
+
+    def _take_card(self, player: Player) -> Card:
+        """ Takes the top card of the draw pile for the player, reshuffling if necessary. """
         # Check if draw pile is empty and reshuffle if necessary
         if self.draw_pile.is_empty():
+            if len(self.discard_pile) <= 1:
+                raise OutOfCards("No cards left to draw")
+
             # Reshuffle discard pile into draw pile, keeping the top card
             top_card = self.discard_pile.pop()
+            num_cards = len(self.discard_pile)
 
-            # Transfer cards from discard pile to a temporary ArrayR
-            temp_array = ArrayR(len(self.discard_pile))
-            index = 0
-            while not self.discard_pile.is_empty():
-                temp_array[index] = self.discard_pile.pop()
-                index += 1
-
-            # Shuffle the temporary ArrayR
-            RandomGen.random_shuffle(temp_array)
+            # The draw pile is empty, so it takes over the array of the discard pile as it is
+            self.draw_pile.swap(self.discard_pile)
 
-            # Push shuffled cards back to draw pile
-            for i in range(len(temp_array)):
-                self.draw_pile.push(temp_array[i])
+            # The cards used to be popped off the discard pile before shuffling, i.e. shuffled
+            # from the top down. Reverse them so that the shuffle, and so the game, stays the same
+            self.draw_pile.reverse()
+            self.rng.random_shuffle(self.draw_pile.array, num_cards)
 
             # Put the top card back on the discard pile
             self.discard_pile.push(top_card)
+            self.reshuffles += 1
+            self.sink.reshuffled(num_cards)
 
         # Draw a card from the pile
         card = self.draw_pile.pop()
+        self.sink.card_drawn(player, card)
+        return card
 
-        # Add card to player's hand if not playing or can't play the card
-        if not (playing and self.can_play_card(card)):
-            player.add_card(card)
+    @property
+    def current_player(self) -> Player | None:
+        """
+        The player whose turn it is, None before the game starts. It is the player at the cursor of
+        turn_order, so setting it moves the cursor to the seat of the player.
 
-        return card
+        Raises:
+            ValueError: When set to a player who is not seated at the game
+
+        Complexity:
+            Best Case: O(1) to get or to set to None
+            Worst Case: O(N) to set, where N is the number of players
+        """
+        return self.turn_order.current() if self._started else None
+
+    @current_player.setter
+    def current_player(self, player: Player | None) -> None:
+        if player is None:
+            # Before the game starts, play goes round from the first seat
+            self.turn_order.index = 0
+            self._started = False
+        else:
+            self._move_to(self.turn_order.seat_of(player))
+
+    def _move_to(self, seat: int) -> Player:
+        """ Makes it the turn of the player at the given seat, and returns that player. """
+        player = self.turn_order.move_to(seat)
+        self._started = True
+        return player
+
+    @property
+    def direction(self) -> int:
+        """
+        The direction of play, 1 for clockwise and -1 for anti-clockwise
+
+        Complexity:
+            Best Case: O(1)
+            Worst Case: O(1)
+        """
+        return self.turn_order.direction
+
+    @direction.setter
+    def direction(self, direction: int) -> None:
+        self.turn_order.direction = direction
+
+    def _next_seat(self) -> int:
+        """
+        Method to get the seat of the next player based on the current direction
+
+        Args:
+            self: The Game instance
+
+        Returns:
+            int: The seat of the next player in the sequence
+
+        Complexity:
+            Best Case: O(1)
+            Worst Case: O(1)
+        """
+        # If it's the first turn, the first player is next
+        if self.current_player is None and self.turn_order.direction == 1:
+            return 0
+        return self.turn_order.seat_after(1)
 
     def next_player(self) -> Player:
         """
@@ -197,23 +423,26 @@ class Game:
             Player: The next player in the sequence
 
         Complexity:
-            Best Case: O(1) when current player is the last in the list
-            Worst Case: O(N) where N is the number of players
-        """
-        # If it's the first turn, return the first player
-        if self.current_player is None and (self.direction == 1):
-            return self.players[0]
-
-        # Find the index of the current player
-        current_index = 0
-        for i in range(self.num_players):
-            if self.players[i] == self.current_player:
-                current_index = i
-                break
+            Best Case: O(1)
+            Worst Case: O(1)
+        """
+        return self.turn_order[self._next_seat()]
+
+    def _advance(self) -> None:
+        """
+        Method to move the turn to the next player
+
+        Args:
+            self: The Game instance
 
-        # Calculate the index of the next player
-        next_index = (current_index + self.direction) % self.num_players
-        return self.players[next_index]
+        Returns:
+            None
+
+        Complexity:
+            Best Case: O(1)
+            Worst Case: O(1)
+        """
+        self._move_to(self._next_seat())
 
     def play_reverse(self) -> None:
         """
@@ -229,8 +458,8 @@ class Game:
             Best Case: O(1)
             Worst Case: O(1)
         """
-        # Reverse the direction by multiplying by -1, 1 is clockwise and -1 is anti-clockwise
-        self.direction *= -1
+        # Reverse the direction, 1 is clockwise and -1 is anti-clockwise
+        self.turn_order.reverse()
 
     def play_skip(self) -> None:
         """
@@ -244,10 +473,10 @@ class Game:
 
         Complexity:
             Best Case: O(1)
-            Worst Case: O(N), where N is the number of players (due to next_player method)
+            Worst Case: O(1)
         """
         # Set the current player to the next player, effectively skipping one
-        self.current_player = self.next_player()
+        self._advance()
 
     def crazy_play(self, card: Card) -> None:
         """
@@ -266,16 +495,16 @@ class Game:
         """
         if card.label == CardLabel.DRAW_TWO:
             # Handle draw two card
-            next_player = self.next_player()
-            for _ in range(2):
-                self.draw_card(next_player, False)
+            self.draw_cards(self.next_player(), 2)
         else:
-            # Handle wild or draw four card
-            self.current_color = CardColor(RandomGen.randint(0, 3))
+            # Handle wild or draw four card: the player's strategy picks the color, or the generator
+            strategy = self.current_player.strategy if self.current_player is not None else None
+            if strategy is None:
+                self.current_color = CardColor(self.rng.randint(0, 3))
+            else:
+                self.current_color = strategy.choose_color(self, self.current_player)
             if card.label == CardLabel.DRAW_FOUR:
-                next_player = self.next_player()
-                for _ in range(4):
-                    self.draw_card(next_player, False)
+                self.draw_cards(self.next_player(), 4)
 
     def can_play_card(self, card: Card) -> bool:
         """
@@ -331,23 +560,24 @@ class Game:
             Worst Case: O(N), where N is the number of cards to draw (in case of DRAW_TWO or DRAW_FOUR)
         """
         if len(self.current_player) == 0:
-            print(f"{self.current_player.name} has no cards left!")
+            self.sink.out_of_cards(self.current_player)
 
             # Check if the last card requires the next player to draw
             if played_card.label == CardLabel.DRAW_TWO or played_card.label == CardLabel.DRAW_FOUR:
-                self.next_player()
                 next_player = self.next_player()
                 cards_to_draw = 2 if played_card.label == CardLabel.DRAW_TWO else 4
-                print(f"{next_player.name} must draw {cards_to_draw} cards before the game ends")
-                for _ in range(cards_to_draw):
-                    self.draw_card(next_player, False)
-
-            print(self.next_player())
-            print(f"{self.current_player.name} wins!")
+                self.sink.final_penalty(next_player, cards_to_draw)
+                try:
+                    self.draw_cards(next_player, cards_to_draw)
+                except OutOfCards:
+                    # The hand is empty all the same: the penalty takes what is left
+                    pass
+
+            self.sink.game_won(self.current_player, self.next_player())
             return True
         return False
 
-    def play_game(self) -> Player:
+    def play_game(self) -> Player | None:
         """
         Method to run the main game loop that manages the flow of the UNO game
 
@@ -355,76 +585,170 @@ class Game:
             self: The Game instance
 
         Returns:
-            Player: The winning player
+            Player | None: The winning player, None if the game ended in a draw (see result)
 
         Complexity:
-            Best Case: O(R * P), where R is the number of rounds played and P is the number of players
-            Worst Case: O(R * (P + D)), where R is the number of rounds, P is the number of players,
+            Best Case: O(R * H), where R is the number of rounds played and H is the size of the largest hand
+            Worst Case: O(R * (H + D)), where R is the number of rounds, H is the size of the largest hand,
                         and D is the deck size (due to potential reshuffling).
         """
-        self.current_player = self.players[0]  # Start with the first player
-        print(f"Game starts with {self.current_player.name}")
-        print(f"Starting card: {self.current_color} {self.current_label}")
-        round_count = 0
+        for _ in self.steps():
+            pass
+        return self.winner
+
+    def steps(self):
+        """
+        Generator playing the game one round at a time, yielding a Turn record after every round
+
+        A game that has not started yet starts with the first player. Otherwise, for instance after
+        restoring a snapshot taken between two rounds, play resumes with the current player.
+        The generator stops after the round in which a player wins, and result is set to WIN.
+
+        A game can also end in a draw, with no winner:
+            ROUND_LIMIT after max_rounds rounds, MAX_ROUNDS_PER_PLAYER per player.
+            STALLED if no hand changed size for a full rotation (every round drew a card and played
+                it straight away) while the pile was recycled, i.e. STALL_RESHUFFLES reshuffles
+                happened in that run of rounds. Also if a card has to be drawn when there is none
+                left to draw or reshuffle.
+
+        Args:
+            self: The Game instance
+
+        Yields:
+            Turn: What happened in the round
+
+        Complexity:
+            Best Case: O(H) per round, where H is the size of the current hand
+            Worst Case: O(H + D) per round, where D is the deck size (due to potential reshuffling).
+        """
+        sink = self.sink
+        if self.result is not None:
+            return
+        if self.current_player is None:
+            self._move_to(0)  # Start with the first player
+            sink.game_started(self.current_player, self.current_color, self.current_label)
+            self.round_count = 0
+
+        # Rounds in a row that left every hand the same size, and the reshuffles before them
+        still_rounds = 0
+        reshuffles_at_change = self.reshuffles
 
         while True:
-            round_count += 1
-            print(f"\nRound: {round_count}")
-            print(f"Current player: {self.current_player.name}")
-            print(f"Current card: {self.current_color} {self.current_label}")
-            print(f"{self.current_player.name}'s hand: {[str(self.current_player[i]) for i in range(len(self.current_player))]}")
-
-            # Try to play a card
-            played_card = None
-            for i in range(len(self.current_player)):
-                card = self.current_player[i]
-                if self.can_play_card(card):
-                    played_card = self.current_player.play_card(i)
-                    print(f"{self.current_player.name} plays {played_card}")
-                    break
-
-            if played_card is None:
-                # If no card can be played, draw a card
-                print(f"{self.current_player.name} cannot play, drawing a card")
-                drawn_card = self.draw_card(self.current_player, True)
-                print(f"Draw card: {drawn_card}")
-                # Check if the drawn card can be played
-                if self.can_play_card(drawn_card):
-                    print(f"{self.current_player.name} draws and can play: {drawn_card}")
-                    self.current_player.add_card(drawn_card)
-                    # Play the drawn card if it matches the current color/label
-                    for i in range(len(self.current_player)):
-                        if drawn_card == self.current_player[i]:
-                            played_card = self.current_player.play_card(i)
-                            break
-                else:
-                    print(f"{self.current_player.name} draws a card and cannot play it")
-
-            if played_card:
-                # Update the discard pile and the current card details
-                self.discard_pile.push(played_card)
-                self.current_color = played_card.color
-                self.current_label = played_card.label
-                print(f"New top card: {self.current_color} {self.current_label}")
-
-                # Handle special cards like REVERSE, SKIP, and CRAZY
+            self.round_count += 1
+            player = self.current_player
+            sink.round_started(self.round_count, player, self.current_color, self.current_label)
+            played_card, drawn_card, effects, out_of_cards = self._play_round(player)
+
+            # Check if the current player has won the game, even if the cards ran out on the way
+            won = played_card is not None and self.check_winner(played_card)
+            if won:
+                self.winner = self.current_player
+                self.result = GameResult.WIN
+                yield Turn(self.round_count, player, played_card, drawn_card, effects | Effect.WIN)
+                return
+            if out_of_cards:
+                self._end_in_draw(GameResult.STALLED)
+                yield Turn(self.round_count, player, played_card, drawn_card, effects)
+                return
+
+            self._advance()
+            sink.turn_passed(self.current_player)
+
+            # Only a drawn card played straight away, without a penalty, leaves every hand as it was
+            if played_card is not None and played_card is drawn_card and not effects & (Effect.DRAW_TWO | Effect.DRAW_FOUR):
+                still_rounds += 1
+            else:
+                still_rounds = 0
+                reshuffles_at_change = self.reshuffles
+
+            result = None
+            if self.round_count >= self.max_rounds:
+                result = GameResult.ROUND_LIMIT
+            elif still_rounds >= self.num_players and self.reshuffles - reshuffles_at_change >= self.STALL_RESHUFFLES:
+                result = GameResult.STALLED
+            if result is not None:
+                self._end_in_draw(result)
+            yield Turn(self.round_count, player, played_card, drawn_card, effects)
+            if result is not None:
+                return
+
+    def _play_round(self, player: Player) -> tuple[Card | None, Card | None, Effect]:
+        """
+        Method to play the turn of the current player: play or draw, then apply the effects of the card
+
+        Args:
+            self: The Game instance
+            player (Player): The current player
+
+        Returns:
+            tuple[Card | None, Card | None, Effect, bool]: The card played, the card drawn, the effects
+                and whether a card had to be drawn but none was left, which cuts the round short
+
+        Complexity:
+            Best Case: O(H), where H is the size of the hand
+            Worst Case: O(H + D), where D is the deck size (due to potential reshuffling)
+        """
+        sink = self.sink
+        effects = Effect.NONE
+
+        # Try to play the first playable card of the hand, or the one chosen by the player's strategy
+        played_card = None
+        drawn_card = None
+        if player.strategy is None:
+            index = player.first_playable(self.current_color, self.current_label)
+        else:
+            index = player.strategy.choose_card(self, player)
+        if index is not None:
+            played_card = player.play_card(index)
+            sink.card_played(player, played_card)
+
+        if played_card is None:
+            # If no card can be played, draw a card
+            sink.cannot_play(player)
+            try:
+                drawn_card = self.draw_card(player, True)
+            except OutOfCards:
+                return None, None, effects, True
+            playable = self.can_play_card(drawn_card)
+            sink.turn_draw(player, drawn_card, playable)
+            # Play the drawn card straight away if it matches the current color/label
+            if playable:
+                played_card = drawn_card
+
+        if played_card:
+            # Update the discard pile and the current card details
+            self.discard_pile.push(played_card)
+            self.current_color = played_card.color
+            self.current_label = played_card.label
+            sink.top_card_changed(self.current_color, self.current_label)
+
+            # Handle special cards like REVERSE, SKIP, and CRAZY
+            try:
                 if played_card.label == CardLabel.REVERSE:
                     self.play_reverse()
-                    print("Direction reversed")
+                    sink.direction_reversed()
+                    effects = Effect.REVERSE
                 elif played_card.label == CardLabel.SKIP:
-                    if len(self.current_player) != 0:
+                    if len(player) != 0:
                         self.play_skip()
-                        print(f"{self.current_player.name} is skipped")
+                        sink.player_skipped(self.current_player)
+                        effects = Effect.SKIP
                 elif played_card.color == CardColor.CRAZY:
+                    effects = Effect.COLOR | Effect.DRAW_FOUR if played_card.label == CardLabel.DRAW_FOUR else Effect.COLOR
                     self._handle_crazy_card(played_card)
                 elif played_card.label == CardLabel.DRAW_TWO:
+                    effects = Effect.DRAW_TWO
                     self._handle_draw_two()
-            # Check if the current player has won the game
-            if self.check_winner(played_card):
-                return self.current_player
+            except OutOfCards:
+                # The penalty is cut short, the cards drawn so far are in the hand
+                return played_card, drawn_card, effects, True
 
-            self.current_player = self.next_player()
-            print(f"Turn moves to {self.current_player.name}")
+        return played_card, drawn_card, effects, False
+
+    def _end_in_draw(self, result: GameResult) -> None:
+        """ Ends the game without a winner. """
+        self.result = result
+        self.sink.game_drawn(result, self.round_count)
 
     def _handle_crazy_card(self, played_card: Card) -> None:
         """
@@ -443,17 +767,17 @@ class Game:
         """
         if played_card.label == CardLabel.DRAW_FOUR:
             self.crazy_play(played_card)
-            print(f"New color chosen: {self.current_color}")
+            self.sink.color_chosen(self.current_color)
             # Determine the next player who must draw 4 cards
             next_player = self.next_player()
             if len(self.current_player) != 0:
-                print(f"{next_player.name} must draw 4 cards and skip a turn")
+                self.sink.penalty(next_player, 4)
                 # Skip the next player's turn after drawing cards
-                self.current_player = self.next_player()
+                self._advance()
         elif played_card.label == CardLabel.CRAZY:
             # Handle the CRAZY card effect
             self.crazy_play(played_card)
-            print(f"New color chosen: {self.current_color}")
+            self.sink.color_chosen(self.current_color)
 
     def _handle_draw_two(self) -> None:
         """
@@ -472,11 +796,106 @@ class Game:
         next_player = self.next_player()
         # If the current player has not won yet
         if len(self.current_player) != 0:
-            print(f"{next_player.name} must draw 2 cards and skip a turn")
+            self.sink.penalty(next_player, 2)
             # Make the next player draw two cards and skip their turn
-            self.crazy_play(Card(self.current_color, CardLabel.DRAW_TWO))
+            self.crazy_play(Card.of(self.current_color, CardLabel.DRAW_TWO))
             # Move the turn to the next player after the one who skipped
-            self.current_player = self.next_player()
+            self._advance()
+
+    def snapshot(self) -> bytes:
+        """
+        Method to capture the state of the game in a compact binary form
+
+        The snapshot holds the draw and discard piles, every hand, the current color and label,
+        the direction, the current seat, the round count, the number of reshuffles and the seed of
+        the game's generator. Every card is
+        stored as its one byte id (see card_id), so a snapshot of a standard game is a few hundred bytes.
+
+        Layout (little endian): the header SNAPSHOT_HEADER, then one unsigned short per hand size,
+        then the card ids of the draw pile and the discard pile from bottom to top, then every hand in order.
+
+        Args:
+            self: The Game instance
+
+        Returns:
+            bytes: The snapshot, to be given to restore
+
+        Complexity:
+            Best Case: O(D + P) where D is the number of cards in the game and P the number of players
+            Worst Case: O(D + P) where D is the number of cards in the game and P the number of players
+        """
+        draw_pile, discard_pile = self.draw_pile, self.discard_pile
+        header = struct.pack(
+            self.SNAPSHOT_HEADER,
+            self.NO_VALUE if self.current_color is None else self.current_color,
+            self.NO_VALUE if self.current_label is None else self.current_label,
+            self.direction,
+            self.NO_SEAT if self.current_player is None else self.turn_order.index,
+            self.num_players,
+            self.round_count,
+            self.rng.seed,
+            len(draw_pile),
+            len(discard_pile),
+            self.reshuffles,
+        )
+        sizes = struct.pack(f"<{self.num_players}H", *[len(self.turn_order[seat]) for seat in range(self.num_players)])
+        cards = bytearray(card_id(card) for card in draw_pile.view())
+        cards.extend(card_id(card) for card in discard_pile.view())
+        for seat in range(self.num_players):
+            cards.extend(card_id(card) for card in self.turn_order[seat].cards())
+        return header + sizes + cards
+
+    def restore(self, snapshot: bytes) -> None:
+        """
+        Method to bring the game back to the state captured by snapshot
+
+        The game must have been initialised with the same players as the game the snapshot was taken from.
+
+        Args:
+            self: The Game instance
+            snapshot (bytes): A snapshot returned by snapshot
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the snapshot was taken with a different number of players
+
+        Complexity:
+            Best Case: O(D + P) where D is the number of cards in the game and P the number of players
+            Worst Case: O(D + P) where D is the number of cards in the game and P the number of players
+        """
+        color, label, direction, seat, num_players, round_count, seed, num_draw, num_discard, reshuffles = \
+            struct.unpack_from(self.SNAPSHOT_HEADER, snapshot)
+        if num_players != self.num_players:
+            raise ValueError(f"Snapshot has {num_players} players, but the game has {self.num_players}")
+        offset = struct.calcsize(self.SNAPSHOT_HEADER)
+        sizes = struct.unpack_from(f"<{num_players}H", snapshot, offset)
+        offset += 2 * num_players
+
+        # Every pile and hand is stored in order, so each is filled in one block
+        cards = cards_from_ids(snapshot[offset:])
+        self.draw_pile.clear()
+        self.draw_pile.push_all(cards[:num_draw])
+        self.discard_pile.clear()
+        self.discard_pile.push_all(cards[num_draw:num_draw + num_discard])
+        start = num_draw + num_discard
+        for player_seat in range(num_players):
+            self.turn_order[player_seat].restore_hand(cards[start:start + sizes[player_seat]])
+            start += sizes[player_seat]
+
+        self.current_color = None if color == self.NO_VALUE else CardColor(color)
+        self.current_label = None if label == self.NO_VALUE else CardLabel(label)
+        self.turn_order.direction = direction
+        if seat == self.NO_SEAT:
+            self.current_player = None
+        else:
+            self._move_to(seat)
+        self.round_count = round_count
+        self.reshuffles = reshuffles
+        self.winner = None
+        self.result = None
+        self.rng.seed = seed
 
 
 def test_case():
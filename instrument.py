@@ -0,0 +1,311 @@
+"""
+Fit 1008 Assignment 1
+"""
+__FILE__ = "instrument.py"
+__author__ = "<Ter Jing Hao>"
+__student_ID__ = "34857613"
+
+import argparse
+import functools
+import time
+
+from card import Card
+from constants import Constants
+from data_structures.array_sorted_list import ArraySortedList
+from data_structures.referential_array import ArrayR
+from events import NullSink
+from game import Game
+from player import Player
+from random_gen import RandomStream
+
+
+class Instrumentation:
+    """
+    Opt-in counters for the hot paths of a game.
+
+    Enabling replaces the measured methods on their classes by counting wrappers, and disabling
+    puts the original methods back, so nothing is measured and nothing costs anything unless an
+    Instrumentation is enabled. Only one can be enabled at a time. Times include the time of the
+    measured methods called inside. draw_card is a draw on a turn, and take_card counts every
+    card taken from the draw pile, on a turn or as a penalty, without putting it in the hand,
+    which hand_insert (one card) and hand_insert_batch (dealing and penalties) measure. Element
+    moves count the elements already in a sorted list that an insertion or deletion moves, one at
+    a time for the shuffles and in one merge for add_all.
+
+    The wrappers are on the classes, so without a game every game, player and sorted list of the
+    process is counted, including the scratch games of an MCTS strategy. Given a game, only that
+    game, the players seated at it and their hands are counted, and Card comparisons only while
+    one of their counted methods runs.
+
+    Usage:
+    ```
+    with Instrumentation(game) as counters:
+        game.play_game()
+    print(counters.summary())
+    ```
+    """
+    # (name in the summary, class, method) of the methods counted and timed
+    TIMED = (
+        ("draw_card", Game, "draw_card"),
+        ("take_card", Game, "_take_card"),
+        ("next_player", Game, "next_player"),
+        ("can_play_card", Game, "can_play_card"),
+        ("hand_insert", Player, "add_card"),
+        ("hand_insert_batch", Player, "add_cards"),
+        ("hand_delete", Player, "play_card"),
+    )
+    # (name in the summary, method) of the ArraySortedList methods whose element moves are counted
+    MOVES = (
+        ("shuffle_right_moves", "_shuffle_right"),
+        ("shuffle_left_moves", "_shuffle_left"),
+        ("merge_moves", "add_all"),
+    )
+    COMPARISONS = ("__lt__", "__le__", "__eq__", "__ne__", "__gt__", "__ge__")
+
+    _enabled = None
+
+    def __init__(self, game: Game = None) -> None:
+        """
+        Constructor for the Instrumentation class, disabled with every counter at zero
+
+        Args:
+            game (Game): The only game to count, dealt before enabling, or None to count every game
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.game = game
+        self._originals = []
+        # Number of counted calls running, the Card comparisons of a game are only counted inside one
+        self._depth = 0
+        self.reset()
+
+    def reset(self) -> None:
+        """ Sets every counter back to zero. """
+        self.calls = {name: 0 for name, _, _ in self.TIMED}
+        self.calls["reshuffle"] = 0
+        self.nanoseconds = dict.fromkeys(self.calls, 0)
+        self.moves = {name: 0 for name, _ in self.MOVES}
+        self.comparisons = 0
+
+    def enable(self) -> None:
+        """
+        Method to start counting, by patching the measured classes
+
+        Raises:
+            RuntimeError: If an Instrumentation is already enabled
+
+        Complexity:
+            Best Case Complexity: O(1) without a game
+            Worst Case Complexity: O(P) where P is the number of players of the game
+        """
+        if Instrumentation._enabled is not None:
+            raise RuntimeError("An Instrumentation is already enabled")
+        Instrumentation._enabled = self
+        game = self.game
+        if game is None:
+            owners = {Game: None, Player: None, ArraySortedList: None}
+        else:
+            players = [game.turn_order[seat] for seat in range(game.num_players)]
+            owners = {
+                Game: {id(game)},
+                Player: {id(player) for player in players},
+                ArraySortedList: {id(player.hand) for player in players},
+            }
+        for name, cls, method in self.TIMED:
+            wrapper = self._take_card_wrapper if name == "take_card" else self._timed_wrapper
+            self._patch(cls, method, wrapper(name, getattr(cls, method), owners[cls]))
+        for name, method in self.MOVES:
+            wrapper = self._merge_moves_wrapper if method == "add_all" else self._moves_wrapper
+            self._patch(ArraySortedList, method,
+                        wrapper(name, getattr(ArraySortedList, method), owners[ArraySortedList]))
+        for method in self.COMPARISONS:
+            self._patch(Card, method, self._comparison_wrapper(getattr(Card, method)))
+
+    def disable(self) -> None:
+        """
+        Method to stop counting and put the original methods back. The counters are kept.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        while self._originals:
+            cls, method, original = self._originals.pop()
+            setattr(cls, method, original)
+        if Instrumentation._enabled is self:
+            Instrumentation._enabled = None
+
+    def __enter__(self) -> 'Instrumentation':
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.disable()
+
+    def summary(self) -> dict:
+        """
+        Method to export the counters
+
+        Returns:
+            dict: For every timed method, {"calls": int, "seconds": float}. "reshuffle" is the part
+                of take_card that reshuffled. Then the element moves of the shuffles and of the
+                add_all merge, and "card_comparisons", the number of Card comparisons.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        result = {
+            name: {"calls": self.calls[name], "seconds": self.nanoseconds[name] / 1e9}
+            for name in self.calls
+        }
+        result.update(self.moves)
+        result["card_comparisons"] = self.comparisons
+        return result
+
+    def _patch(self, cls, method: str, wrapper) -> None:
+        # Kept from the class dict itself, so that disabling restores exactly what was there
+        self._originals.append((cls, method, cls.__dict__[method]))
+        setattr(cls, method, wrapper)
+
+    # Every wrapper gets the ids of the objects to count, or None to count all of them
+
+    def _timed_wrapper(self, name: str, method, owners: set | None):
+        calls, nanoseconds, clock, counters = self.calls, self.nanoseconds, time.perf_counter_ns, self
+
+        @functools.wraps(method)
+        def wrapper(owner, *args, **kwargs):
+            if owners is not None and id(owner) not in owners:
+                return method(owner, *args, **kwargs)
+            counters._depth += 1
+            start = clock()
+            try:
+                return method(owner, *args, **kwargs)
+            finally:
+                calls[name] += 1
+                nanoseconds[name] += clock() - start
+                counters._depth -= 1
+        return wrapper
+
+    def _take_card_wrapper(self, name: str, method, owners: set | None):
+        calls, nanoseconds, clock, counters = self.calls, self.nanoseconds, time.perf_counter_ns, self
+
+        @functools.wraps(method)
+        def wrapper(game, *args, **kwargs):
+            if owners is not None and id(game) not in owners:
+                return method(game, *args, **kwargs)
+            counters._depth += 1
+            reshuffles = game.reshuffles
+            start = clock()
+            try:
+                return method(game, *args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                calls[name] += 1
+                nanoseconds[name] += elapsed
+                if game.reshuffles != reshuffles:
+                    calls["reshuffle"] += 1
+                    nanoseconds["reshuffle"] += elapsed
+                counters._depth -= 1
+        return wrapper
+
+    def _moves_wrapper(self, name: str, method, owners: set | None):
+        moves = self.moves
+
+        @functools.wraps(method)
+        def wrapper(sorted_list, index):
+            # Both shuffles move the elements from index to the end of the list
+            if owners is None or id(sorted_list) in owners:
+                moves[name] += max(len(sorted_list) - index, 0)
+            return method(sorted_list, index)
+        return wrapper
+
+    def _merge_moves_wrapper(self, name: str, method, owners: set | None):
+        moves, counters = self.moves, self
+
+        @functools.wraps(method)
+        def wrapper(sorted_list, items):
+            if owners is not None and id(sorted_list) not in owners:
+                return method(sorted_list, items)
+            # add_all takes any iterable, so keep the items to both measure and merge them
+            items = list(items)
+            # The merge moves the elements after the place of the smallest item, each once
+            if len(items) > 0 and len(sorted_list) > 0:
+                comparisons = counters.comparisons
+                moves[name] += len(sorted_list) - sorted_list.bisect_right(min(items))
+                # Finding them is not part of the work measured
+                counters.comparisons = comparisons
+            counters._depth += 1
+            try:
+                return method(sorted_list, items)
+            finally:
+                counters._depth -= 1
+        return wrapper
+
+    def _comparison_wrapper(self, method):
+        counters, scoped = self, self.game is not None
+
+        @functools.wraps(method)
+        def wrapper(card, other):
+            if not scoped or counters._depth > 0:
+                counters.comparisons += 1
+            return method(card, other)
+        return wrapper
+
+
+def instrument_game(game: Game) -> dict:
+    """
+    Method to play a dealt game with the counters enabled
+
+    Args:
+        game (Game): A game, initialised and not over yet
+
+    Returns:
+        dict: The summary of the counters, see Instrumentation.summary, with "rounds" added
+
+    Complexity:
+        Best Case Complexity: O(T) where T is the cost of playing the game
+        Worst Case Complexity: O(T) where T is the cost of playing the game
+    """
+    with Instrumentation(game) as counters:
+        game.play_game()
+    summary = counters.summary()
+    summary["rounds"] = game.round_count
+    return summary
+
+
+if __name__ == '__main__':
+    p = argparse.ArgumentParser(description="Play headless seeded games with the counters enabled and report the mean per game.")
+    p.add_argument("--games", type=int, default=200)
+    p.add_argument("--players", type=int, default=4)
+    p.add_argument("--seed", type=int, default=0)
+    args = p.parse_args()
+
+    totals = {}
+    start = time.perf_counter()
+    for seed in range(args.seed, args.seed + args.games):
+        players: ArrayR[Player] = ArrayR(args.players)
+        for seat in range(args.players):
+            players[seat] = Player(f"Player {seat}", seat)
+        game = Game(NullSink(), RandomStream(seed))
+        game.initialise_game(players)
+        for name, value in instrument_game(game).items():
+            if isinstance(value, dict):
+                total = totals.setdefault(name, {"calls": 0, "seconds": 0.0})
+                total["calls"] += value["calls"]
+                total["seconds"] += value["seconds"]
+            else:
+                totals[name] = totals.get(name, 0) + value
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.games} games, {args.players} players, {Constants.NUM_CARDS_AT_INIT} cards each, "
+          f"{elapsed / args.games * 1e3:.2f} ms per instrumented game")
+    for name, value in totals.items():
+        if isinstance(value, dict):
+            per_call = value["seconds"] / value["calls"] * 1e6 if value["calls"] else 0.0
+            print(f"  {name:>20}: {value['calls'] / args.games:9.1f} calls, "
+                  f"{value['seconds'] / args.games * 1e3:7.3f} ms per game ({per_call:.2f} us per call)")
+        else:
+            print(f"  {name:>20}: {value / args.games:9.1f} per game")
@@ -0,0 +1,382 @@
+"""
+Fit 1008 Assignment 1
+"""
+__FILE__ = "mcts.py"
+__author__ = "<Ter Jing Hao>"
+__student_ID__ = "34857613"
+
+import argparse
+import math
+import struct
+import time
+
+from card import CardColor
+from constants import Constants
+from data_structures.referential_array import ArrayR
+from events import NullSink
+from game import Game, GameResult
+from player import Player, Strategy, playable_mask
+from random_gen import RandomGen, RandomStream
+
+# The colors a crazy card can be given, and the rank of the first crazy card
+_COLORS = (CardColor.RED, CardColor.BLUE, CardColor.GREEN, CardColor.YELLOW)
+_FIRST_CRAZY_RANK = CardColor.CRAZY * Constants.NUM_MAX_VALS
+
+
+def legal_actions(game: Game, player: Player) -> list[tuple[int, CardColor | None]]:
+    """
+    Method to list the moves the player can choose from at the start of their turn
+
+    Args:
+        game (Game): The game, with the current color and label of the turn
+        player (Player): The player whose turn it is
+
+    Returns:
+        list[tuple[int, CardColor | None]]: (rank, color) of every distinct playable card, in hand
+            order. Crazy cards come once per color they can be given, other cards with color None.
+
+    Complexity:
+        Best Case Complexity: O(1) when nothing can be played
+        Worst Case Complexity: O(R) where R is the number of distinct ranks, a constant
+    """
+    actions = []
+    playable = player.held & playable_mask(game.current_color, game.current_label)
+    while playable:
+        low = playable & -playable
+        playable ^= low
+        rank = low.bit_length() - 1
+        if rank >= _FIRST_CRAZY_RANK:
+            for color in _COLORS:
+                actions.append((rank, color))
+        else:
+            actions.append((rank, None))
+    return actions
+
+
+def favourite_color(player: Player) -> CardColor:
+    """ The color the player holds the most cards of, the first one on a tie. """
+    best = _COLORS[0]
+    for color in _COLORS:
+        if player.color_counts[color] > player.color_counts[best]:
+            best = color
+    return best
+
+
+def determinize(snapshot: bytes, seat: int, rng) -> bytes:
+    """
+    Method to sample a game the player at seat cannot tell apart from the one of the snapshot
+
+    The player knows their own hand, the discard pile and how many cards every other hand and the
+    draw pile have, but not which cards. The cards of the draw pile and of the other hands are
+    dealt again at random into the same places.
+
+    Args:
+        snapshot (bytes): A snapshot of the game, see Game.snapshot
+        seat (int): The seat of the player whose view is kept
+        rng: The generator the hidden cards are shuffled with
+
+    Returns:
+        bytes: A snapshot of the sampled game
+
+    Complexity:
+        Best Case Complexity: O(D log D) where D is the number of cards in the game
+        Worst Case Complexity: O(D log D) where D is the number of cards in the game
+    """
+    header = struct.unpack_from(Game.SNAPSHOT_HEADER, snapshot)
+    num_players, num_draw, num_discard = header[4], header[7], header[8]
+    start = struct.calcsize(Game.SNAPSHOT_HEADER)
+    sizes = struct.unpack_from(f"<{num_players}H", snapshot, start)
+    start += 2 * num_players
+
+    # Hidden cards: the draw pile, then every hand but the seat's
+    hands = start + num_draw + num_discard
+    own = hands + sum(sizes[:seat])
+    own_end = own + sizes[seat]
+    hidden = bytearray(snapshot[start:start + num_draw])
+    hidden += snapshot[hands:own]
+    hidden += snapshot[own_end:]
+    rng.random_shuffle(hidden, mode=RandomGen.FISHER_YATES)
+
+    sample = bytearray(snapshot)
+    sample[start:start + num_draw] = hidden[:num_draw]
+    sample[hands:own] = hidden[num_draw:num_draw + own - hands]
+    sample[own_end:] = hidden[num_draw + own - hands:]
+
+    # A snapshot keeps every hand in hand order, which is the order of the card ids
+    offset = hands
+    for other in range(num_players):
+        if other != seat:
+            sample[offset:offset + sizes[other]] = sorted(sample[offset:offset + sizes[other]])
+        offset += sizes[other]
+    return bytes(sample)
+
+
+class Node:
+    """
+    Node of the search tree, for a decision of the searching player. The tree is open loop: a node
+    is reached by a sequence of the player's own moves, whatever the other players did in between,
+    so it stands for every sampled game in which the player made those moves.
+
+    Attributes:
+        children (dict): The node reached by every move tried from here, keyed by (rank, color)
+        visits (int): The number of searches that went through the node
+        wins (float): The total reward of those searches for the searching player
+        available (int): The number of searches in which the move leading here could be made
+    """
+    __slots__ = ("children", "visits", "wins", "available")
+
+    def __init__(self) -> None:
+        self.children = {}
+        self.visits = 0
+        self.wins = 0.0
+        self.available = 0
+
+
+class _SearchPolicy(Strategy):
+    """
+    Strategy of the searching player inside the sampled games: follows the tree by UCB1 until a
+    move that was never tried, then plays like a player without a strategy, keeping the color
+    of a crazy card to the one it holds the most of.
+    """
+    def __init__(self, exploration: float) -> None:
+        self.exploration = exploration
+        self.node = None
+        self.path = []
+        self.color = None
+
+    def start(self, root: Node) -> None:
+        self.node = root
+        self.path = [root]
+        self.color = None
+
+    def choose_card(self, game, player: Player) -> int | None:
+        node = self.node
+        if node is None:
+            self.color = None
+            return player.first_playable(game.current_color, game.current_label)
+        actions = legal_actions(game, player)
+        if not actions:
+            return None
+
+        # ISMCTS selection: only the moves possible in this sample compete, and each is scored
+        # against the number of times it was possible rather than the visits of the parent
+        best = None
+        best_score = -1.0
+        untried = None
+        for action in actions:
+            child = node.children.get(action)
+            if child is None:
+                if untried is None:
+                    untried = action
+                continue
+            child.available += 1
+            score = child.wins / child.visits + self.exploration * math.sqrt(math.log(child.available) / child.visits)
+            if score > best_score:
+                best, best_score = action, score
+
+        if untried is not None:
+            # Expand one move, then play the rest of the game without the tree
+            best = untried
+            child = node.children[best] = Node()
+            child.available = 1
+            self.node = None
+        else:
+            child = node.children[best]
+            self.node = child
+        self.path.append(child)
+        rank, self.color = best
+        return player.rank_index(rank)
+
+    def choose_color(self, game, player: Player) -> CardColor:
+        color, self.color = self.color, None
+        return color if color is not None else favourite_color(player)
+
+
+class MCTSStrategy(Strategy):
+    """
+    Determinized Monte Carlo tree search (information set MCTS with a single observer).
+
+    For every decision the strategy samples the cards it cannot see (see determinize), loads the
+    sample into a scratch game of its own through Game.restore, and plays it to the end with
+    steps() on a NullSink: its own moves follow the search tree, everybody else plays like a
+    player without a strategy. The move tried most often is played. A card and its color are one
+    move, so the color of a CRAZY or DRAW_FOUR card is part of the search. A crazy card drawn and
+    played straight away is given the color the player holds the most of.
+
+    The search of a decision stops after max_iterations samples or time_budget seconds, whichever
+    comes first. The subtree of the move played is kept for the next decision of the same game.
+    """
+    def __init__(self, time_budget: float | None = 0.01, max_iterations: int = None,
+                 exploration: float = 0.7, rollout_rounds: int = 200, seed: int = None) -> None:
+        """
+        Constructor for the MCTSStrategy class
+
+        Args:
+            time_budget (float | None): Most seconds of search per decision, None for no limit
+            max_iterations (int): Most samples per decision, None for no limit
+            exploration (float): The UCB1 exploration constant
+            rollout_rounds (int): Rounds a sample is played for at most, after which it counts as a draw
+            seed (int): Seed of the strategy's own generator, which samples the games
+
+        Raises:
+            ValueError: If neither time_budget nor max_iterations is given
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if time_budget is None and max_iterations is None:
+            raise ValueError("A search needs a time budget or a number of iterations")
+        self.time_budget = time_budget
+        self.max_iterations = max_iterations
+        self.rollout_rounds = rollout_rounds
+        self.rng = RandomStream(seed)
+        self.policy = _SearchPolicy(exploration)
+        self.root = None
+        self.color = None
+        self.iterations = 0
+        self._scratch = None
+        self._game = None
+        self._round = 0
+
+    def choose_card(self, game, player: Player) -> int | None:
+        """
+        Method to search the best move and play its card, see Strategy.choose_card
+
+        Complexity:
+            Best Case Complexity: O(1) when there is at most one move
+            Worst Case Complexity: O(I * T) where I is the number of samples and T the cost of playing one
+        """
+        actions = legal_actions(game, player)
+        if not actions:
+            self.color = None
+            return None
+
+        root = self._root(game)
+        if len(actions) == 1:
+            action = actions[0]
+        else:
+            self._search(game, root)
+            action = max(actions, key=lambda move: root.children[move].visits if move in root.children else -1)
+
+        # Keep the subtree of the move for the next decision
+        self.root = root.children.get(action)
+        rank, self.color = action
+        return player.rank_index(rank)
+
+    def choose_color(self, game, player: Player) -> CardColor:
+        """
+        Method to give the color of the move chosen by choose_card, see Strategy.choose_color
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        color, self.color = self.color, None
+        return color if color is not None else favourite_color(player)
+
+    def _root(self, game: Game) -> Node:
+        """ The node of this decision: the subtree kept from the last one, unless the game changed. """
+        if game is not self._game or game.round_count <= self._round or self.root is None:
+            self.root = Node()
+        self._game = game
+        self._round = game.round_count
+        return self.root
+
+    @staticmethod
+    def _reward(scratch: Game, me: Player) -> float:
+        """
+        The result of a sample for the searching player: 1 for a win, 0 for a loss. A sample
+        that stopped without a winner scores the share of the other players with more cards,
+        or 0 at a table with no other player.
+        """
+        if scratch.result == GameResult.WIN:
+            return 1.0 if scratch.winner is me else 0.0
+        if scratch.num_players == 1:
+            return 0.0
+        cards = len(me)
+        score = 0.0
+        for seat in range(scratch.num_players):
+            other = len(scratch.turn_order[seat])
+            if other > cards:
+                score += 1.0
+            elif other == cards and scratch.turn_order[seat] is not me:
+                score += 0.5
+        return score / (scratch.num_players - 1)
+
+    def _scratch_game(self, num_players: int) -> Game:
+        """ The game samples are played in, made once per number of players. """
+        scratch = self._scratch
+        if scratch is None or scratch.num_players != num_players:
+            players: ArrayR[Player] = ArrayR(num_players)
+            for seat in range(num_players):
+                players[seat] = Player(f"Sample {seat}", seat)
+            scratch = Game(NullSink(), RandomStream(0))
+            scratch.initialise_game(players)
+            self._scratch = scratch
+        return scratch
+
+    def _search(self, game: Game, root: Node) -> None:
+        """
+        Method to run the samples of a decision from root
+
+        Complexity:
+            Best Case Complexity: O(I * T) where I is the number of samples and T the cost of playing one
+            Worst Case Complexity: O(I * T) where I is the number of samples and T the cost of playing one
+        """
+        seat = game.turn_order.index
+        snapshot = game.snapshot()
+        scratch = self._scratch_game(game.num_players)
+        me = scratch.turn_order[seat]
+        me.strategy = self.policy
+        policy, rng = self.policy, self.rng
+        deadline = None if self.time_budget is None else time.perf_counter() + self.time_budget
+
+        iterations = 0
+        try:
+            while self.max_iterations is None or iterations < self.max_iterations:
+                if deadline is not None and iterations and time.perf_counter() >= deadline:
+                    break
+                scratch.restore(determinize(snapshot, seat, rng))
+                scratch.rng.seed = rng.random()
+                # The snapshot is taken during the round, which steps() starts again
+                scratch.round_count -= 1
+                scratch.max_rounds = scratch.round_count + self.rollout_rounds
+                policy.start(root)
+                for _ in scratch.steps():
+                    pass
+
+                reward = self._reward(scratch, me)
+                for node in policy.path:
+                    node.visits += 1
+                    node.wins += reward
+                iterations += 1
+        finally:
+            me.strategy = None
+        self.iterations = iterations
+
+
+if __name__ == '__main__':
+    p = argparse.ArgumentParser(description="Play headless seeded games with an MCTS player at seat 0 against players without a strategy.")
+    p.add_argument("--games", type=int, default=50)
+    p.add_argument("--players", type=int, default=4)
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--budget", type=float, default=0.01, help="seconds of search per decision")
+    p.add_argument("--iterations", type=int, default=None, help="samples per decision")
+    args = p.parse_args()
+
+    wins = 0
+    decisions = 0
+    start = time.perf_counter()
+    for seed in range(args.seed, args.seed + args.games):
+        strategy = MCTSStrategy(args.budget, args.iterations, seed=seed)
+        players: ArrayR[Player] = ArrayR(args.players)
+        for seat in range(args.players):
+            players[seat] = Player(f"Player {seat}", seat, strategy if seat == 0 else None)
+        game = Game(NullSink(), RandomStream(seed))
+        game.initialise_game(players)
+        winner = game.play_game()
+        wins += winner is players[0]
+    elapsed = time.perf_counter() - start
+    print(f"MCTS player won {wins} of {args.games} games ({wins / args.games:.0%}, "
+          f"{1 / args.players:.0%} expected without search), {elapsed / args.games:.2f} s per game")
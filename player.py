@@ -5,21 +5,99 @@ __FILE__ = "player.py"
 __author__ = "<Ter Jing Hao>"
 __student_ID__ = "34857613"
 
-from card import Card
+from card import Card, CardColor, CardLabel
 from constants import Constants
 from data_structures.array_sorted_list import ArraySortedList
+from data_structures.array_view import ArrayView
+
+# Bit masks over card ranks (color * NUM_MAX_VALS + label): every label of a color, every color of a label
+_ROW_MASKS = tuple(((1 << Constants.NUM_MAX_VALS) - 1) << (color * Constants.NUM_MAX_VALS)
+                   for color in range(Constants.NUM_COLORS))
+_COLUMN_MASKS = tuple(sum(1 << (color * Constants.NUM_MAX_VALS + label) for color in range(Constants.NUM_COLORS))
+                      for label in range(Constants.NUM_MAX_VALS))
+
+
+def playable_mask(color: CardColor, label: CardLabel) -> int:
+    """
+    Method to get the ranks of the cards that can be played on the given color and label as a bit mask
+
+    Args:
+        color (CardColor): The current color of the game
+        label (CardLabel): The current label of the game
+
+    Returns:
+        int: Bit r is set if a card of rank r can be played: the color row OR the label column OR the CRAZY row
+
+    Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1)
+    """
+    return _ROW_MASKS[color] | _COLUMN_MASKS[label] | _ROW_MASKS[CardColor.CRAZY]
+
+
+class Strategy:
+    """
+    Base class for the decisions of a player. Players without a strategy play the first playable
+    card of their sorted hand and leave the color after a crazy card to the game's generator, which
+    is what this class does too; subclasses override the decisions they make differently.
+    """
+    def choose_card(self, game, player: 'Player') -> int | None:
+        """
+        Method to choose the card to play at the start of the player's turn
+
+        Args:
+            game (Game): The game, with the current color and label of the turn
+            player (Player): The player whose turn it is
+
+        Returns:
+            int | None: The index in the hand of a playable card, None only if no card can be played
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return player.first_playable(game.current_color, game.current_label)
+
+    def choose_color(self, game, player: 'Player') -> CardColor:
+        """
+        Method to choose the new color after the player played a CRAZY or DRAW_FOUR card
+
+        Args:
+            game (Game): The game
+            player (Player): The player who played the crazy card
+
+        Returns:
+            CardColor: One of RED, BLUE, GREEN and YELLOW
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return CardColor(game.rng.randint(0, 3))
+
 
 class Player:
     """
     Player class to store the player details
+
+    Next to the sorted hand, the player keeps an index of the hand: the number of cards of every
+    (color, label) pair, a 5 x 15 count matrix laid out row by row in the same order as the hand,
+    the number of cards of every color and of every label, and a bit mask of the pairs held. The
+    CRAZY color is the wild bucket. The hand must only be changed through add_card and play_card
+    so that the index stays in sync.
+
+    A player may have a Strategy, which the game asks for the card to play and the color to choose.
     """
-    def __init__(self, name: str, position: int) -> None:
+    INITIAL_HAND_CAPACITY = 8
+
+    def __init__(self, name: str, position: int, strategy: Strategy = None) -> None:
         """
         Constructor for the Player class
 
         Args:
             name (str): The name of the player
             position (int): The position of the player
+            strategy (Strategy): The decisions of the player, None to play the first playable card
 
         Returns:
             None
@@ -30,7 +108,13 @@ class Player:
         """
         self.name = name
         self.position = position
-        self.hand = ArraySortedList(Constants.DECK_SIZE)  # Using DECK_SIZE from Constants
+        self.strategy = strategy
+        # Starts small and grows with the hand, then shrinks back once most cards are played
+        self.hand = ArraySortedList(self.INITIAL_HAND_CAPACITY, shrink=True)
+
+        # Index of the hand: cards per (color, label) pair at the card rank, cards per color and
+        # per label, and bit r of held set when the hand has a card of rank r
+        self._clear_index()
 
     def add_card(self, card: Card) -> None:
         """
@@ -47,6 +131,62 @@ class Player:
             Worst Case Complexity: O(n) shifting elements for insertion
         """
         self.hand.add(card)
+        self.card_counts[card.rank] += 1
+        self.color_counts[card.color] += 1
+        self.label_counts[card.label] += 1
+        self.held |= 1 << card.rank
+
+    def add_cards(self, cards) -> None:
+        """
+        Method to add several cards to the player's hand at once, e.g. when dealing or for a penalty
+
+        Args:
+            cards: The cards to be added, any iterable of Card such as a list, an ArrayR or a generator
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(m log m + n) where m is the number of cards and n the size of the hand
+            Worst Case Complexity: O(m log m + n) where m is the number of cards and n the size of the hand
+        """
+        if not hasattr(cards, '__len__'):
+            # The cards are gone through twice, for the hand and for its index
+            cards = list(cards)
+        self.hand.add_all(cards)
+        card_counts, color_counts, label_counts = self.card_counts, self.color_counts, self.label_counts
+        held = self.held
+        for card in cards:
+            card_counts[card.rank] += 1
+            color_counts[card.color] += 1
+            label_counts[card.label] += 1
+            held |= 1 << card.rank
+        self.held = held
+
+    def restore_hand(self, cards) -> None:
+        """
+        Method to replace the hand by cards that are already in hand order, e.g. from Game.snapshot
+
+        Args:
+            cards: The cards of the new hand in hand order, a sequence of Card such as a list
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(m) where m is the number of cards, without comparing any
+            Worst Case Complexity: O(m) where m is the number of cards, without comparing any
+        """
+        self.clear_hand()
+        self.hand.extend_sorted(cards)
+        card_counts, color_counts, label_counts = self.card_counts, self.color_counts, self.label_counts
+        held = 0
+        for card in cards:
+            card_counts[card.rank] += 1
+            color_counts[card.color] += 1
+            label_counts[card.label] += 1
+            held |= 1 << card.rank
+        self.held = held
 
     def play_card(self, index: int) -> Card:
         """
@@ -62,7 +202,172 @@ class Player:
             Best Case Complexity: O(1)
             Worst Case Complexity: O(n)
         """
-        return self.hand.delete_at_index(index)
+        card = self.hand.delete_at_index(index)
+        self.card_counts[card.rank] -= 1
+        self.color_counts[card.color] -= 1
+        self.label_counts[card.label] -= 1
+        if self.card_counts[card.rank] == 0:
+            self.held &= ~(1 << card.rank)
+        return card
+
+    def clear_hand(self) -> None:
+        """
+        Method to remove every card from the player's hand
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.hand.reset()
+        self._clear_index()
+
+    def _clear_index(self) -> None:
+        """
+        Method to set every count of the hand index back to zero
+
+        The counts are bytearrays, which are allocated already zeroed, so clearing is a fresh
+        allocation rather than a write per count. A count never exceeds DECK_SIZE, below 256.
+
+        Complexity:
+            Best Case Complexity: O(1) for a fixed number of colors and labels
+            Worst Case Complexity: O(1) for a fixed number of colors and labels
+        """
+        self.card_counts = bytearray(Constants.NUM_COLORS * Constants.NUM_MAX_VALS)
+        self.color_counts = bytearray(Constants.NUM_COLORS)
+        self.label_counts = bytearray(Constants.NUM_MAX_VALS)
+        self.held = 0
+
+    def has_playable(self, color: CardColor, label: CardLabel) -> bool:
+        """
+        Method to check if any card of the hand can be played on the given color and label
+
+        Args:
+            color (CardColor): The current color of the game
+            label (CardLabel): The current label of the game
+
+        Returns:
+            bool: True if the hand has a card of that color, with that label, or of the CRAZY color
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return self.held & playable_mask(color, label) != 0
+
+    def count_playable(self, color: CardColor, label: CardLabel) -> int:
+        """
+        Method to count the cards of the hand that can be played on the given color and label
+
+        Args:
+            color (CardColor): The current color of the game
+            label (CardLabel): The current label of the game
+
+        Returns:
+            int: The number of cards of that color, with that label, or of the CRAZY color
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        crazy = CardColor.CRAZY
+        # The color row, the CRAZY row, and what the label column adds outside of both rows
+        count = self.color_counts[color] + self.label_counts[label]
+        count -= self.card_counts[color * Constants.NUM_MAX_VALS + label]
+        if color != crazy:
+            count += self.color_counts[crazy] - self.card_counts[crazy * Constants.NUM_MAX_VALS + label]
+        return count
+
+    def first_playable(self, color: CardColor, label: CardLabel) -> int | None:
+        """
+        Method to find the first card of the hand that can be played on the given color and label,
+        i.e. the first card of that color, with that label, or of the CRAZY color
+
+        This is the card a scan of the hand from index 0 would stop at, found through the index
+        instead: the lowest bit of the held cards within playable_mask is the smallest playable
+        card, and its position is the number of cards sorted before it.
+
+        Args:
+            color (CardColor): The current color of the game
+            label (CardLabel): The current label of the game
+
+        Returns:
+            int | None: The index of the card in the hand, or None if no card can be played
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(C + L) where C is the number of colors and L the number of labels, both constant
+        """
+        playable = self.held & playable_mask(color, label)
+        if not playable:
+            return None
+
+        # The lowest playable rank is the first playable card of the sorted hand
+        return self.rank_index((playable & -playable).bit_length() - 1)
+
+    def rank_index(self, rank: int) -> int:
+        """
+        Method to find where the cards of a rank (see Card.rank) are, or would be, in the hand
+
+        Args:
+            rank (int): The rank of the card
+
+        Returns:
+            int: The number of cards of the hand sorted before the rank, i.e. the index of its first card if held
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(C + L) where C is the number of colors and L the number of labels, both constant
+        """
+        counts = self.card_counts
+
+        # Every card of a smaller color, then the smaller labels of the same color
+        color = rank // Constants.NUM_MAX_VALS
+        index = 0
+        for other_color in range(color):
+            index += self.color_counts[other_color]
+        for key in range(color * Constants.NUM_MAX_VALS, rank):
+            index += counts[key]
+        return index
+
+    def cards_of_color(self, color: CardColor) -> ArrayView[Card]:
+        """
+        Method to get every card of a color in the hand, without scanning or copying the hand
+
+        The hand is sorted by color first, so the cards of a color are consecutive: the index
+        gives where they start and how many there are. The view is only valid until the hand changes.
+
+        Args:
+            color (CardColor): The color of the cards
+
+        Returns:
+            ArrayView[Card]: The cards of the color, in hand order
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(C + L) where C is the number of colors and L the number of labels, both constant
+        """
+        return ArrayView(self.hand.array, self.rank_index(color * Constants.NUM_MAX_VALS), self.color_counts[color])
+
+    def cards_of(self, color: CardColor, label: CardLabel) -> ArrayView[Card]:
+        """
+        Method to get every card of a color with a label in the hand, without scanning or copying the hand
+
+        Args:
+            color (CardColor): The color of the cards
+            label (CardLabel): The label of the cards
+
+        Returns:
+            ArrayView[Card]: The matching cards, all alike. The view is only valid until the hand changes.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(C + L) where C is the number of colors and L the number of labels, both constant
+        """
+        rank = color * Constants.NUM_MAX_VALS + label
+        return ArrayView(self.hand.array, self.rank_index(rank), self.card_counts[rank])
 
     def __len__(self) -> int:
         """
@@ -107,4 +412,30 @@ class Player:
             Best Case Complexity: O(n)
             Worst Case Complexity: O(n)
         """
-        return f"Player {self.name} (position {self.position}): {[str(self.hand[i]) for i in range(len(self.hand))]}"
+        return f"Player {self.name} (position {self.position}): {self.hand_text()}"
+
+    def cards(self) -> ArrayView[Card]:
+        """
+        Method to get the cards of the hand in order, without copying them
+
+        Returns:
+            ArrayView[Card]: The cards of the hand. The view is only valid until the hand changes.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return self.hand.view()
+
+    def hand_text(self) -> str:
+        """
+        Method to show the hand like a list of the card names, e.g. ['RED ONE', 'CRAZY CRAZY']
+
+        Returns:
+            str: The names of the cards of the hand, in order
+
+        Complexity:
+            Best Case Complexity: O(n)
+            Worst Case Complexity: O(n)
+        """
+        return "[" + ", ".join(repr(str(card)) for card in self.cards()) + "]"
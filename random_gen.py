@@ -4,13 +4,33 @@ Random number generator class. Uses LCG method with some reasonable initialisati
 __author__ = "Jackson Goerner"
 
 import time
+from array import array
 
+try:
+    import numpy as np
+except ImportError:  # random_block falls back to a plain loop
+    np = None
 
-class RandomGen:
+
+class _DefaultStream(type):
+    """ Gives RandomGen a seed attribute that reads and writes the seed of the default stream. """
+
+    @property
+    def seed(cls) -> int:
+        return _default.seed
+
+    @seed.setter
+    def seed(cls, seed: int) -> None:
+        _default.seed = seed
+
+
+class RandomGen(metaclass=_DefaultStream):
     """
     Class used to generate (seeded) random numbers for interesting outcomes and repeatable tests.
 
     Uses LCG method. All methods are O(1) best/worst case time complexity unless stated otherwise.
+    The methods work on a module-level RandomStream, so RandomGen and a RandomStream seeded alike
+    produce the same values; RandomGen.seed is the seed of that stream.
 
     Usage:
     ```
@@ -18,6 +38,8 @@ class RandomGen:
     RandomGen.random()           # Random number from 0 to 2^32-1
     RandomGen.randint(1, 10)     # Random number from 1 to 10
     RandomGen.random_chance(0.33) # True 33% of the time, False 67% of the time.
+    RandomGen.random_shuffle(cards, mode=RandomGen.FISHER_YATES) # In-place linear shuffle
+    RandomGen.random_block(1000) # The next 1000 values of random(), in one buffer
     ```
     """
 
@@ -25,48 +47,291 @@ class RandomGen:
     A: int = 25214903917
     C: int = 11
 
-    seed = time.time_ns()
+    # Algorithms of random_shuffle. LEGACY sorts on random keys and stays the default so that
+    # seeded games are unchanged; FISHER_YATES is linear and shuffles in place.
+    LEGACY: str = "legacy"
+    FISHER_YATES: str = "fisher_yates"
+    shuffle_mode: str = LEGACY
 
     @classmethod
     def set_seed(cls, seed: int = None) -> None:
         """Seed all future calls to `random`."""
-        seed = time.time_ns() if seed is None else seed
-        cls.seed = seed
+        _default.seed = time.time_ns() if seed is None else seed
 
     @classmethod
     def random(cls) -> int:
         """Returns a random integer from 0 to 2^32-1"""
-        cls.seed = (cls.A * cls.seed + cls.C) % cls.MOD
-        return cls.seed >> 16
+        return _default.random()
 
     @classmethod
     def random_float(cls) -> float:
         """Returns a random floating point integer in the range 0 to 1."""
-        return cls.random() / (1 << 32)
+        return _default.random_float()
 
     @classmethod
     def randint(cls, lo: int, hi: int) -> int:
         """Returns a random integer from `lo` to `hi` inclusive on both ends."""
-        return (cls.random() % (hi - lo + 1)) + lo
+        return _default.randint(lo, hi)
 
     @classmethod
     def random_chance(cls, ratio: float) -> bool:
         """Returns random()/2^32 < ratio"""
-        return cls.random_float() < ratio
+        return _default.random_chance(ratio)
 
     @classmethod
     def random_choice(cls, collection) -> None:
         """Returns a random choice from a collection that supports __getitem__ and __len__"""
-        return collection[cls.randint(0, len(collection)-1)]
+        return _default.random_choice(collection)
 
     @classmethod
-    def random_shuffle(cls, collection) -> None:
+    def random_shuffle(cls, collection, length: int = None, mode: str = None) -> None:
         """
         Randomly shuffles a collection that supports __getitem__, __setitem__ and __len__
-        :complexity: O(len(collection))
+        If length is given, only the first length elements are shuffled.
+        mode is LEGACY or FISHER_YATES and defaults to `shuffle_mode`. The two modes give
+        different orders for the same seed.
+        :complexity: O(n log n) for LEGACY, O(n) for FISHER_YATES, where n is length
+        :raises ValueError: if the mode is unknown
         """
-        positions = [(RandomGen.random(), i) for i in range(len(collection))]
+        _default.random_shuffle(collection, length, mode)
+
+    @classmethod
+    def random_block(cls, n: int):
+        """
+        Returns the next n values of random() in one buffer, see RandomStream.random_block.
+        :complexity: O(n)
+        """
+        return _default.random_block(n)
+
+    @classmethod
+    def jump(cls, n: int) -> None:
+        """
+        Advances the global stream by n values without generating them.
+        :complexity: O(log n)
+        """
+        _default.jump(n)
+
+
+def jump_coefficients(n: int) -> tuple[int, int]:
+    """
+    Returns (a, c) such that n steps of the LCG take any seed s to (a * s + c) % MOD.
+    Composes the affine step with itself by repeated squaring.
+    :complexity: O(log n)
+    """
+    mod = RandomGen.MOD
+    step_a, step_c = RandomGen.A, RandomGen.C
+    a, c = 1, 0
+    while n > 0:
+        if n & 1:
+            a, c = (a * step_a) % mod, (c * step_a + step_c) % mod
+        step_a, step_c = (step_a * step_a) % mod, (step_c * (step_a + 1)) % mod
+        n >>= 1
+    return a, c
+
+
+# Values of the generator taken at a time by the Fisher-Yates shuffle
+_SHUFFLE_BLOCK = 4096
+
+# Coefficients (A^k, C_k) % MOD of k steps of the LCG for k = 1, 2, ..., _SHUFFLE_BLOCK, grown on demand
+# by random_block. Longer blocks are computed _SHUFFLE_BLOCK values at a time so the table stays small.
+_block_a = None
+_block_c = None
+
+
+def _block_coefficients(n: int):
+    """
+    Returns numpy arrays a, c of at least n entries such that k + 1 steps take a seed s to
+    (a[k] * s + c[k]) % MOD, for n up to _SHUFFLE_BLOCK. The table doubles, using
+    (a[m + j], c[m + j]) = (a[j] * a[m - 1], a[j] * c[m - 1] + c[j]).
+    uint64 arithmetic wraps modulo 2^64, which is a multiple of MOD, so masking afterwards is exact.
+    :complexity: O(n) amortised over the calls
+    """
+    global _block_a, _block_c
+    if _block_a is None:
+        _block_a = np.array([RandomGen.A], dtype=np.uint64)
+        _block_c = np.array([RandomGen.C], dtype=np.uint64)
+    mask = np.uint64(RandomGen.MOD - 1)
+    while len(_block_a) < n:
+        step_a, step_c = _block_a[-1], _block_c[-1]
+        new_a = (_block_a * step_a) & mask
+        new_c = (_block_a * step_c + _block_c) & mask
+        _block_a = np.concatenate((_block_a, new_a))
+        _block_c = np.concatenate((_block_c, new_c))
+    return _block_a, _block_c
+
+
+def _random_block(gen, n: int):
+    """
+    Returns the next n values of gen.random(), exactly as n calls would, and advances gen past them.
+
+    With numpy, the states of each run of _SHUFFLE_BLOCK values are computed at once from the
+    seed before them and the coefficients of k steps, and a uint64 numpy array is returned.
+    Without numpy, the generator is stepped in a plain loop into an array('Q').
+    :complexity: O(n)
+    """
+    if n <= 0:
+        return np.zeros(0, dtype=np.uint64) if np is not None else array('Q')
+    if np is not None:
+        a, c = _block_coefficients(min(n, _SHUFFLE_BLOCK))
+        mask = np.uint64(RandomGen.MOD - 1)
+        # Any int is a valid seed, reduce it to the state it stands for before it fits in a uint64
+        seed = np.uint64(gen.seed % RandomGen.MOD)
+        values = np.empty(n, dtype=np.uint64)
+        for start in range(0, n, _SHUFFLE_BLOCK):
+            size = min(_SHUFFLE_BLOCK, n - start)
+            states = (a[:size] * seed + c[:size]) & mask
+            seed = states[-1]
+            values[start:start + size] = states >> np.uint64(16)
+        gen.seed = int(seed)
+        return values
+
+    mult, inc, mod = RandomGen.A, RandomGen.C, RandomGen.MOD
+    seed = gen.seed
+    values = array('Q', bytes(8 * n))
+    for i in range(n):
+        seed = (mult * seed + inc) % mod
+        values[i] = seed >> 16
+    gen.seed = seed
+    return values
+
+
+def _legacy_shuffle(gen, collection, length: int) -> None:
+    """ Sorts the first length elements on (random value, index) keys drawn from gen. """
+    keys = _random_block(gen, length)
+    if np is not None:
+        # A stable sort on the values is the sort on (value, index)
+        order = np.argsort(keys, kind="stable").tolist()
+    else:
+        positions = [(keys[i], i) for i in range(length)]
         positions.sort() # I can use inbuilt list sorting here - YOU CANNOT ANYWHERE ELSE! >:D
-        tmp = [collection[p[1]] for p in positions]
-        for x in range(len(collection)):
-            collection[x] = tmp[x]
+        order = [p[1] for p in positions]
+    tmp = [collection[i] for i in order]
+    for x in range(length):
+        collection[x] = tmp[x]
+
+
+def _fisher_yates(gen, collection, length: int) -> None:
+    """
+    In-place Fisher-Yates shuffle: for i from the end, swap element i with gen.randint(0, i).
+    With numpy the swap targets are computed a block of _SHUFFLE_BLOCK values at a time,
+    otherwise the generator is stepped inline, which is equivalent to calling randint.
+    :complexity: O(length), temporary storage bounded by _SHUFFLE_BLOCK
+    """
+    if np is not None:
+        for top in range(length - 1, 0, -_SHUFFLE_BLOCK):
+            bottom = max(top - _SHUFFLE_BLOCK, 0)
+            values = _random_block(gen, top - bottom)
+            targets = (values % np.arange(top + 1, bottom + 1, -1, dtype=np.uint64)).tolist()
+            for i, j in zip(range(top, bottom, -1), targets):
+                collection[i], collection[j] = collection[j], collection[i]
+        return
+
+    a, c, mod = RandomGen.A, RandomGen.C, RandomGen.MOD
+    seed = gen.seed
+    for i in range(length - 1, 0, -1):
+        seed = (a * seed + c) % mod
+        j = (seed >> 16) % (i + 1)
+        collection[i], collection[j] = collection[j], collection[i]
+    gen.seed = seed
+
+
+class RandomStream:
+    """
+    Independent random number generator keeping its own seed. RandomGen is a thin class-level
+    front to one of these, so a RandomStream and RandomGen seeded alike produce the same values,
+    and either can be passed where a generator is expected (see Game).
+
+    All methods are O(1) best/worst case time complexity unless stated otherwise.
+
+    Usage:
+    ```
+    master = RandomStream(123)
+    streams = master.split(4)    # Non-overlapping substreams, e.g. one per worker
+    streams[0].randint(1, 10)
+    master.jump(10 ** 9)         # Skip a billion values in O(log n)
+    ```
+    """
+    # Values each substream may use before running into the next one
+    SUBSTREAM_STRIDE: int = pow(2, 32)
+
+    def __init__(self, seed: int = None) -> None:
+        """Creates a stream, seeded like RandomGen.set_seed."""
+        self.seed = time.time_ns() if seed is None else seed
+
+    def random(self) -> int:
+        """Returns a random integer from 0 to 2^32-1"""
+        self.seed = (RandomGen.A * self.seed + RandomGen.C) % RandomGen.MOD
+        return self.seed >> 16
+
+    def random_float(self) -> float:
+        """Returns a random floating point integer in the range 0 to 1."""
+        return self.random() / (1 << 32)
+
+    def randint(self, lo: int, hi: int) -> int:
+        """Returns a random integer from `lo` to `hi` inclusive on both ends."""
+        return (self.random() % (hi - lo + 1)) + lo
+
+    def random_chance(self, ratio: float) -> bool:
+        """Returns random()/2^32 < ratio"""
+        return self.random_float() < ratio
+
+    def random_choice(self, collection):
+        """Returns a random choice from a collection that supports __getitem__ and __len__"""
+        return collection[self.randint(0, len(collection)-1)]
+
+    def random_shuffle(self, collection, length: int = None, mode: str = None) -> None:
+        """
+        Randomly shuffles a collection that supports __getitem__, __setitem__ and __len__
+        If length is given, only the first length elements are shuffled.
+        mode is RandomGen.LEGACY or RandomGen.FISHER_YATES and defaults to RandomGen.shuffle_mode.
+        :complexity: O(n log n) for LEGACY, O(n) for FISHER_YATES, where n is length
+        :raises ValueError: if the mode is unknown
+        """
+        if length is None:
+            length = len(collection)
+        if mode is None:
+            mode = RandomGen.shuffle_mode
+        if mode == RandomGen.FISHER_YATES:
+            _fisher_yates(self, collection, length)
+        elif mode == RandomGen.LEGACY:
+            _legacy_shuffle(self, collection, length)
+        else:
+            raise ValueError(f"Unknown shuffle mode {mode!r}")
+
+    def random_block(self, n: int):
+        """
+        Returns the next n values of random() in one buffer: a numpy uint64 array if numpy is
+        installed, an array('Q') otherwise. The stream moves past them, as after n calls.
+        :complexity: O(n)
+        """
+        return _random_block(self, n)
+
+    def jump(self, n: int) -> None:
+        """
+        Advances the stream by n values without generating them.
+        :complexity: O(log n)
+        """
+        a, c = jump_coefficients(n)
+        self.seed = (a * self.seed + c) % RandomGen.MOD
+
+    def substream(self, index: int, stride: int = None) -> 'RandomStream':
+        """
+        Returns a new stream starting index * stride values after the current state of this one.
+        Substreams with different indices do not overlap for their first stride values.
+        stride defaults to SUBSTREAM_STRIDE.
+        :complexity: O(log(index * stride))
+        """
+        stream = RandomStream(self.seed)
+        stream.jump(index * (self.SUBSTREAM_STRIDE if stride is None else stride))
+        return stream
+
+    def split(self, count: int, stride: int = None) -> list['RandomStream']:
+        """
+        Returns substreams 0 to count - 1 of this stream, see substream.
+        :complexity: O(count * log(count * stride))
+        """
+        return [self.substream(i, stride) for i in range(count)]
+
+
+# The stream behind the class-level RandomGen methods
+_default = RandomStream(time.time_ns())
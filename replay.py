@@ -0,0 +1,446 @@
+"""
+Fit 1008 Assignment 1
+"""
+__FILE__ = "replay.py"
+__author__ = "<Ter Jing Hao>"
+__student_ID__ = "34857613"
+
+import struct
+from enum import auto, IntEnum
+
+from card import CardColor, CardLabel, card_id
+from constants import Constants
+from events import EventSink
+from game import Game, GameResult
+
+
+class Op(IntEnum):
+    """
+    Enum class for the record types of a replay log
+
+    Every record is one opcode byte followed by its payload (little endian):
+        DEAL      length (I) and Game.snapshot() of the dealt game
+        START     seat (H) of the first player
+        ROUND     no payload, a round starts for the current seat
+        PLAY      seat (H) and card id (B) put from the hand onto the discard pile
+        DRAW      seat (H) and card id (B) taken from the draw pile into the hand
+        RESHUFFLE count (H) and the card ids of the new draw pile, bottom to top
+        COLOR     color (B) chosen after a crazy card
+        REVERSE   no payload
+        SKIP      seat (H) the turn moves to because of a skip
+        PENALTY   seat (H) and number of cards (B), the turn moves to the penalised seat
+        WIN       seat (H) of the winner
+        TURN      seat (H) the turn passes to
+        DRAWN     GameResult (B) of a game that ended without a winner
+
+    A finished game ends with a WIN or DRAWN record and nothing comes after it, so a log without
+    one was cut off before the end of the game.
+    """
+    DEAL = 0
+    START = auto()
+    ROUND = auto()
+    PLAY = auto()
+    DRAW = auto()
+    RESHUFFLE = auto()
+    COLOR = auto()
+    REVERSE = auto()
+    SKIP = auto()
+    PENALTY = auto()
+    WIN = auto()
+    TURN = auto()
+    DRAWN = auto()
+
+
+# Labels of the top card for which the next seat draws a penalty
+_PENALTY_LABELS = (CardLabel.DRAW_TWO, CardLabel.DRAW_FOUR)
+
+
+class ReplayError(ValueError):
+    """ The log is malformed or does not describe a legal sequence of moves. """
+    pass
+
+
+class ReplayLogSink(EventSink):
+    """
+    Sink that records a game as a compact, append-only binary log, see Op for the format.
+
+    Records are appended to an in-memory buffer and, if a stream is given, written to it as they
+    are produced. Only the draws and reshuffles need the game itself; the rest is the raw events.
+    """
+    def __init__(self, stream=None) -> None:
+        """
+        Constructor for the ReplayLogSink class
+
+        Args:
+            stream: Binary file-like object every record is also written to, or None
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.stream = stream
+        self.log = bytearray()
+        self.game = None
+        self.seats = {}
+
+    def getvalue(self) -> bytes:
+        """ Returns the log recorded so far. """
+        return bytes(self.log)
+
+    def _write(self, record: bytes) -> None:
+        self.log += record
+        if self.stream is not None:
+            self.stream.write(record)
+
+    def _seat_record(self, op: Op, player) -> None:
+        self._write(struct.pack("<BH", op, self.seats[id(player)]))
+
+    def game_dealt(self, game):
+        self.game = game
+        self.seats = {id(game.turn_order[seat]): seat for seat in range(len(game.turn_order))}
+        snapshot = game.snapshot()
+        self._write(struct.pack("<BI", Op.DEAL, len(snapshot)) + snapshot)
+
+    def game_started(self, player, color, label):
+        self._seat_record(Op.START, player)
+
+    def round_started(self, round_count, player, color, label):
+        self._write(bytes((Op.ROUND,)))
+
+    def card_played(self, player, card):
+        self._write(struct.pack("<BHB", Op.PLAY, self.seats[id(player)], card_id(card)))
+
+    def card_drawn(self, player, card):
+        self._write(struct.pack("<BHB", Op.DRAW, self.seats[id(player)], card_id(card)))
+
+    def turn_draw(self, player, card, playable):
+        # The drawn card is recorded in the hand by card_drawn, so playing it takes it out again
+        if playable:
+            self.card_played(player, card)
+
+    def reshuffled(self, num_cards):
+        ids = bytes(card_id(card) for card in self.game.draw_pile.view())
+        self._write(struct.pack("<BH", Op.RESHUFFLE, len(ids)) + ids)
+
+    def direction_reversed(self):
+        self._write(bytes((Op.REVERSE,)))
+
+    def player_skipped(self, player):
+        self._seat_record(Op.SKIP, player)
+
+    def color_chosen(self, color):
+        self._write(bytes((Op.COLOR, color)))
+
+    def penalty(self, player, num_cards):
+        self._write(struct.pack("<BHB", Op.PENALTY, self.seats[id(player)], num_cards))
+
+    def game_won(self, player, next_player):
+        self._seat_record(Op.WIN, player)
+
+    def turn_passed(self, player):
+        self._seat_record(Op.TURN, player)
+
+    def game_drawn(self, result, round_count):
+        self._write(bytes((Op.DRAWN, result)))
+
+
+class ReplayState:
+    """
+    State of a game rebuilt from a replay log. Cards are card ids.
+
+    Attributes:
+        draw_pile (bytearray): card ids from the bottom to the top of the draw pile
+        discard_pile (bytearray): card ids from the bottom to the top of the discard pile
+        hands (list[bytearray]): number of cards of every id, per seat
+        sizes (list[int]): number of cards per seat
+        color, label (int | None): current color and label
+        direction (int): 1 for clockwise, -1 for anti-clockwise
+        seat (int | None): the current seat, None before the game starts
+        round_count (int): number of rounds started
+        winner (int | None): seat of the winner once the game is over
+        result (GameResult | None): how the game ended, None until a WIN or DRAWN record
+        draws, reshuffles (int): number of cards drawn and of reshuffles so far
+    """
+    NUM_CARD_IDS = Constants.NUM_COLORS * Constants.NUM_MAX_VALS
+
+    def __init__(self, snapshot: bytes) -> None:
+        """
+        Constructor for the ReplayState class, from the snapshot of a DEAL record
+
+        Complexity:
+            Best Case Complexity: O(D + P) where D is the number of cards and P the number of players
+            Worst Case Complexity: O(D + P) where D is the number of cards and P the number of players
+        """
+        color, label, direction, seat, num_players, round_count, seed, num_draw, num_discard, reshuffles = \
+            struct.unpack_from(Game.SNAPSHOT_HEADER, snapshot)
+        offset = struct.calcsize(Game.SNAPSHOT_HEADER)
+        self.sizes = list(struct.unpack_from(f"<{num_players}H", snapshot, offset))
+        offset += 2 * num_players
+        self.draw_pile = bytearray(snapshot[offset:offset + num_draw])
+        offset += num_draw
+        self.discard_pile = bytearray(snapshot[offset:offset + num_discard])
+        offset += num_discard
+        self.hands = []
+        for size in self.sizes:
+            hand = bytearray(self.NUM_CARD_IDS)
+            for i in range(offset, offset + size):
+                hand[snapshot[i]] += 1
+            self.hands.append(hand)
+            offset += size
+
+        self.color = None if color == Game.NO_VALUE else color
+        self.label = None if label == Game.NO_VALUE else label
+        self.direction = direction
+        self.seat = None if seat == Game.NO_SEAT else seat
+        self.round_count = round_count
+        self.seed = seed
+        self.winner = None
+        self.result = None
+        self.draws = 0
+        self.reshuffles = reshuffles
+
+    def hand(self, seat: int) -> list[int]:
+        """ The card ids in the hand at the given seat, in hand order. """
+        return [card for card in range(self.NUM_CARD_IDS) for _ in range(self.hands[seat][card])]
+
+    def snapshot(self, seed: int = None) -> bytes:
+        """
+        Method to encode the state like Game.snapshot
+
+        The log does not follow the random number generator, so the seed to put in the snapshot can
+        be given. It defaults to the seed of the game when it was dealt.
+
+        Complexity:
+            Best Case Complexity: O(D + P) where D is the number of cards and P the number of players
+            Worst Case Complexity: O(D + P) where D is the number of cards and P the number of players
+        """
+        header = struct.pack(
+            Game.SNAPSHOT_HEADER,
+            Game.NO_VALUE if self.color is None else self.color,
+            Game.NO_VALUE if self.label is None else self.label,
+            self.direction,
+            Game.NO_SEAT if self.seat is None else self.seat,
+            len(self.sizes),
+            self.round_count,
+            self.seed if seed is None else seed,
+            len(self.draw_pile),
+            len(self.discard_pile),
+            self.reshuffles,
+        )
+        cards = bytearray(self.draw_pile)
+        cards += self.discard_pile
+        for seat in range(len(self.hands)):
+            cards += bytes(self.hand(seat))
+        return header + struct.pack(f"<{len(self.sizes)}H", *self.sizes) + cards
+
+
+class Replay:
+    """
+    Rebuilds every intermediate state of a game from its replay log, without running the rules or
+    the random number generator. Every record is checked against the state it applies to, so a
+    log that does not describe a legal sequence of moves raises a ReplayError: a card is played by
+    the seat whose turn it is, from its hand, and matches the top card or is a CRAZY card; a card
+    is drawn from the top of the draw pile by the seat whose turn it is, or by the next seat for the
+    penalty of a DRAW_TWO or DRAW_FOUR on top; a reshuffle takes the discard pile but its top card.
+    Which seat a SKIP, PENALTY or TURN record moves the turn to is not checked.
+    """
+    def __init__(self, log: bytes) -> None:
+        """
+        Constructor for the Replay class
+
+        Args:
+            log (bytes): A log recorded by a ReplayLogSink, starting with its DEAL record
+
+        Raises:
+            ReplayError: If the log does not start with a DEAL record
+        """
+        if len(log) < 5 or log[0] != Op.DEAL:
+            raise ReplayError("A replay log must start with a DEAL record")
+        self.log = log
+
+    def states(self):
+        """
+        Generator over the records of the log, yielding (op, state) after each record is applied
+
+        The same ReplayState object is yielded every time; copy what needs to outlive the next step,
+        for instance with state.snapshot().
+
+        Raises:
+            ReplayError: If a record does not match the state, follows the end of the game, or the
+                log is truncated
+
+        Complexity:
+            Best Case Complexity: O(L) where L is the length of the log
+            Worst Case Complexity: O(L) where L is the length of the log
+        """
+        log = self.log
+        (length,) = struct.unpack_from("<I", log, 1)
+        offset = 5 + length
+        state = ReplayState(log[5:offset])
+        yield Op.DEAL, state
+
+        end = len(log)
+        try:
+            while offset < end:
+                op = log[offset]
+                offset += 1
+                if state.result is not None:
+                    raise ReplayError(f"Record at byte {offset - 1} follows the end of the game")
+                if op == Op.ROUND:
+                    state.round_count += 1
+                elif op == Op.PLAY:
+                    seat, card = struct.unpack_from("<HB", log, offset)
+                    _check_move(state, seat, card, offset - 1)
+                    offset += 3
+                    if seat != state.seat:
+                        raise ReplayError(f"Seat {seat} plays out of turn")
+                    if state.hands[seat][card] == 0:
+                        raise ReplayError(f"Seat {seat} plays card {card} it does not have")
+                    color, label = divmod(card, Constants.NUM_MAX_VALS)
+                    if color != CardColor.CRAZY and color != state.color and label != state.label:
+                        raise ReplayError(f"Seat {seat} plays card {card} which does not match the top card")
+                    state.hands[seat][card] -= 1
+                    state.sizes[seat] -= 1
+                    state.discard_pile.append(card)
+                    state.color, state.label = divmod(card, Constants.NUM_MAX_VALS)
+                elif op == Op.DRAW:
+                    seat, card = struct.unpack_from("<HB", log, offset)
+                    _check_move(state, seat, card, offset - 1)
+                    offset += 3
+                    if seat != state.seat and not (state.seat is not None and state.label in _PENALTY_LABELS
+                                                   and seat == (state.seat + state.direction) % len(state.hands)):
+                        raise ReplayError(f"Seat {seat} draws out of turn")
+                    if not state.draw_pile or state.draw_pile[-1] != card:
+                        raise ReplayError(f"Seat {seat} draws card {card} which is not on top of the draw pile")
+                    state.draw_pile.pop()
+                    state.hands[seat][card] += 1
+                    state.sizes[seat] += 1
+                    state.draws += 1
+                elif op == Op.RESHUFFLE:
+                    (count,) = struct.unpack_from("<H", log, offset)
+                    offset += 2
+                    if offset + count > end:
+                        raise ReplayError(f"Truncated record at byte {offset}")
+                    cards = log[offset:offset + count]
+                    offset += count
+                    if state.draw_pile or not _same_cards(cards, state.discard_pile[:-1]):
+                        raise ReplayError("Reshuffled cards do not match the discard pile")
+                    state.draw_pile = bytearray(cards)
+                    state.discard_pile = state.discard_pile[-1:]
+                    state.reshuffles += 1
+                elif op == Op.COLOR:
+                    (state.color,) = struct.unpack_from("<B", log, offset)
+                    offset += 1
+                elif op == Op.REVERSE:
+                    state.direction = -state.direction
+                elif op == Op.PENALTY:
+                    (state.seat,) = struct.unpack_from("<H", log, offset)
+                    offset += 3
+                elif op in (Op.START, Op.SKIP, Op.TURN, Op.WIN):
+                    (state.seat,) = struct.unpack_from("<H", log, offset)
+                    offset += 2
+                    if op == Op.WIN:
+                        state.winner = state.seat
+                        state.result = GameResult.WIN
+                elif op == Op.DRAWN:
+                    (result,) = struct.unpack_from("<B", log, offset)
+                    offset += 1
+                    try:
+                        state.result = GameResult(result)
+                    except ValueError:
+                        state.result = None
+                    if state.result in (None, GameResult.WIN):
+                        raise ReplayError(f"Record at byte {offset - 2} ends a drawn game with result {result}")
+                else:
+                    raise ReplayError(f"Unknown record {op} at byte {offset - 1}")
+                yield Op(op), state
+        except struct.error as e:
+            raise ReplayError(f"Truncated record at byte {offset}") from e
+
+    def final_state(self, finished: bool = False) -> ReplayState:
+        """
+        Method to apply the whole log
+
+        Args:
+            finished (bool): Whether the log must record a game that is over
+
+        Returns:
+            ReplayState: The state after the last record
+
+        Raises:
+            ReplayError: If the log is not valid, or finished is set and the log has no WIN or
+                DRAWN record, i.e. it was cut off
+
+        Complexity:
+            Best Case Complexity: O(L) where L is the length of the log
+            Worst Case Complexity: O(L) where L is the length of the log
+        """
+        state = None
+        for _, state in self.states():
+            pass
+        if finished and state.result is None:
+            raise ReplayError("The log ends before the end of the game")
+        return state
+
+
+def _check_move(state: ReplayState, seat: int, card: int, offset: int) -> None:
+    """
+    Method to check that the seat and card of a PLAY or DRAW record exist
+
+    Raises:
+        ReplayError: If the seat is not at the table or the card id is not a card
+
+    Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1)
+    """
+    if seat >= len(state.hands):
+        raise ReplayError(f"Record at byte {offset} refers to a seat that does not exist")
+    if card >= ReplayState.NUM_CARD_IDS:
+        raise ReplayError(f"Record at byte {offset} refers to a card that does not exist")
+
+
+def _same_cards(cards: bytes, pile: bytes) -> bool:
+    """
+    Method to check that two sequences of card ids hold the same cards, in any order, by
+    counting the copies of every card id
+
+    Complexity:
+        Best Case Complexity: O(1) when the lengths differ
+        Worst Case Complexity: O(n) where n is the number of cards
+    """
+    if len(cards) != len(pile):
+        return False
+    counts = bytearray(ReplayState.NUM_CARD_IDS)
+    for card in pile:
+        counts[card] += 1
+    for card in cards:
+        if card >= ReplayState.NUM_CARD_IDS or counts[card] == 0:
+            return False
+        counts[card] -= 1
+    return True
+
+
+def verify(log: bytes, game: Game) -> bool:
+    """
+    Method to check that a log leads to the current state of a game
+
+    Args:
+        log (bytes): The replay log of the game
+        game (Game): The game, in the state to check against
+
+    Returns:
+        bool: True if replaying the log gives the same piles, hands, color, label, direction, seat,
+            round count and result, so the log of a finished game must end with its WIN or DRAWN record
+
+    Raises:
+        ReplayError: If the log itself is not valid
+
+    Complexity:
+        Best Case Complexity: O(L) where L is the length of the log
+        Worst Case Complexity: O(L) where L is the length of the log
+    """
+    snapshot = game.snapshot()
+    seed = struct.unpack_from(Game.SNAPSHOT_HEADER, snapshot)[6]
+    state = Replay(log).final_state()
+    return state.result == game.result and state.snapshot(seed) == snapshot
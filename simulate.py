@@ -0,0 +1,241 @@
+"""
+Fit 1008 Assignment 1
+"""
+__FILE__ = "simulate.py"
+__author__ = "<Ter Jing Hao>"
+__student_ID__ = "34857613"
+
+import argparse
+import os
+from multiprocessing import Pool
+
+from constants import Constants
+from data_structures.referential_array import ArrayR
+from events import NullSink
+from game import Game, GameResult
+from player import Player
+from random_gen import RandomGen, RandomStream
+
+
+def derive_seed(master_seed: int, game_index: int) -> int:
+    """
+    Method to derive the seed of one game from the master seed of a batch
+
+    Uses the SplitMix64 finaliser so that neighbouring game indices get unrelated seeds.
+
+    Args:
+        master_seed (int): The seed of the whole batch
+        game_index (int): The index of the game in the batch
+
+    Returns:
+        int: A seed in the range of RandomGen's state
+
+    Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1)
+    """
+    mask = (1 << 64) - 1
+    z = (master_seed + (game_index + 1) * 0x9E3779B97F4A7C15) & mask
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & mask
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & mask
+    z ^= z >> 31
+    return z % RandomGen.MOD
+
+
+# Winner seat reported for games that ended in a draw
+NO_WINNER = -1
+
+
+class StatsSink(NullSink):
+    """
+    Headless sink that only counts the draws and reshuffles of a game.
+    """
+    def __init__(self) -> None:
+        """
+        Constructor for the StatsSink class
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.draws = 0
+        self.reshuffles = 0
+
+    def card_drawn(self, player, card):
+        self.draws += 1
+
+    def reshuffled(self, num_cards):
+        self.reshuffles += 1
+
+
+class BatchStats:
+    """
+    Aggregated results of a batch of games. The memory used only depends on the number of seats.
+    """
+    def __init__(self, num_players: int) -> None:
+        """
+        Constructor for the BatchStats class
+
+        Args:
+            num_players (int): The number of seats at every table of the batch
+
+        Complexity:
+            Best Case Complexity: O(P) where P is the number of players
+            Worst Case Complexity: O(P) where P is the number of players
+        """
+        self.num_players = num_players
+        self.games = 0
+        self.wins = [0] * num_players
+        self.results = [0] * len(GameResult)
+        self.rounds = 0
+        self.min_rounds = None
+        self.max_rounds = 0
+        self.draws = 0
+        self.reshuffles = 0
+
+    def record(self, winner_seat: int, rounds: int, draws: int, reshuffles: int, result: GameResult = GameResult.WIN) -> None:
+        """
+        Method to add the result of one game. A game that ended in a draw has NO_WINNER as winner seat.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.games += 1
+        self.results[result] += 1
+        if result == GameResult.WIN:
+            self.wins[winner_seat] += 1
+        self.rounds += rounds
+        self.max_rounds = max(self.max_rounds, rounds)
+        self.min_rounds = rounds if self.min_rounds is None else min(self.min_rounds, rounds)
+        self.draws += draws
+        self.reshuffles += reshuffles
+
+    def merge(self, other: 'BatchStats') -> None:
+        """
+        Method to fold the results of another batch into this one
+
+        Complexity:
+            Best Case Complexity: O(P) where P is the number of players
+            Worst Case Complexity: O(P) where P is the number of players
+        """
+        if other.games == 0:
+            return
+        self.games += other.games
+        for seat in range(self.num_players):
+            self.wins[seat] += other.wins[seat]
+        for result in GameResult:
+            self.results[result] += other.results[result]
+        self.rounds += other.rounds
+        self.max_rounds = max(self.max_rounds, other.max_rounds)
+        self.min_rounds = other.min_rounds if self.min_rounds is None else min(self.min_rounds, other.min_rounds)
+        self.draws += other.draws
+        self.reshuffles += other.reshuffles
+
+    def win_rate(self, seat: int) -> float:
+        """ Fraction of the games won by the given seat. """
+        return self.wins[seat] / self.games if self.games else 0.0
+
+    def __str__(self) -> str:
+        lines = [f"{self.games} games, {self.num_players} players"]
+        for seat in range(self.num_players):
+            lines.append(f"  seat {seat}: {self.wins[seat]} wins ({self.win_rate(seat):.2%})")
+        drawn = self.games - self.results[GameResult.WIN]
+        if drawn:
+            reasons = ", ".join(f"{result.name}: {self.results[result]}" for result in GameResult if result != GameResult.WIN)
+            lines.append(f"  no winner: {drawn} ({reasons})")
+        if self.games:
+            lines.append(f"  rounds: mean {self.rounds / self.games:.1f}, min {self.min_rounds}, max {self.max_rounds}")
+            lines.append(f"  draws per game: {self.draws / self.games:.1f}, reshuffles per game: {self.reshuffles / self.games:.2f}")
+        return "\n".join(lines)
+
+
+def play_seeded_game(seed: int, num_players: int) -> tuple[int, int, int, int, GameResult]:
+    """
+    Method to play one headless game from a seed
+
+    Args:
+        seed (int): The seed of the game
+        num_players (int): The number of players at the table
+
+    Returns:
+        tuple[int, int, int, int, GameResult]: The winner's seat (NO_WINNER for a draw), rounds played,
+            cards drawn, reshuffles and how the game ended
+
+    Complexity:
+        Best Case Complexity: O(D) where D is DECK_SIZE, see Game.initialise_game
+        Worst Case Complexity: O(D + R * (P + D)) where R is the number of rounds, see Game.play_game
+    """
+    players: ArrayR[Player] = ArrayR(num_players)
+    for seat in range(num_players):
+        players[seat] = Player(f"Player {seat}", seat)
+    sink = StatsSink()
+    # A stream of its own leaves the global RandomGen alone, and gives what RandomGen.set_seed(seed) would
+    game = Game(sink, RandomStream(seed))
+    game.initialise_game(players)
+    winner = game.play_game()
+    seat = winner.position if winner is not None else NO_WINNER
+    return seat, game.round_count, sink.draws, sink.reshuffles, game.result
+
+
+def _simulate_range(task: tuple[int, int, int, int, int]) -> BatchStats:
+    """ Worker entry point: plays the games [start, stop) of a batch. """
+    master_seed, start, stop, num_players, cards_at_init = task
+    # Workers may have been spawned rather than forked, so pass on the setting explicitly
+    Constants.NUM_CARDS_AT_INIT = cards_at_init
+    stats = BatchStats(num_players)
+    for game_index in range(start, stop):
+        stats.record(*play_seeded_game(derive_seed(master_seed, game_index), num_players))
+    return stats
+
+
+def simulate(num_games: int, num_players: int, master_seed: int, workers: int = None, chunk_size: int = 500) -> BatchStats:
+    """
+    Method to play a batch of seeded games across a pool of processes
+
+    Game i of the batch is always played with derive_seed(master_seed, i), so the aggregated
+    results only depend on the arguments and not on the number of workers or the scheduling.
+
+    Args:
+        num_games (int): The number of games to play
+        num_players (int): The number of players at every table
+        master_seed (int): The seed the seed of every game is derived from
+        workers (int): The number of processes, defaults to the number of cores. 1 plays in this process
+        chunk_size (int): The number of games handed to a worker at a time
+
+    Returns:
+        BatchStats: The aggregated results
+
+    Complexity:
+        Best Case Complexity: O(G * T / W) where G is num_games, T the cost of one game and W the number of workers
+        Worst Case Complexity: O(G * T / W) where G is num_games, T the cost of one game and W the number of workers
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    tasks = [
+        (master_seed, start, min(start + chunk_size, num_games), num_players, Constants.NUM_CARDS_AT_INIT)
+        for start in range(0, num_games, chunk_size)
+    ]
+
+    stats = BatchStats(num_players)
+    if workers <= 1:
+        for task in tasks:
+            stats.merge(_simulate_range(task))
+        return stats
+
+    with Pool(workers) as pool:
+        for partial in pool.imap_unordered(_simulate_range, tasks):
+            stats.merge(partial)
+    return stats
+
+
+if __name__ == '__main__':
+    p = argparse.ArgumentParser(description="Play a batch of seeded headless games and report win rates per seat.")
+    p.add_argument("games", type=int)
+    p.add_argument("--players", type=int, default=4)
+    p.add_argument("--seed", type=int, default=123)
+    p.add_argument("--workers", type=int, default=None)
+    p.add_argument("--chunk-size", type=int, default=500)
+    args = p.parse_args()
+
+    print(simulate(args.games, args.players, args.seed, args.workers, args.chunk_size))
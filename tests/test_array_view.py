@@ -0,0 +1,73 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+
+from card import Card, CardColor, CardLabel
+from data_structures.array_view import ArrayView
+from data_structures.referential_array import ArrayR
+from data_structures.stack_adt import ArrayStack
+from player import Player
+
+
+def filled(length: int) -> ArrayR:
+    array = ArrayR(length)
+    for i in range(length):
+        array[i] = i
+    return array
+
+
+class TestArrayView(TestCase):
+
+    @number("25.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_views_match_slices(self) -> None:
+        array = filled(10)
+        items = list(range(10))
+        for arguments in ((0, None, 1), (2, 8, 1), (1, 10, 3), (9, None, -1), (8, 1, -2), (-3, None, 1), (5, 2, 1)):
+            view = array.view(*arguments)
+            expected = items[slice(*arguments)]
+            self.assertEqual(list(view), expected)
+            self.assertEqual(len(view), len(expected))
+            self.assertEqual([view[i] for i in range(-len(view), len(view))], expected + expected if expected else [])
+            self.assertEqual(list(view[1::2]), expected[1::2])
+            self.assertEqual(list(view[::-1]), expected[::-1])
+
+    @number("25.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_view_is_not_a_copy(self) -> None:
+        array = filled(6)
+        view = array.view(0, 6, 2)
+        array[2] = "changed"
+        self.assertEqual(list(view), [0, "changed", 4])
+        self.assertIs(view.array, array)
+        with self.assertRaises(IndexError):
+            view[3]
+        with self.assertRaises(IndexError):
+            ArrayView(array, 4, 2, 2)
+        with self.assertRaises(ValueError):
+            ArrayView(array, 0, 1, 0)
+
+    @number("25.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_adt_views(self) -> None:
+        stack = ArrayStack(4)
+        for i in range(6):
+            stack.push(i)
+        stack.pop()
+        self.assertEqual(list(stack.view()), [0, 1, 2, 3, 4])
+
+        player = Player("Alice", 0)
+        player.add_cards([Card(CardColor.BLUE, CardLabel.ONE), Card(CardColor.CRAZY, CardLabel.CRAZY),
+                          Card(CardColor.RED, CardLabel.TWO)])
+        self.assertEqual([str(card) for card in player.cards()], ["RED TWO", "BLUE ONE", "CRAZY CRAZY"])
+        self.assertEqual(player.hand_text(), str(["RED TWO", "BLUE ONE", "CRAZY CRAZY"]))
+        self.assertEqual(str(player), "Player Alice (position 0): ['RED TWO', 'BLUE ONE', 'CRAZY CRAZY']")
+
+    @number("25.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_view_default_ends(self) -> None:
+        array = filled(5)
+        self.assertEqual(list(array.view()), [0, 1, 2, 3, 4])
+        self.assertEqual(list(array.view(step=-1)), [4, 3, 2, 1, 0])
+        self.assertEqual(list(array.view(step=-2)), [4, 2, 0])
+        self.assertEqual(list(array.view(stop=1, step=-1)), [4, 3, 2])
@@ -0,0 +1,34 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+
+from benchmarks import suite
+
+
+class TestBenchSuite(TestCase):
+
+    @number("19.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_compare(self) -> None:
+        baseline = {"metrics": {
+            "fast": {"seconds_per_op": 1.0, "ops": 1},
+            "slow": {"seconds_per_op": 1.0, "ops": 1},
+            "gone": {"seconds_per_op": 1.0, "ops": 1},
+        }}
+        current = {"metrics": {
+            "fast": {"seconds_per_op": 1.1, "ops": 1},
+            "slow": {"seconds_per_op": 1.3, "ops": 1},
+            "new": {"seconds_per_op": 9.0, "ops": 1},
+        }}
+        # A metric of the baseline that is no longer measured is reported too
+        self.assertEqual(suite.compare(baseline, current, 0.25), ["slow", "gone"])
+        self.assertEqual(suite.compare(baseline, current, 0.05), ["fast", "slow", "gone"])
+        self.assertEqual(suite.compare(baseline, baseline, 0.0), [])
+        self.assertIn("MISSING", suite.report(baseline, current, ["slow", "gone"]).splitlines()[-1])
+
+    @number("19.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_run(self) -> None:
+        results = suite.run(repeat=1, only="generate_cards")
+        self.assertEqual(list(results["metrics"]), ["generate_cards"])
+        self.assertGreater(results["metrics"]["generate_cards"]["seconds_per_op"], 0)
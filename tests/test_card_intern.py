@@ -0,0 +1,55 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+
+from card import Card, CardColor, CardLabel, card_from_id, card_id
+from game import generate_cards
+from random_gen import RandomGen
+
+
+class TestCardIntern(TestCase):
+
+    @number("14.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_interned(self) -> None:
+        card = Card.of(CardColor.GREEN, CardLabel.SKIP)
+        self.assertIs(card, Card.of(CardColor.GREEN, CardLabel.SKIP))
+        self.assertIs(card, card_from_id(card_id(card)))
+        self.assertEqual(card, Card(CardColor.GREEN, CardLabel.SKIP))
+        self.assertEqual(card.color, CardColor.GREEN)
+        self.assertEqual(card.label, CardLabel.SKIP)
+
+    @number("14.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_decks_share_cards(self) -> None:
+        RandomGen.set_seed(5)
+        first = generate_cards()
+        RandomGen.set_seed(5)
+        second = generate_cards()
+
+        self.assertIsNot(first, second)
+        for i in range(len(first)):
+            self.assertIs(first[i], second[i])
+
+        # Shuffling a deck leaves the template, and so the next decks, alone
+        RandomGen.random_shuffle(first)
+        RandomGen.set_seed(5)
+        third = generate_cards()
+        for i in range(len(second)):
+            self.assertIs(second[i], third[i])
+
+    @number("14.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_rank_order(self) -> None:
+        cards = [Card(color, label) for color in CardColor for label in CardLabel]
+        for a in cards:
+            for b in cards:
+                key_a, key_b = (a.color, a.label), (b.color, b.label)
+                self.assertEqual(a < b, key_a < key_b)
+                self.assertEqual(a <= b, key_a <= key_b)
+                self.assertEqual(a == b, key_a == key_b)
+                self.assertEqual(a != b, key_a != key_b)
+                self.assertEqual(a > b, key_a > key_b)
+                self.assertEqual(a >= b, key_a >= key_b)
+        self.assertEqual(len({Card(CardColor.RED, CardLabel.ONE), Card.of(CardColor.RED, CardLabel.ONE)}), 1)
+        self.assertFalse(hasattr(cards[0], "__dict__"))
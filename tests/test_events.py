@@ -0,0 +1,61 @@
+import io
+from contextlib import redirect_stdout
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures.referential_array import ArrayR
+
+from game import Game
+from events import CollectingSink, NullSink, PrintSink
+from random_gen import RandomGen
+from player import Player
+from constants import Constants
+
+
+class TestEvents(TestCase):
+
+    def play(self, sink) -> tuple[Game, Player, str]:
+        RandomGen.set_seed(123)
+        Constants.NUM_CARDS_AT_INIT = 7
+        players: ArrayR[Player] = ArrayR(3)
+        players[0] = Player("Alice", 0)
+        players[1] = Player("Bob", 1)
+        players[2] = Player("Charlie", 2)
+        game: Game = Game(sink)
+        game.initialise_game(players)
+        out = io.StringIO()
+        with redirect_stdout(out):
+            winner = game.play_game()
+        return game, winner, out.getvalue()
+
+    @number("5.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_null_sink_is_silent(self) -> None:
+        _, printed_winner, _ = self.play(None)
+        game, winner, output = self.play(NullSink())
+        self.assertEqual(output, "", "A headless game should not print anything")
+        self.assertEqual(winner.name, printed_winner.name, f"Winner should be {printed_winner.name}, but is {winner.name}")
+        self.assertGreater(game.round_count, 0)
+
+    @number("5.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_print_sink_matches_default(self) -> None:
+        _, _, default_output = self.play(None)
+        stream = io.StringIO()
+        _, _, output = self.play(PrintSink(stream))
+        self.assertEqual(output, "", "A PrintSink with a stream should not print to stdout")
+        self.assertEqual(stream.getvalue(), default_output)
+        self.assertTrue(default_output.startswith("Game starts with Alice\n"))
+        self.assertTrue(default_output.endswith("Alice wins!\n"))
+
+    @number("5.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_collecting_sink(self) -> None:
+        sink = CollectingSink()
+        game, winner, _ = self.play(sink)
+        names = [name for name, _ in sink.events]
+        self.assertEqual(names[0], "game_dealt")
+        self.assertEqual(names[1], "game_started")
+        self.assertEqual(names[-1], "game_won")
+        self.assertIs(sink.events[-1][1][0], winner)
+        self.assertEqual(names.count("round_started"), game.round_count)
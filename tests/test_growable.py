@@ -0,0 +1,92 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+
+from data_structures.array_sorted_list import ArraySortedList
+from data_structures.queue_adt import CircularQueue
+from data_structures.stack_adt import ArrayStack
+
+
+class TestGrowable(TestCase):
+
+    @number("24.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_stack(self) -> None:
+        stack = ArrayStack(2, shrink=True)
+        for i in range(100):
+            stack.push(i)
+        self.assertEqual(len(stack.array), 128)
+        capacities = set()
+        for i in range(99, 4, -1):
+            self.assertEqual(stack.pop(), i)
+            capacities.add(len(stack.array))
+        # Halved at a quarter full each time, never below the initial capacity
+        self.assertEqual(sorted(capacities), [16, 32, 64, 128])
+        self.assertEqual([stack.pop() for _ in range(5)], [4, 3, 2, 1, 0])
+        self.assertEqual(len(stack.array), 2)
+
+        fixed = ArrayStack(2)
+        for i in range(10):
+            fixed.push(i)
+        while not fixed.is_empty():
+            fixed.pop()
+        self.assertEqual(len(fixed.array), 16)
+
+    @number("24.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_queue(self) -> None:
+        queue = CircularQueue(4, shrink=True)
+        # Wrap around the end of the array before it has to grow
+        for i in range(3):
+            queue.append(i)
+        queue.serve()
+        served = [0]
+        for i in range(3, 40):
+            queue.append(i)
+        self.assertEqual(len(queue.array), 64)
+        while not queue.is_empty():
+            served.append(queue.serve())
+            self.assertGreaterEqual(len(queue.array), 4)
+        self.assertEqual(served, list(range(40)))
+        self.assertEqual(len(queue.array), 4)
+
+    @number("24.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_sorted_list(self) -> None:
+        sorted_list = ArraySortedList(4, shrink=True)
+        for item in range(64, 0, -1):
+            sorted_list.add(item)
+        self.assertEqual(len(sorted_list.array), 64)
+        # No resize while the size goes back and forth around a capacity
+        array = sorted_list.array
+        for _ in range(10):
+            sorted_list.delete_at_index(0)
+            sorted_list.add(0)
+        self.assertIs(sorted_list.array, array)
+        while len(sorted_list) > 1:
+            sorted_list.delete_at_index(len(sorted_list) // 2)
+        self.assertEqual(len(sorted_list.array), 4)
+        sorted_list.add_all(range(100))
+        sorted_list.reset()
+        self.assertEqual(len(sorted_list.array), 4)
+
+    @number("24.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_stack_swap(self) -> None:
+        # The policy goes with the array: the shrinking array never halves below where it started
+        small = ArrayStack(4, shrink=True)
+        large = ArrayStack(64)
+        for i in range(40):
+            large.push(i)
+        small.swap(large)
+        self.assertEqual((len(small), small.initial_capacity, small.shrink), (40, 64, False))
+        self.assertEqual((len(large), large.initial_capacity, large.shrink), (0, 4, True))
+
+        for i in range(40):
+            large.push(i)
+        self.assertEqual(len(large.array), 64)
+        large.swap(small)
+        while len(small) > 0:
+            small.pop()
+        self.assertEqual(len(small.array), 4)
+        self.assertEqual(small.initial_capacity, 4)
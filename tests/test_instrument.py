@@ -0,0 +1,108 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures.array_sorted_list import ArraySortedList
+from data_structures.referential_array import ArrayR
+
+from card import Card, CardColor, CardLabel
+from constants import Constants
+from game import Game
+from instrument import Instrumentation, instrument_game
+from player import Player
+from random_gen import RandomStream
+from simulate import StatsSink
+
+
+def new_game(seed: int, sink=None) -> Game:
+    players: ArrayR[Player] = ArrayR(3)
+    for i in range(3):
+        players[i] = Player(f"Player {i}", i)
+    game = Game(sink if sink is not None else StatsSink(), RandomStream(seed))
+    game.initialise_game(players)
+    return game
+
+
+class TestInstrument(TestCase):
+
+    def setUp(self) -> None:
+        Constants.NUM_CARDS_AT_INIT = 7
+
+    @number("18.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_disabled_restores(self) -> None:
+        originals = (Game._take_card, Player.add_card, ArraySortedList._shuffle_right, Card.__lt__)
+        counters = Instrumentation()
+        counters.enable()
+        self.assertIsNot(Game._take_card, originals[0])
+        with self.assertRaises(RuntimeError):
+            Instrumentation().enable()
+        counters.disable()
+        self.assertEqual((Game._take_card, Player.add_card, ArraySortedList._shuffle_right, Card.__lt__), originals)
+
+        # Nothing is counted while disabled
+        Card(CardColor.RED, CardLabel.ONE) < Card(CardColor.RED, CardLabel.TWO)
+        self.assertEqual(counters.summary()["card_comparisons"], 0)
+
+    @number("18.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_game_summary(self) -> None:
+        sink = StatsSink()
+        summary = instrument_game(new_game(8, sink))
+        plain = new_game(8)
+        plain.play_game()
+
+        self.assertEqual(summary["rounds"], plain.round_count)
+        self.assertEqual(summary["take_card"]["calls"], sink.draws)
+        self.assertEqual(summary["reshuffle"]["calls"], sink.reshuffles)
+        self.assertGreater(summary["hand_delete"]["calls"], 0)
+        self.assertGreater(summary["take_card"]["seconds"], 0)
+        self.assertGreater(summary["card_comparisons"], 0)
+
+    @number("18.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_moves(self) -> None:
+        sorted_list = ArraySortedList(8)
+        for value in (5, 3, 1):
+            sorted_list.add(value)
+        with Instrumentation() as counters:
+            sorted_list.add(0)
+            sorted_list.delete_at_index(1)
+        summary = counters.summary()
+        self.assertEqual(summary["shuffle_right_moves"], 3)
+        self.assertEqual(summary["shuffle_left_moves"], 2)
+
+    @number("18.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_merge_moves(self) -> None:
+        sorted_list = ArraySortedList(8)
+        sorted_list.add_all([1, 3, 5, 7])
+        with Instrumentation() as counters:
+            # 3, 5 and 7 move up to make room for 2, 4 and 9
+            sorted_list.add_all([9, 4, 2])
+            sorted_list.add_all([10, 11])
+        self.assertEqual(counters.summary()["merge_moves"], 3)
+
+
+    @number("18.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_scoped_to_game(self) -> None:
+        sink = StatsSink()
+        game = new_game(8, sink)
+        with Instrumentation(game) as counters:
+            # Another game played meanwhile, like a scratch game, is not counted
+            new_game(9).play_game()
+            self.assertEqual(counters.summary()["take_card"]["calls"], 0)
+            self.assertEqual(counters.summary()["card_comparisons"], 0)
+            game.play_game()
+        summary = counters.summary()
+        alone = instrument_game(new_game(8))
+        for name in ("draw_card", "take_card", "hand_insert", "hand_delete", "reshuffle"):
+            self.assertEqual(summary[name]["calls"], alone[name]["calls"])
+        self.assertEqual(summary["card_comparisons"], alone["card_comparisons"])
+        self.assertEqual(summary["take_card"]["calls"], sink.draws)
+        self.assertGreater(summary["draw_card"]["calls"], 0)
+        self.assertLessEqual(summary["draw_card"]["calls"], summary["take_card"]["calls"])
+
+        with Instrumentation() as counters:
+            new_game(9).play_game()
+        self.assertGreater(counters.summary()["take_card"]["calls"], 0)
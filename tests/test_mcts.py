@@ -0,0 +1,132 @@
+import struct
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+
+from card import CardColor
+from constants import Constants
+from data_structures.referential_array import ArrayR
+from events import CollectingSink, NullSink
+from game import Game
+from mcts import MCTSStrategy, determinize, legal_actions
+from player import Player, Strategy
+from random_gen import RandomStream
+
+
+def new_game(seed: int, strategies: list, sink=None) -> tuple[Game, ArrayR]:
+    players: ArrayR[Player] = ArrayR(len(strategies))
+    for seat, strategy in enumerate(strategies):
+        players[seat] = Player(f"Player {seat}", seat, strategy)
+    game = Game(NullSink() if sink is None else sink, RandomStream(seed))
+    game.initialise_game(players)
+    return game, players
+
+
+class TestMCTS(TestCase):
+
+    def setUp(self) -> None:
+        Constants.NUM_CARDS_AT_INIT = 7
+
+    @number("21.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_default_strategy(self) -> None:
+        # The base Strategy makes the same decisions as a player without one
+        for seed in range(20):
+            game, _ = new_game(seed, [None] * 4)
+            with_strategy, _ = new_game(seed, [Strategy()] * 4)
+            game.play_game()
+            with_strategy.play_game()
+            self.assertEqual(with_strategy.snapshot(), game.snapshot())
+            self.assertEqual(with_strategy.round_count, game.round_count)
+
+    @number("21.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_determinize(self) -> None:
+        game, players = new_game(3, [None] * 3)
+        steps = game.steps()
+        for _ in range(10):
+            next(steps)
+        snapshot = game.snapshot()
+        seat = game.turn_order.index
+        sample = determinize(snapshot, seat, RandomStream(1))
+        self.assertNotEqual(sample, snapshot)
+
+        sampled, _ = new_game(0, [None] * 3)
+        sampled.restore(sample)
+        # Everything the player can see is kept: their hand, the discard pile and every size
+        self.assertEqual(struct.unpack_from(Game.SNAPSHOT_HEADER, sample),
+                         struct.unpack_from(Game.SNAPSHOT_HEADER, snapshot))
+        self.assertEqual(str(sampled.turn_order[seat]), str(game.turn_order[seat]))
+        self.assertEqual([str(sampled.discard_pile.array[i]) for i in range(len(sampled.discard_pile))],
+                         [str(game.discard_pile.array[i]) for i in range(len(game.discard_pile))])
+        for other in range(3):
+            hand = sampled.turn_order[other]
+            self.assertEqual(len(hand), len(game.turn_order[other]))
+            # The sampled hands are in order, with an index that matches them
+            ranks = [card.rank for card in hand.cards()]
+            self.assertEqual(ranks, sorted(ranks))
+            self.assertEqual(sum(hand.color_counts), len(hand))
+            for card in hand.cards():
+                self.assertTrue(hand.has_playable(card.color, card.label))
+        self.assertEqual(sorted(sample), sorted(snapshot))
+
+    @number("21.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_search_plays_legal_moves(self) -> None:
+        results = []
+        for _ in range(2):
+            strategy = MCTSStrategy(time_budget=None, max_iterations=20, seed=7)
+            sink = CollectingSink()
+            game, players = new_game(11, [strategy, None], sink)
+            winner = game.play_game()
+            self.assertIsNotNone(game.result)
+            for name, arguments in sink.events:
+                if name == "color_chosen":
+                    self.assertNotEqual(arguments[0], CardColor.CRAZY)
+            results.append((winner.position if winner else None, game.round_count, game.snapshot()))
+        # The search only uses its own generator, so a seeded game plays out the same
+        self.assertEqual(results[0], results[1])
+
+    @number("21.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_subtree_reuse(self) -> None:
+        class Recording(MCTSStrategy):
+            """ Records every decision with a choice: the moves, the root searched from and the card chosen. """
+            def __init__(self, **kwargs) -> None:
+                super().__init__(**kwargs)
+                self.decisions = []
+                self.start = None
+
+            def _root(self, game):
+                root = super()._root(game)
+                self.start = (root, root.visits)
+                return root
+
+            def choose_card(self, game, player):
+                actions = legal_actions(game, player)
+                index = super().choose_card(game, player)
+                if len(actions) > 1:
+                    self.decisions.append((actions, player.hand[index].rank, self.iterations, *self.start))
+                return index
+
+        strategy = Recording(time_budget=None, max_iterations=30, seed=1)
+        game, players = new_game(4, [strategy, None, None])
+        game.play_game()
+
+        self.assertGreater(len(strategy.decisions), 0, "The MCTS player never had a choice to make")
+        reused = 0
+        for actions, rank, iterations, root, visits in strategy.decisions:
+            self.assertIn(rank, [move for move, _ in actions])
+            self.assertEqual(iterations, 30)
+            # Every sample of the search goes through the root, on top of those kept from the last decision
+            self.assertEqual(root.visits, visits + 30)
+            reused += visits > 0
+        self.assertGreater(reused, 0, "No decision started from a kept subtree")
+
+    @number("21.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_single_seat(self) -> None:
+        # Samples cut short at a table of one score 0 instead of dividing by the number of opponents
+        strategy = MCTSStrategy(time_budget=None, max_iterations=10, rollout_rounds=3, seed=1)
+        game, players = new_game(0, [strategy])
+        self.assertIs(game.play_game(), players[0])
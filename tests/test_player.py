@@ -0,0 +1,121 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+
+from card import Card, CardColor, CardLabel
+from player import Player
+from random_gen import RandomGen
+
+
+def linear_count_playable(player: Player, color: CardColor, label: CardLabel) -> int:
+    count = 0
+    for i in range(len(player)):
+        card = player[i]
+        if card.color == CardColor.CRAZY or card.color == color or card.label == label:
+            count += 1
+    return count
+
+
+def linear_first_playable(player: Player, color: CardColor, label: CardLabel) -> int | None:
+    for i in range(len(player)):
+        card = player[i]
+        if card.color == CardColor.CRAZY or card.color == color or card.label == label:
+            return i
+    return None
+
+
+class TestPlayer(TestCase):
+
+    def setUp(self) -> None:
+        RandomGen.set_seed(1008)
+        self.player: Player = Player("Alice", 0)
+
+    def random_card(self) -> Card:
+        color = CardColor(RandomGen.randint(0, 4))
+        if color == CardColor.CRAZY:
+            return Card(color, CardLabel(RandomGen.randint(CardLabel.CRAZY, CardLabel.DRAW_FOUR)))
+        return Card(color, CardLabel(RandomGen.randint(0, CardLabel.DRAW_TWO)))
+
+    def assert_matches_scan(self) -> None:
+        for color in range(CardColor.CRAZY):
+            for label in CardLabel:
+                expected = linear_first_playable(self.player, CardColor(color), label)
+                self.assertEqual(self.player.first_playable(CardColor(color), label), expected,
+                                 f"Wrong card for {CardColor(color).name} {label.name} in {self.player}")
+                self.assertEqual(self.player.has_playable(CardColor(color), label), expected is not None)
+                self.assertEqual(self.player.count_playable(CardColor(color), label),
+                                 linear_count_playable(self.player, CardColor(color), label))
+
+    @number("8.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_first_playable_empty(self) -> None:
+        self.assertIsNone(self.player.first_playable(CardColor.RED, CardLabel.ONE))
+
+    @number("8.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_first_playable_wild_only(self) -> None:
+        self.player.add_card(Card(CardColor.CRAZY, CardLabel.DRAW_FOUR))
+        self.player.add_card(Card(CardColor.CRAZY, CardLabel.CRAZY))
+        self.assertEqual(self.player.first_playable(CardColor.RED, CardLabel.DRAW_FOUR), 0)
+        self.assertEqual(self.player[0].label, CardLabel.CRAZY)
+
+    @number("8.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_first_playable_matches_scan(self) -> None:
+        for _ in range(40):
+            self.player.add_card(self.random_card())
+            self.assert_matches_scan()
+        while len(self.player) > 0:
+            self.player.play_card(RandomGen.randint(0, len(self.player) - 1))
+            self.assert_matches_scan()
+
+    @number("8.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_count_playable_after_crazy(self) -> None:
+        # After a crazy card the label stays CRAZY while the color is the chosen one
+        for card in (Card(CardColor.CRAZY, CardLabel.CRAZY), Card(CardColor.CRAZY, CardLabel.CRAZY),
+                     Card(CardColor.BLUE, CardLabel.ONE), Card(CardColor.RED, CardLabel.ONE)):
+            self.player.add_card(card)
+        self.assertEqual(self.player.count_playable(CardColor.BLUE, CardLabel.CRAZY), 3)
+        self.assertEqual(self.player.count_playable(CardColor.GREEN, CardLabel.ONE), 4)
+        self.assertEqual(self.player.count_playable(CardColor.GREEN, CardLabel.TWO), 2)
+        self.player.clear_hand()
+        self.assertFalse(self.player.has_playable(CardColor.GREEN, CardLabel.TWO))
+        self.assertEqual(self.player.count_playable(CardColor.GREEN, CardLabel.TWO), 0)
+
+    @number("8.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_add_cards(self) -> None:
+        one_by_one = Player("Alice", 0)
+        for size in (0, 5, 30, 130):
+            batch = [self.random_card() for _ in range(size)]
+            self.player.add_cards(batch)
+            for card in batch:
+                one_by_one.add_card(card)
+            self.assertEqual(str(self.player), str(one_by_one))
+            self.assertEqual(self.player.held, one_by_one.held)
+            self.assert_matches_scan()
+
+    @number("8.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_color_and_label_views(self) -> None:
+        self.player.add_cards([self.random_card() for _ in range(40)])
+        hand = [self.player[i] for i in range(len(self.player))]
+        for color in CardColor:
+            self.assertEqual(list(self.player.cards_of_color(color)), [card for card in hand if card.color == color])
+            for label in CardLabel:
+                cards = self.player.cards_of(color, label)
+                self.assertEqual(list(cards), [card for card in hand if card.color == color and card.label == label])
+                self.assertEqual(len(cards), self.player.hand.count(Card(color, label)))
+
+    @number("8.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_add_cards_generator(self) -> None:
+        batch = [self.random_card() for _ in range(20)]
+        self.player.add_cards(card for card in batch)
+        one_by_one = Player("Alice", 0)
+        for card in batch:
+            one_by_one.add_card(card)
+        self.assertEqual(str(self.player), str(one_by_one))
+        self.assertEqual(self.player.held, one_by_one.held)
+        self.assert_matches_scan()
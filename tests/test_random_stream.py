@@ -0,0 +1,88 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures.referential_array import ArrayR
+
+from events import NullSink
+from game import Game
+from player import Player
+from random_gen import RandomGen, RandomStream
+from constants import Constants
+
+
+def new_game(rng=None) -> Game:
+    players: ArrayR[Player] = ArrayR(3)
+    for i in range(3):
+        players[i] = Player(f"Player {i}", i)
+    game = Game(NullSink(), rng)
+    game.initialise_game(players)
+    return game
+
+
+class TestRandomStream(TestCase):
+
+    def setUp(self) -> None:
+        Constants.NUM_CARDS_AT_INIT = 7
+
+    @number("16.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_same_sequence(self) -> None:
+        RandomGen.set_seed(2024)
+        stream = RandomStream(2024)
+        for _ in range(100):
+            self.assertEqual(stream.random(), RandomGen.random())
+        self.assertEqual(stream.randint(3, 9), RandomGen.randint(3, 9))
+
+    @number("16.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_jump(self) -> None:
+        stream = RandomStream(77)
+        jumped = RandomStream(77)
+        for _ in range(1000):
+            stream.random()
+        jumped.jump(1000)
+        self.assertEqual(jumped.seed, stream.seed)
+
+        RandomGen.set_seed(77)
+        RandomGen.jump(1000)
+        self.assertEqual(RandomGen.seed, stream.seed)
+
+        # A full period brings the generator back to where it was
+        jumped.jump(RandomGen.MOD)
+        self.assertEqual(jumped.seed, stream.seed)
+
+    @number("16.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_split(self) -> None:
+        master = RandomStream(5)
+        streams = master.split(3, stride=500)
+        self.assertEqual(master.seed, 5)
+        self.assertEqual(streams[0].seed, 5)
+        for _ in range(500):
+            streams[0].random()
+        self.assertEqual(streams[0].seed, streams[1].seed)
+        streams[2].jump(-1000 % RandomGen.MOD)
+        self.assertEqual(streams[2].seed, 5)
+
+    @number("16.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_independent_games(self) -> None:
+        # Two games on their own streams, played turn by turn in lockstep
+        first, second = new_game(RandomStream(11)), new_game(RandomStream(12))
+        RandomGen.set_seed(0)
+        for _ in zip(first.steps(), second.steps()):
+            pass
+        self.assertEqual(RandomGen.seed, 0)
+        for _ in first.steps():
+            pass
+        for _ in second.steps():
+            pass
+
+        # Each played like a game alone on the global generator
+        for seed, game in ((11, first), (12, second)):
+            RandomGen.set_seed(seed)
+            alone = new_game()
+            alone.play_game()
+            self.assertEqual(alone.winner.position, game.winner.position)
+            self.assertEqual(alone.round_count, game.round_count)
+            self.assertEqual(alone.snapshot(), game.snapshot())
@@ -0,0 +1,69 @@
+import sys
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+
+from data_structures.referential_array import ArrayR
+
+
+def filled(length: int) -> ArrayR:
+    array = ArrayR(length)
+    for i in range(length):
+        array[i] = i
+    return array
+
+
+class TestArrayR(TestCase):
+
+    def items(self, array: ArrayR) -> list:
+        return [array[i] for i in range(len(array))]
+
+    @number("23.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_move(self) -> None:
+        array = filled(8)
+        array.move(2, 3, 4)    # overlapping, to the right
+        self.assertEqual(self.items(array), [0, 1, 2, 2, 3, 4, 5, 7])
+        array.move(3, 1, 5)    # overlapping, to the left
+        self.assertEqual(self.items(array), [0, 2, 3, 4, 5, 7, 5, 7])
+        array.move(0, 4, 0)
+        self.assertEqual(self.items(array), [0, 2, 3, 4, 5, 7, 5, 7])
+        with self.assertRaises(IndexError):
+            array.move(0, 5, 4)
+        with self.assertRaises(IndexError):
+            array.move(-1, 0, 2)
+
+    @number("23.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_copy_fill_reverse(self) -> None:
+        array = ArrayR(6)
+        array.copy_from(filled(3))
+        array.copy_from(filled(5), 3, 3, 2)
+        self.assertEqual(self.items(array), [0, 1, 2, 3, 4, None])
+        array.fill("x", 4)
+        self.assertEqual(self.items(array), [0, 1, 2, 3, "x", "x"])
+        array.reverse(1, 5)
+        self.assertEqual(self.items(array), [0, "x", 3, 2, 1, "x"])
+        with self.assertRaises(IndexError):
+            array.copy_from(filled(3), 0, 4)
+        with self.assertRaises(IndexError):
+            array.fill(0, 2, 7)
+
+    @number("23.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_reference_counts(self) -> None:
+        # Moved, copied and overwritten references are counted like element by element assignments
+        item = object()
+        before = sys.getrefcount(item)
+        array = ArrayR(10)
+        array.fill(item, 0, 4)
+        self.assertEqual(sys.getrefcount(item), before + 4)
+        array.move(0, 4, 4)
+        self.assertEqual(sys.getrefcount(item), before + 8)
+        other = ArrayR(10)
+        other.copy_from(array)
+        self.assertEqual(sys.getrefcount(item), before + 16)
+        other.fill(0)
+        self.assertEqual(sys.getrefcount(item), before + 8)
+        del array, other
+        self.assertEqual(sys.getrefcount(item), before)
@@ -0,0 +1,131 @@
+import io
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures.referential_array import ArrayR
+
+from game import Game, GameResult
+from replay import Op, Replay, ReplayError, ReplayLogSink, verify
+from random_gen import RandomGen
+from player import Player
+from card import CardColor, CardLabel
+from constants import Constants
+
+
+class TestReplay(TestCase):
+
+    def setUp(self) -> None:
+        RandomGen.set_seed(123)
+        Constants.NUM_CARDS_AT_INIT = 7
+        self.players: ArrayR[Player] = ArrayR(3)
+        self.players[0] = Player("Alice", 0)
+        self.players[1] = Player("Bob", 1)
+        self.players[2] = Player("Charlie", 2)
+        self.stream = io.BytesIO()
+        self.sink = ReplayLogSink(self.stream)
+        self.game: Game = Game(self.sink)
+        self.game.initialise_game(self.players)
+        self.dealt = self.game.snapshot()
+        self.winner = self.game.play_game()
+        self.log = self.sink.getvalue()
+
+    @number("11.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_log_matches_game(self) -> None:
+        self.assertEqual(self.stream.getvalue(), self.log)
+        self.assertTrue(verify(self.log, self.game))
+
+        state = Replay(self.log).final_state()
+        self.assertEqual(state.winner, 0, f"Winner should be seat 0, but is {state.winner}")
+        self.assertEqual(state.round_count, self.game.round_count)
+        self.assertEqual(state.sizes, [0, 2, 4])
+
+    @number("11.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_intermediate_states(self) -> None:
+        ops = []
+        first = None
+        for op, state in Replay(self.log).states():
+            if op == Op.DEAL:
+                first = state.snapshot()
+            ops.append(op)
+        self.assertEqual(first, self.dealt)
+        self.assertEqual(ops[0], Op.DEAL)
+        self.assertEqual(ops[-1], Op.WIN)
+        self.assertEqual(ops.count(Op.ROUND), self.game.round_count)
+
+    @number("11.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_tampered_log(self) -> None:
+        # DEAL, START and ROUND come first, then Alice plays GREEN FOUR
+        play = 5 + len(self.dealt) + 3 + 1
+        self.assertEqual(self.log[play], Op.PLAY)
+        tampered = bytearray(self.log)
+        tampered[play + 3] = CardColor.BLUE * Constants.NUM_MAX_VALS + CardLabel.NINE
+        with self.assertRaises(ReplayError):
+            Replay(bytes(tampered)).final_state()
+        with self.assertRaises(ReplayError):
+            Replay(self.log[:-1]).final_state()
+
+    @number("11.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_error_messages(self) -> None:
+        deal = self.log[:5 + len(self.dealt)]
+        for record in (bytes([Op.COLOR]), bytes([Op.PLAY, 0]), bytes([Op.RESHUFFLE, 3, 0, 1])):
+            with self.assertRaisesRegex(ReplayError, "Truncated record"):
+                Replay(deal + record).final_state()
+        with self.assertRaisesRegex(ReplayError, "seat that does not exist"):
+            Replay(deal + bytes([Op.PLAY, 9, 0, 0])).final_state()
+        with self.assertRaisesRegex(ReplayError, "card that does not exist"):
+            Replay(deal + bytes([Op.DRAW, 0, 0, 200])).final_state()
+        with self.assertRaisesRegex(ReplayError, "do not match the discard pile"):
+            Replay(deal + bytes([Op.RESHUFFLE, 1, 0, 0])).final_state()
+
+    @number("11.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_drawn_game(self) -> None:
+        self.assertEqual(Replay(self.log).final_state(finished=True).result, GameResult.WIN)
+
+        sink = ReplayLogSink()
+        game = Game(sink)
+        game.initialise_game(self.players)
+        game.max_rounds = 5
+        self.assertIsNone(game.play_game())
+        log = sink.getvalue()
+        self.assertEqual(log[-2:], bytes([Op.DRAWN, GameResult.ROUND_LIMIT]))
+        self.assertTrue(verify(log, game))
+        state = Replay(log).final_state(finished=True)
+        self.assertEqual((state.result, state.winner), (GameResult.ROUND_LIMIT, None))
+
+        # Without its end record the log was cut off, even though every move is there
+        self.assertIsNone(Replay(log[:-2]).final_state().result)
+        self.assertFalse(verify(log[:-2], game))
+        with self.assertRaisesRegex(ReplayError, "ends before the end of the game"):
+            Replay(log[:-2]).final_state(finished=True)
+        with self.assertRaisesRegex(ReplayError, "follows the end of the game"):
+            Replay(log + bytes([Op.ROUND])).final_state()
+        with self.assertRaisesRegex(ReplayError, "ends a drawn game"):
+            Replay(log[:-1] + bytes([GameResult.WIN])).final_state()
+
+    @number("11.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_illegal_moves(self) -> None:
+        play = 5 + len(self.dealt) + 3 + 1
+        out_of_turn = bytearray(self.log)
+        out_of_turn[play + 1] = 1
+        with self.assertRaisesRegex(ReplayError, "plays out of turn"):
+            Replay(bytes(out_of_turn)).final_state()
+
+        # A card Alice holds that matches neither the color nor the label of the top card
+        state = Replay(self.log[:play]).final_state()
+        unplayable = [card for card in state.hand(0)
+                      if card // Constants.NUM_MAX_VALS not in (CardColor.CRAZY, state.color)
+                      and card % Constants.NUM_MAX_VALS != state.label]
+        self.assertTrue(unplayable)
+        tampered = bytearray(self.log)
+        tampered[play + 3] = unplayable[0]
+        with self.assertRaisesRegex(ReplayError, "does not match the top card"):
+            Replay(bytes(tampered)).final_state()
+
+        with self.assertRaisesRegex(ReplayError, "draws out of turn"):
+            Replay(self.log[:play] + bytes([Op.DRAW, 2, 0, state.draw_pile[-1]])).final_state()
@@ -0,0 +1,56 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures.referential_array import ArrayR
+
+from game import Game
+from events import NullSink
+from random_gen import RandomGen
+from player import Player
+from constants import Constants
+
+
+class TestReshuffle(TestCase):
+
+    def setUp(self) -> None:
+        RandomGen.set_seed(112)
+        Constants.NUM_CARDS_AT_INIT = 7
+        self.players: ArrayR[Player] = ArrayR(2)
+        self.players[0] = Player("Alice", 0)
+        self.players[1] = Player("Bob", 1)
+        self.game: Game = Game(NullSink())
+        self.game.initialise_game(self.players)
+
+        # Play the draw pile out onto the discard pile
+        while len(self.game.draw_pile) > 0:
+            self.game.discard_pile.push(self.game.draw_pile.pop())
+
+    @number("13.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_reshuffle_keeps_top_card(self) -> None:
+        discard_pile = self.game.discard_pile
+        top = discard_pile.peek()
+        num_cards = len(discard_pile)
+
+        self.game.draw_card(self.players[0], False)
+
+        self.assertEqual(len(discard_pile), 1)
+        self.assertIs(discard_pile.peek(), top)
+        self.assertEqual(len(self.game.draw_pile), num_cards - 2)
+        self.assertEqual(len(self.players[0]), Constants.NUM_CARDS_AT_INIT + 1)
+
+    @number("13.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_reshuffle_order(self) -> None:
+        # The order the cards were given by popping the discard pile into a shuffled array
+        discard_pile = self.game.discard_pile
+        cards = [discard_pile.array[i] for i in range(len(discard_pile) - 2, -1, -1)]
+        seed = RandomGen.seed
+        RandomGen.random_shuffle(cards)
+        RandomGen.seed = seed
+
+        self.game.draw_card(self.players[0], False)
+
+        draw_pile = self.game.draw_pile
+        self.assertEqual([draw_pile.array[i] for i in range(len(draw_pile))], cards[:-1])
+        self.assertIn(cards[-1], self.players[0].hand)
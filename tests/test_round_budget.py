@@ -0,0 +1,133 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures.referential_array import ArrayR
+
+from card import Card, CardColor, CardLabel, card_id
+from constants import Constants
+from events import CollectingSink
+from game import Effect, Game, GameResult, OutOfCards
+import vector_engine
+from player import Player
+from random_gen import RandomGen
+from simulate import simulate
+
+
+class TestRoundBudget(TestCase):
+
+    def setUp(self) -> None:
+        RandomGen.set_seed(123)
+        Constants.NUM_CARDS_AT_INIT = 7
+        self.players: ArrayR[Player] = ArrayR(3)
+        for i in range(3):
+            self.players[i] = Player(f"Player {i}", i)
+        self.sink = CollectingSink()
+        self.game: Game = Game(self.sink)
+        self.game.initialise_game(self.players)
+
+    def tearDown(self) -> None:
+        Constants.MAX_ROUNDS_PER_PLAYER = 100
+
+    @number("17.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_round_limit(self) -> None:
+        self.assertEqual(self.game.max_rounds, 300)
+        self.game.max_rounds = 5
+
+        turns = list(self.game.steps())
+
+        self.assertEqual(len(turns), 5)
+        self.assertIsNone(self.game.winner)
+        self.assertEqual(self.game.result, GameResult.ROUND_LIMIT)
+        self.assertEqual(self.sink.events[-1], ("game_drawn", (GameResult.ROUND_LIMIT, 5)))
+        self.assertEqual(list(self.game.steps()), [])
+
+    @number("17.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_out_of_cards(self) -> None:
+        # Everything left is in the hand of the second player, the first has nothing to play
+        while len(self.game.draw_pile) > 0:
+            self.players[1].add_card(self.game.draw_pile.pop())
+        self.players[0].clear_hand()
+
+        with self.assertRaises(OutOfCards):
+            self.game.draw_card(self.players[0], False)
+
+        # The round that ran out of cards is still yielded
+        turns = list(self.game.steps())
+        self.assertEqual([(turn.player, turn.played, turn.drawn) for turn in turns], [(self.players[0], None, None)])
+        self.assertIsNone(self.game.winner)
+        self.assertEqual(self.game.result, GameResult.STALLED)
+        self.assertEqual(self.game.round_count, 1)
+
+    @number("17.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_batch_counts_draws(self) -> None:
+        Constants.MAX_ROUNDS_PER_PLAYER = 10
+        stats = simulate(40, 3, master_seed=3, workers=1)
+        drawn = stats.results[GameResult.ROUND_LIMIT] + stats.results[GameResult.STALLED]
+        self.assertGreater(drawn, 0)
+        self.assertEqual(sum(stats.wins) + drawn, 40)
+        self.assertEqual(stats.results[GameResult.WIN], sum(stats.wins))
+        self.assertLessEqual(stats.max_rounds, 30)
+
+    @number("17.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_stall_rule(self) -> None:
+        # Nobody can play from their hand and every card drawn is played: the piles go round forever
+        hand = [Card.of(CardColor.RED, CardLabel.FIVE), Card.of(CardColor.GREEN, CardLabel.SIX)]
+        pile = [Card.of(CardColor.BLUE, label) for label in (CardLabel.ONE, CardLabel.TWO, CardLabel.THREE)]
+        for i in range(3):
+            self.players[i].clear_hand()
+            self.players[i].add_cards(hand)
+        self.game.draw_pile.clear()
+        for card in pile:
+            self.game.draw_pile.push(card)
+        self.game.discard_pile.clear()
+        self.game.discard_pile.push(Card.of(CardColor.BLUE, CardLabel.FOUR))
+        self.game.current_color, self.game.current_label = CardColor.BLUE, CardLabel.FOUR
+
+        self.assertIsNone(self.game.play_game())
+        self.assertEqual(self.game.result, GameResult.STALLED)
+        # Three rounds use up the draw pile, the next two reshuffles come at rounds 4 and 7
+        self.assertEqual(self.game.reshuffles, 2)
+        self.assertEqual(self.game.round_count, 7)
+        self.assertEqual(self.sink.events[-1], ("game_drawn", (GameResult.STALLED, 7)))
+        self.assertEqual([len(self.players[i]) for i in range(3)], [2, 2, 2])
+
+        if vector_engine.np is None:
+            return
+        # The vector engine applies the same rule to the same position
+        engine = vector_engine.VectorEngine([0], 3)
+        engine.hands[:] = 0
+        for card in hand:
+            engine.hands[0, :, card_id(card)] = 1
+        engine.sizes[:] = 2
+        engine.draw_pile[0, :3] = [card_id(card) for card in pile]
+        engine.draw_len[0] = 3
+        engine.discard_pile[0, 0] = card_id(Card.of(CardColor.BLUE, CardLabel.FOUR))
+        engine.discard_len[0] = 1
+        engine.color[0], engine.label[0] = CardColor.BLUE, CardLabel.FOUR
+        results = engine.run()
+        self.assertEqual((results.winners[0], results.rounds[0], results.reshuffles[0]), (vector_engine.STALLED, 7, 2))
+
+    @number("17.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_last_card_wins_out_of_cards(self) -> None:
+        for last_card in (Card.of(CardColor.RED, CardLabel.DRAW_TWO), Card.of(CardColor.CRAZY, CardLabel.DRAW_FOUR)):
+            self.setUp()
+            # The penalty of the last card finds a single card to reshuffle, then nothing left
+            self.players[0].clear_hand()
+            self.players[0].add_card(last_card)
+            self.game.draw_pile.clear()
+            self.game.discard_pile.clear()
+            self.game.discard_pile.push(Card.of(CardColor.RED, CardLabel.FIVE))
+            self.game.current_color, self.game.current_label = CardColor.RED, CardLabel.FIVE
+
+            turns = list(self.game.steps())
+            self.assertIs(self.game.winner, self.players[0])
+            self.assertEqual(self.game.result, GameResult.WIN)
+            self.assertEqual(len(turns), 1)
+            self.assertIs(turns[0].played, last_card)
+            self.assertTrue(turns[0].effects & Effect.WIN)
+            self.assertEqual(self.game.reshuffles, 1)
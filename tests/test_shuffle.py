@@ -0,0 +1,99 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from ed_utils.decorators import number, visibility
+
+import random_gen
+from random_gen import RandomGen, RandomStream
+
+
+class TestShuffle(TestCase):
+
+    def tearDown(self) -> None:
+        RandomGen.shuffle_mode = RandomGen.LEGACY
+
+    @number("15.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_fisher_yates(self) -> None:
+        # Reference shuffle through the public generator
+        RandomGen.set_seed(42)
+        expected = list(range(50))
+        for i in range(len(expected) - 1, 0, -1):
+            j = RandomGen.randint(0, i)
+            expected[i], expected[j] = expected[j], expected[i]
+        seed = RandomGen.seed
+
+        RandomGen.set_seed(42)
+        items = list(range(50))
+        RandomGen.random_shuffle(items, mode=RandomGen.FISHER_YATES)
+        self.assertEqual(items, expected)
+        self.assertEqual(RandomGen.seed, seed)
+
+    @number("15.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_modes(self) -> None:
+        RandomGen.set_seed(7)
+        legacy = list(range(30))
+        RandomGen.random_shuffle(legacy)
+
+        RandomGen.set_seed(7)
+        explicit = list(range(30))
+        RandomGen.random_shuffle(explicit, mode=RandomGen.LEGACY)
+        self.assertEqual(legacy, explicit)
+
+        RandomGen.shuffle_mode = RandomGen.FISHER_YATES
+        RandomGen.set_seed(7)
+        items = list(range(30))
+        RandomGen.random_shuffle(items, 20)
+        self.assertEqual(sorted(items[:20]), list(range(20)))
+        self.assertEqual(items[20:], list(range(20, 30)))
+
+        with self.assertRaises(ValueError):
+            RandomGen.random_shuffle(items, mode="bogus")
+
+    @number("15.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_random_block(self) -> None:
+        for use_numpy in (True, False):
+            with patch.object(random_gen, "np", random_gen.np if use_numpy else None):
+                for n in (0, 1, 7, 112, 5000):
+                    stream = RandomStream(n + 1)
+                    expected = [stream.random() for _ in range(n)]
+                    RandomGen.set_seed(n + 1)
+                    block = RandomGen.random_block(n)
+                    self.assertEqual(len(block), n)
+                    self.assertEqual([int(value) for value in block], expected)
+                    self.assertEqual(RandomGen.seed, stream.seed)
+
+    @number("15.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_block_shuffles(self) -> None:
+        # Shuffles give the same orders whether or not numpy computes their random values
+        for mode in (RandomGen.LEGACY, RandomGen.FISHER_YATES):
+            results = []
+            for use_numpy in (True, False):
+                with patch.object(random_gen, "np", random_gen.np if use_numpy else None):
+                    stream = RandomStream(99)
+                    items = list(range(9000))
+                    stream.random_shuffle(items, mode=mode)
+                    results.append((items, stream.seed))
+            self.assertEqual(results[0], results[1])
+
+    @number("15.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_block_any_seed(self) -> None:
+        # Seeds outside the state range are reduced like random() does, and long blocks keep the table small
+        for seed in (-5, -RandomGen.MOD - 3, 2 ** 64 + 17, 3 ** 90):
+            for n in (1, 100, 3 * random_gen._SHUFFLE_BLOCK + 5):
+                RandomGen.set_seed(seed)
+                expected = [RandomGen.random() for _ in range(n)]
+                stream = RandomStream(seed)
+                block = stream.random_block(n)
+                self.assertEqual([int(value) for value in block], expected)
+                self.assertEqual(stream.seed, RandomGen.seed)
+            RandomGen.set_seed(seed)
+            cards = list(range(40))
+            RandomGen.random_shuffle(cards)
+            self.assertEqual(sorted(cards), list(range(40)))
+        if random_gen.np is not None:
+            self.assertLessEqual(len(random_gen._block_a), random_gen._SHUFFLE_BLOCK)
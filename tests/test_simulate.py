@@ -0,0 +1,38 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+
+from constants import Constants
+from simulate import derive_seed, simulate
+
+
+class TestSimulate(TestCase):
+
+    def setUp(self) -> None:
+        Constants.NUM_CARDS_AT_INIT = 7
+
+    @number("6.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_derive_seed(self) -> None:
+        self.assertEqual(derive_seed(123, 5), derive_seed(123, 5))
+        self.assertNotEqual(derive_seed(123, 5), derive_seed(123, 6))
+        self.assertNotEqual(derive_seed(123, 5), derive_seed(124, 5))
+
+    @number("6.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_batch_totals(self) -> None:
+        stats = simulate(30, 3, master_seed=7, workers=1, chunk_size=8)
+        self.assertEqual(stats.games, 30)
+        self.assertEqual(sum(stats.wins), 30)
+        self.assertGreaterEqual(stats.max_rounds, stats.min_rounds)
+        self.assertGreaterEqual(stats.draws, 0)
+
+    @number("6.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_pool_matches_serial(self) -> None:
+        serial = simulate(20, 4, master_seed=99, workers=1, chunk_size=20)
+        pooled = simulate(20, 4, master_seed=99, workers=2, chunk_size=3)
+        self.assertEqual(pooled.wins, serial.wins)
+        self.assertEqual(pooled.rounds, serial.rounds)
+        self.assertEqual(pooled.draws, serial.draws)
+        self.assertEqual(pooled.reshuffles, serial.reshuffles)
@@ -0,0 +1,109 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures.referential_array import ArrayR
+
+from game import Game
+from events import NullSink
+from random_gen import RandomGen
+from player import Player
+from constants import Constants
+
+
+class SnapshotAtRound(NullSink):
+
+    def __init__(self, round_count: int) -> None:
+        self.round_count = round_count
+        self.game = None
+        self.snapshot = None
+        self.seed = None
+        self.color = None
+
+    def round_started(self, round_count, player, color, label):
+        if round_count == self.round_count:
+            self.snapshot = self.game.snapshot()
+            self.seed = RandomGen.seed
+            self.color = color
+
+
+class TestSnapshot(TestCase):
+
+    def setUp(self) -> None:
+        RandomGen.set_seed(123)
+        Constants.NUM_CARDS_AT_INIT = 7
+        self.players: ArrayR[Player] = ArrayR(3)
+        self.players[0] = Player("Alice", 0)
+        self.players[1] = Player("Bob", 1)
+        self.players[2] = Player("Charlie", 2)
+        self.sink = SnapshotAtRound(10)
+        self.game: Game = Game(self.sink)
+        self.sink.game = self.game
+        self.game.initialise_game(self.players)
+
+    @number("9.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_snapshot_size(self) -> None:
+        snapshot = self.game.snapshot()
+        self.assertIsInstance(snapshot, bytes)
+        self.assertLess(len(snapshot), 200, f"Snapshot should be compact, but has {len(snapshot)} bytes")
+
+    @number("9.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_restore_replays_game(self) -> None:
+        snapshot = self.game.snapshot()
+        winner = self.game.play_game()
+        sizes = [len(self.players[i]) for i in range(3)]
+
+        self.game.restore(snapshot)
+        self.assertEqual(self.game.snapshot(), snapshot)
+        self.assertIsNone(self.game.current_player)
+        self.assertEqual(len(self.players[0]), 7)
+
+        self.assertIs(self.game.play_game(), winner)
+        self.assertEqual([len(self.players[i]) for i in range(3)], sizes)
+
+    @number("9.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_restore_mid_game(self) -> None:
+        self.game.play_game()
+        mid_game = self.sink.snapshot
+        self.assertIsNotNone(mid_game)
+
+        self.game.restore(mid_game)
+        self.assertEqual(self.game.snapshot(), mid_game)
+        self.assertEqual(self.game.round_count, 10)
+        self.assertEqual(RandomGen.seed, self.sink.seed)
+        self.assertEqual(self.game.current_color, self.sink.color)
+
+    @number("9.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_restore_wrong_table(self) -> None:
+        other: Game = Game(NullSink())
+        other.initialise_game(self.players[0:2])
+        with self.assertRaises(ValueError):
+            other.restore(self.game.snapshot())
+
+    @number("9.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_restore_counters_and_index(self) -> None:
+        self.game.play_game()
+        # This game never runs out of cards to draw, pretend it reshuffled to check the counter goes along
+        self.game.reshuffles = 3
+        snapshot = self.game.snapshot()
+        reshuffles = self.game.reshuffles
+
+        other: Game = Game(NullSink())
+        players: ArrayR[Player] = ArrayR(3)
+        for i in range(3):
+            players[i] = Player(f"Player {i}", i)
+        other.initialise_game(players)
+        other.restore(snapshot)
+        self.assertEqual(other.reshuffles, reshuffles)
+        self.assertEqual(other.snapshot(), snapshot)
+        for i in range(3):
+            # The hand index is rebuilt along with the hand
+            self.assertEqual(str(players[i]).split(": ")[1], str(self.players[i]).split(": ")[1])
+            self.assertEqual(players[i].held, self.players[i].held)
+            self.assertEqual(players[i].card_counts, self.players[i].card_counts)
+            self.assertEqual(players[i].color_counts, self.players[i].color_counts)
+            self.assertEqual(players[i].label_counts, self.players[i].label_counts)
@@ -0,0 +1,97 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+
+from data_structures.array_sorted_list import ArraySortedList
+from random_gen import RandomGen
+
+
+class TestSortedList(TestCase):
+
+    def setUp(self) -> None:
+        RandomGen.set_seed(1008)
+
+    def items(self, sorted_list: ArraySortedList) -> list:
+        return [sorted_list[i] for i in range(len(sorted_list))]
+
+    @number("22.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_add_all(self) -> None:
+        sorted_list = ArraySortedList(4)
+        expected = []
+        for size in (0, 1, 3, 10, 50):
+            batch = [RandomGen.randint(0, 20) for _ in range(size)]
+            sorted_list.add_all(batch)
+            expected = sorted(expected + batch)
+            self.assertEqual(self.items(sorted_list), expected)
+        # Smaller and larger than everything already there
+        sorted_list.add_all([-5, 100, -1])
+        self.assertEqual(self.items(sorted_list), sorted(expected + [-5, 100, -1]))
+        # Any iterable, including ones without a length
+        sorted_list.add_all(item for item in (7, -3, 7))
+        self.assertEqual(self.items(sorted_list), sorted(expected + [-5, 100, -1, 7, -3, 7]))
+        sorted_list.add_all(iter(()))
+        self.assertEqual(len(sorted_list), len(expected) + 6)
+
+    @number("22.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_add_all_resizes_once(self) -> None:
+        sorted_list = ArraySortedList(4)
+        sorted_list.add_all([3, 1, 2])
+        array = sorted_list.array
+        sorted_list.add_all(range(100, 0, -1))
+        self.assertIsNot(sorted_list.array, array)
+        self.assertGreaterEqual(len(sorted_list.array), 103)
+        self.assertEqual(self.items(sorted_list), sorted([3, 1, 2] + list(range(1, 101))))
+
+    @number("22.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_bisect_and_count(self) -> None:
+        sorted_list = ArraySortedList(4)
+        sorted_list.add_all([1, 3, 3, 3, 5, 7, 7])
+        self.assertEqual([sorted_list.bisect_left(item) for item in (0, 1, 3, 4, 7, 8)], [0, 0, 1, 4, 5, 7])
+        self.assertEqual([sorted_list.bisect_right(item) for item in (0, 1, 3, 4, 7, 8)], [0, 1, 4, 4, 7, 7])
+        self.assertEqual([sorted_list.count(item) for item in (0, 1, 3, 7)], [0, 1, 3, 2])
+        self.assertEqual(sorted_list.index(3), 1)
+        self.assertIn(5, sorted_list)
+        self.assertNotIn(4, sorted_list)
+        self.assertNotIn(8, sorted_list)
+        with self.assertRaises(ValueError):
+            sorted_list.index(4)
+
+    @number("22.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_range(self) -> None:
+        sorted_list = ArraySortedList(4)
+        for item in (9, 2, 4, 4, 6, 1):
+            sorted_list.add(item)
+        self.assertEqual(list(sorted_list.range(2, 6)), [2, 4, 4])
+        self.assertEqual(list(sorted_list.range(3, 100)), [4, 4, 6, 9])
+        self.assertEqual(len(sorted_list.range(5, 6)), 0)
+        self.assertEqual(len(sorted_list.range(6, 2)), 0)
+        view = sorted_list.range(4, 5)
+        self.assertEqual((len(view), view[0], view[-1]), (2, 4, 4))
+        with self.assertRaises(IndexError):
+            view[2]
+
+    @number("22.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_add_all_is_stable(self) -> None:
+        # Elements comparing equal keep their order in the batch, after those already in the list
+        class Keyed:
+            def __init__(self, key: int, tag: int) -> None:
+                self.key, self.tag = key, tag
+
+            def __lt__(self, other: 'Keyed') -> bool:
+                return self.key < other.key
+
+            def __gt__(self, other: 'Keyed') -> bool:
+                return self.key > other.key
+
+        sorted_list = ArraySortedList(4)
+        sorted_list.add_all([Keyed(1, -1), Keyed(0, -2)])
+        batch = [Keyed(RandomGen.randint(0, 3), tag) for tag in range(40)]
+        sorted_list.add_all(batch)
+        expected = [(0, -2), (1, -1)] + [(item.key, item.tag) for item in batch]
+        expected = [pair for key in range(4) for pair in expected if pair[0] == key]
+        self.assertEqual([(item.key, item.tag) for item in self.items(sorted_list)], expected)
@@ -0,0 +1,59 @@
+from itertools import islice
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures.referential_array import ArrayR
+
+from game import Effect, Game
+from events import NullSink
+from random_gen import RandomGen
+from player import Player
+from constants import Constants
+
+
+class TestSteps(TestCase):
+
+    def setUp(self) -> None:
+        RandomGen.set_seed(123)
+        Constants.NUM_CARDS_AT_INIT = 7
+        self.players: ArrayR[Player] = ArrayR(3)
+        self.players[0] = Player("Alice", 0)
+        self.players[1] = Player("Bob", 1)
+        self.players[2] = Player("Charlie", 2)
+        self.game: Game = Game(NullSink())
+        self.game.initialise_game(self.players)
+
+    @number("12.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_steps_until_win(self) -> None:
+        turns = list(self.game.steps())
+        self.assertEqual(len(turns), self.game.round_count)
+        self.assertEqual([turn.round_count for turn in turns], list(range(1, len(turns) + 1)))
+        self.assertTrue(turns[-1].effects & Effect.WIN)
+        self.assertFalse(any(turn.effects & Effect.WIN for turn in turns[:-1]))
+        self.assertIs(turns[-1].player, self.players[0])
+        self.assertIs(self.game.winner, self.players[0])
+        self.assertEqual(list(self.game.steps()), [], "A finished game should not play any more rounds")
+
+        first = turns[0]
+        self.assertIs(first.player, self.players[0])
+        self.assertEqual(str(first.played), "GREEN FOUR")
+        self.assertIsNone(first.drawn)
+        for turn in turns:
+            if turn.drawn is not None and turn.played is not None:
+                self.assertIs(turn.played, turn.drawn)
+
+    @number("12.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_resume_after_early_stop(self) -> None:
+        list(islice(self.game.steps(), 10))
+        self.assertEqual(self.game.round_count, 10)
+        snapshot = self.game.snapshot()
+
+        winner = self.game.play_game()
+        rounds = self.game.round_count
+        self.assertIs(winner, self.players[0])
+
+        self.game.restore(snapshot)
+        self.assertIs(self.game.play_game(), winner)
+        self.assertEqual(self.game.round_count, rounds)
@@ -0,0 +1,72 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+
+from constants import Constants
+from tournament import Tournament, split_evenly
+
+
+class TestTournament(TestCase):
+
+    def setUp(self) -> None:
+        Constants.NUM_CARDS_AT_INIT = 7
+        self.entrants = [f"Entrant {i}" for i in range(30)]
+
+    @number("20.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_bracket(self) -> None:
+        self.assertEqual(split_evenly(30, 8), [8, 8, 7, 7])
+        self.assertEqual(split_evenly(9, 8), [5, 4])
+        self.assertEqual(split_evenly(8, 8), [8])
+
+        tournament = Tournament(self.entrants, master_seed=1, workers=1)
+        self.assertEqual([(table.round, len(table.entrants)) for table in tournament.tables],
+                         [(1, 8), (1, 8), (1, 7), (1, 7), (2, 4)])
+        self.assertIs(tournament.final, tournament.tables[-1])
+        with self.assertRaises(ValueError):
+            Tournament(self.entrants[:1], master_seed=1)
+
+    @number("20.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_results_stream(self) -> None:
+        tournament = Tournament(self.entrants, master_seed=5, workers=1, table_size=3)
+        winners = {}
+        for result in tournament.results():
+            self.assertIn(result.winner, result.entrants)
+            if result.round > 1:
+                # A table only starts once all its input tables are over
+                for entrant in result.entrants:
+                    self.assertIn(entrant, winners[result.round - 1])
+            winners.setdefault(result.round, []).append(result.winner)
+        self.assertEqual(len(winners[1]), 10)
+        self.assertEqual(winners[max(winners)], [tournament.champion])
+
+    @number("20.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_pool_matches_serial(self) -> None:
+        serial = Tournament(self.entrants, master_seed=9, workers=1, table_size=4)
+        serial_results = {(r.round, r.index): (r.entrants, r.winner, r.rounds) for r in serial.results()}
+        pooled = Tournament(self.entrants, master_seed=9, workers=3, table_size=4)
+        pooled_results = {(r.round, r.index): (r.entrants, r.winner, r.rounds) for r in pooled.results()}
+        self.assertEqual(pooled_results, serial_results)
+        self.assertEqual(pooled.champion, serial.champion)
+
+    @number("20.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_byes(self) -> None:
+        self.assertEqual(split_evenly(3, 2), [2, 1])
+        tournament = Tournament(self.entrants[:5], master_seed=3, workers=1, table_size=2)
+        # Rounds of [2, 2, 1], [2, 1] and the final: the last table of the first two rounds is a bye
+        self.assertEqual([(table.round, len(table.entrants)) for table in tournament.tables],
+                         [(1, 2), (1, 2), (1, 1), (2, 2), (2, 1), (3, 2)])
+        results = list(tournament.results())
+        self.assertEqual(len(results), 4)
+        for result in results:
+            self.assertEqual(len(result.entrants), 2)
+            self.assertGreater(result.rounds, 0)
+        # The entrant of the byes only plays the final
+        self.assertIn(self.entrants[4], results[-1].entrants)
+        self.assertEqual(results[-1].winner, tournament.champion)
+
+        pooled = Tournament(self.entrants[:5], master_seed=3, workers=2, table_size=2)
+        self.assertEqual(pooled.play(), tournament.champion)
@@ -0,0 +1,90 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures.referential_array import ArrayR
+from data_structures.turn_order import TurnOrder
+
+from game import Game
+from events import NullSink
+from random_gen import RandomGen
+from player import Player
+from constants import Constants
+
+
+class TestTurnOrder(TestCase):
+
+    def setUp(self) -> None:
+        self.ring: TurnOrder[str] = TurnOrder(2)
+        for name in ("Alice", "Bob", "Charlie", "David", "Eve"):
+            self.ring.append(name)
+
+    @number("7.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_advance_and_skip(self) -> None:
+        self.assertEqual(len(self.ring), 5)
+        self.assertEqual(self.ring.current(), "Alice")
+        self.assertEqual(self.ring.peek(), "Bob")
+        self.assertEqual(self.ring.advance(), "Bob")
+        self.assertEqual(self.ring.skip(), "David")
+        self.assertEqual(self.ring.advance(3), "Bob")
+
+    @number("7.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_reverse(self) -> None:
+        self.ring.reverse()
+        self.assertEqual(self.ring.peek(), "Eve")
+        self.assertEqual(self.ring.advance(2), "David")
+        self.ring.reverse()
+        self.assertEqual(self.ring.advance(), "Eve")
+        self.assertEqual(self.ring.seat_of("Eve"), 4)
+
+    @number("7.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_game_beyond_max_players(self) -> None:
+        RandomGen.set_seed(123)
+        Constants.NUM_CARDS_AT_INIT = 3
+        num_players = Constants.MAX_PLAYERS * 2
+        players: ArrayR[Player] = ArrayR(num_players)
+        for i in range(num_players):
+            players[i] = Player(f"Player {i}", i)
+        game: Game = Game(NullSink())
+        game.initialise_game(players)
+        self.assertEqual(len(game.turn_order), num_players)
+
+        game.play_reverse()
+        self.assertIs(game.next_player(), players[num_players - 1])
+        game.play_reverse()
+
+        winner: Player = game.play_game()
+        self.assertEqual(len(winner), 0, f"Winner should have no cards left, but has {len(winner)}")
+
+    @number("7.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_set_current_player_and_direction(self) -> None:
+        RandomGen.set_seed(123)
+        Constants.NUM_CARDS_AT_INIT = 3
+        players: ArrayR[Player] = ArrayR(5)
+        for i in range(5):
+            players[i] = Player(f"Player {i}", i)
+        game: Game = Game(NullSink())
+        game.initialise_game(players)
+        self.assertIsNone(game.current_player)
+
+        # Setting the current player moves the cursor of the turn order
+        game.current_player = players[2]
+        self.assertEqual(game.turn_order.index, 2)
+        self.assertIs(game.next_player(), players[3])
+        game.play_skip()
+        self.assertIs(game.current_player, players[3])
+
+        game.direction = -1
+        self.assertEqual(game.turn_order.direction, -1)
+        self.assertIs(game.next_player(), players[2])
+        game.play_skip()
+        self.assertIs(game.current_player, players[2])
+
+        # Before the game starts, play goes round from the first seat
+        game.current_player = None
+        self.assertIs(game.next_player(), players[4])
+        with self.assertRaises(ValueError):
+            game.current_player = Player("Stranger", 9)
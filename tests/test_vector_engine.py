@@ -0,0 +1,57 @@
+from unittest import TestCase, skipIf
+
+from ed_utils.decorators import number, visibility
+
+from constants import Constants
+from simulate import NO_WINNER, play_seeded_game
+import vector_engine
+
+
+@skipIf(vector_engine.np is None, "numpy is not installed")
+class TestVectorEngine(TestCase):
+
+    def setUp(self) -> None:
+        Constants.NUM_CARDS_AT_INIT = 7
+        self.seeds = list(range(1000, 1150))
+
+    def tearDown(self) -> None:
+        Constants.MAX_ROUNDS_PER_PLAYER = 100
+
+    def check_parity(self, num_players: int) -> None:
+        results = vector_engine.simulate_vectorized(self.seeds, num_players)
+        wins = [0] * num_players
+        drawn_games = 0
+        for i, seed in enumerate(self.seeds):
+            winner, rounds, draws, reshuffles, _ = play_seeded_game(seed, num_players)
+            # A game ending in a draw has no winner, it must not count for the last seat
+            if winner >= 0:
+                wins[winner] += 1
+            else:
+                self.assertEqual(winner, NO_WINNER)
+                drawn_games += 1
+            self.assertEqual(results.winners[i], winner, f"Winner of seed {seed} should be seat {winner}")
+            self.assertEqual(results.rounds[i], rounds, f"Seed {seed} should last {rounds} rounds")
+            self.assertEqual(results.draws[i], draws)
+            self.assertEqual(results.reshuffles[i], reshuffles)
+        self.assertEqual(list(results.win_counts()), wins)
+        self.assertEqual(int((results.winners == vector_engine.STALLED).sum()), drawn_games)
+        self.assertEqual(sum(wins) + drawn_games, len(self.seeds))
+        return drawn_games
+
+    @number("10.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_parity_three_players(self) -> None:
+        self.check_parity(3)
+
+    @number("10.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_parity_eight_players(self) -> None:
+        Constants.NUM_CARDS_AT_INIT = 10
+        self.check_parity(8)
+
+    @number("10.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_parity_with_draws(self) -> None:
+        # A small round budget makes some games end in a draw
+        Constants.MAX_ROUNDS_PER_PLAYER = 10
+        self.assertGreater(self.check_parity(3), 0)
@@ -0,0 +1,300 @@
+"""
+Fit 1008 Assignment 1
+"""
+__FILE__ = "tournament.py"
+__author__ = "<Ter Jing Hao>"
+__student_ID__ = "34857613"
+
+import argparse
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from constants import Constants
+from data_structures.referential_array import ArrayR
+from events import NullSink
+from game import Game, GameResult
+from player import Player
+from random_gen import RandomStream
+from simulate import derive_seed
+
+
+class Table:
+    """
+    A table of the bracket: its entrants are known from the start in the first round, and are the
+    winners of its input tables in the later ones. A table of one entrant is a bye: no game is
+    played and the entrant goes straight through.
+
+    Attributes:
+        number (int): Position of the table in the bracket, in order of rounds then tables
+        round (int): The round of the table, from 1
+        index (int): Position of the table in its round
+        seed (int): The seed the game of the table is played with
+        entrants (list): The entrant in every seat, None until the input table is over
+        pending (int): Number of input tables not over yet
+        parent (Table | None): The table the winner goes to, None for the final
+        slot (int): The seat of the winner at the parent table
+    """
+    def __init__(self, number: int, round_number: int, index: int, seed: int, num_players: int) -> None:
+        """
+        Constructor for the Table class
+
+        Complexity:
+            Best Case Complexity: O(P) where P is the number of players
+            Worst Case Complexity: O(P) where P is the number of players
+        """
+        self.number = number
+        self.round = round_number
+        self.index = index
+        self.seed = seed
+        self.entrants = [None] * num_players
+        self.pending = 0
+        self.parent = None
+        self.slot = 0
+
+
+class TableResult:
+    """
+    Result of a table of the tournament, as streamed by Tournament.results
+    """
+    __slots__ = ("round", "index", "entrants", "winner", "rounds", "result")
+
+    def __init__(self, table: Table, winner, rounds: int, result: GameResult) -> None:
+        """
+        Constructor for the TableResult class
+
+        Args:
+            table (Table): The table that was played
+            winner: The entrant that goes through
+            rounds (int): The number of rounds of the game
+            result (GameResult): How the game ended. On a draw, the entrant with the fewest cards goes through
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.round = table.round
+        self.index = table.index
+        self.entrants = tuple(table.entrants)
+        self.winner = winner
+        self.rounds = rounds
+        self.result = result
+
+    def __str__(self) -> str:
+        return f"Round {self.round} table {self.index}: {self.winner} wins ({self.rounds} rounds, {self.result.name})"
+
+
+def split_evenly(count: int, max_size: int) -> list[int]:
+    """
+    Method to split count items into the fewest groups of at most max_size, as even as possible
+
+    Returns:
+        list[int]: The size of every group, larger groups first. There is a group of 1 only
+            when max_size is 2 and count is odd
+
+    Complexity:
+        Best Case Complexity: O(G) where G is the number of groups
+        Worst Case Complexity: O(G) where G is the number of groups
+    """
+    groups = -(-count // max_size)
+    size, larger = divmod(count, groups)
+    return [size + 1 if i < larger else size for i in range(groups)]
+
+
+def play_table(task: tuple[int, int, int, int]) -> tuple[int, int, int, GameResult]:
+    """
+    Worker entry point: plays the game of one table
+
+    Args:
+        task: The table number, seed, number of players and NUM_CARDS_AT_INIT
+
+    Returns:
+        tuple[int, int, int, GameResult]: The table number, the seat that goes through, the
+            number of rounds and how the game ended
+
+    Complexity:
+        Best Case Complexity: O(T) where T is the cost of one game
+        Worst Case Complexity: O(T) where T is the cost of one game
+    """
+    number, seed, num_players, cards_at_init = task
+    # Workers may have been spawned rather than forked, so pass on the setting explicitly
+    Constants.NUM_CARDS_AT_INIT = cards_at_init
+    players: ArrayR[Player] = ArrayR(num_players)
+    for seat in range(num_players):
+        players[seat] = Player(f"Player {seat}", seat)
+    game = Game(NullSink(), RandomStream(seed))
+    game.initialise_game(players)
+    winner = game.play_game()
+    if winner is not None:
+        return number, winner.position, game.round_count, game.result
+
+    # A draw: the fewest cards goes through, the lowest seat on a tie
+    best = 0
+    for seat in range(1, num_players):
+        if len(players[seat]) < len(players[best]):
+            best = seat
+    return number, best, game.round_count, game.result
+
+
+class Tournament:
+    """
+    Knockout tournament of tables of up to MAX_PLAYERS players. The winner of every table goes
+    through to a table of the next round, until a final table is left.
+
+    Tables are played on a pool of processes. A table is started as soon as all its input tables
+    are over, without waiting for the rest of their round, so the pool stays busy even though
+    games take very different times. Every table has a seed derived from the master seed and its
+    position in the bracket, so the results do not depend on the number of workers or the order
+    the tables finish in.
+    """
+    def __init__(self, entrants, master_seed: int, workers: int = None, table_size: int = None) -> None:
+        """
+        Constructor for the Tournament class, which builds the whole bracket
+
+        Args:
+            entrants: The entrants, in seating order. Anything can be used, e.g. names
+            master_seed (int): The seed every table's seed is derived from
+            workers (int): The number of processes, defaults to the number of cores. 1 plays in this process
+            table_size (int): The most players at a table, defaults to MAX_PLAYERS
+
+        Raises:
+            ValueError: If there are fewer than 2 entrants or table_size is below 2
+
+        Complexity:
+            Best Case Complexity: O(N) where N is the number of entrants
+            Worst Case Complexity: O(N) where N is the number of entrants
+        """
+        table_size = Constants.MAX_PLAYERS if table_size is None else table_size
+        if len(entrants) < 2:
+            raise ValueError("A tournament needs at least 2 entrants")
+        if table_size < 2:
+            raise ValueError("Tables need at least 2 players")
+        if workers is None:
+            workers = os.cpu_count() or 1
+        self.workers = workers
+        self.tables = []
+
+        # First round: the entrants are seated straight away
+        start = 0
+        current = []
+        for size in split_evenly(len(entrants), table_size):
+            table = self._new_table(1, len(current), master_seed, size)
+            table.entrants = list(entrants[start:start + size])
+            current.append(table)
+            start += size
+
+        # Later rounds: a table per group of tables of the round before
+        round_number = 1
+        while len(current) > 1:
+            round_number += 1
+            start = 0
+            next_round = []
+            for size in split_evenly(len(current), table_size):
+                table = self._new_table(round_number, len(next_round), master_seed, size)
+                table.pending = size
+                for slot in range(size):
+                    current[start + slot].parent = table
+                    current[start + slot].slot = slot
+                next_round.append(table)
+                start += size
+            current = next_round
+        self.final = current[0]
+        self.champion = None
+
+    def _new_table(self, round_number: int, index: int, master_seed: int, num_players: int) -> Table:
+        number = len(self.tables)
+        table = Table(number, round_number, index, derive_seed(master_seed, number), num_players)
+        self.tables.append(table)
+        return table
+
+    def _task(self, table: Table) -> tuple[int, int, int, int]:
+        return table.number, table.seed, len(table.entrants), Constants.NUM_CARDS_AT_INIT
+
+    def _finish(self, number: int, seat: int, rounds: int, result: GameResult) -> tuple[TableResult, Table | None]:
+        """ Records the result of a table, and returns the parent table if it is now ready. """
+        table = self.tables[number]
+        winner = table.entrants[seat]
+        return TableResult(table, winner, rounds, result), self._go_through(table, winner)
+
+    def _go_through(self, table: Table, winner) -> Table | None:
+        """ Seats the winner of a table at its parent, and returns the parent if it is now ready. """
+        parent = table.parent
+        if parent is None:
+            self.champion = winner
+            return None
+        parent.entrants[table.slot] = winner
+        parent.pending -= 1
+        return parent if parent.pending == 0 else None
+
+    def _playable(self, tables: list[Table]) -> list[Table]:
+        """ Passes the entrant of every bye among the ready tables through, and returns the tables that need a game. """
+        playable = []
+        i = 0
+        while i < len(tables):
+            table = tables[i]
+            i += 1
+            if len(table.entrants) > 1:
+                playable.append(table)
+            else:
+                parent = self._go_through(table, table.entrants[0])
+                if parent is not None:
+                    tables.append(parent)
+        return playable
+
+    def results(self):
+        """
+        Generator playing the tournament, yielding a TableResult as every table finishes. Byes are
+        not played, so they have no TableResult.
+
+        Complexity:
+            Best Case Complexity: O(N * T / W) where N is the number of tables, T the cost of a game and W the number of workers
+            Worst Case Complexity: O(N * T) when every table depends on the one before
+        """
+        ready = self._playable([table for table in self.tables if table.round == 1])
+
+        if self.workers <= 1:
+            while ready:
+                table_result, parent = self._finish(*play_table(self._task(ready.pop(0))))
+                if parent is not None:
+                    ready.extend(self._playable([parent]))
+                yield table_result
+            return
+
+        with ProcessPoolExecutor(self.workers) as pool:
+            running = {pool.submit(play_table, self._task(table)) for table in ready}
+            while running:
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    table_result, parent = self._finish(*future.result())
+                    if parent is not None:
+                        for table in self._playable([parent]):
+                            running.add(pool.submit(play_table, self._task(table)))
+                    yield table_result
+
+    def play(self):
+        """
+        Method to play the whole tournament
+
+        Returns:
+            The entrant that won the final
+
+        Complexity:
+            Best Case Complexity: see results
+            Worst Case Complexity: see results
+        """
+        for _ in self.results():
+            pass
+        return self.champion
+
+
+if __name__ == '__main__':
+    p = argparse.ArgumentParser(description="Play a knockout tournament of seeded headless tables.")
+    p.add_argument("entrants", type=int)
+    p.add_argument("--seed", type=int, default=123)
+    p.add_argument("--workers", type=int, default=None)
+    p.add_argument("--table-size", type=int, default=None)
+    args = p.parse_args()
+
+    tournament = Tournament([f"Entrant {i}" for i in range(args.entrants)], args.seed, args.workers, args.table_size)
+    for table_result in tournament.results():
+        print(table_result)
+    print(f"Champion: {tournament.champion}")
@@ -0,0 +1,335 @@
+"""
+Fit 1008 Assignment 1
+"""
+__FILE__ = "vector_engine.py"
+__author__ = "<Ter Jing Hao>"
+__student_ID__ = "34857613"
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed by this module
+    np = None
+
+from card import CardColor, CardLabel, card_id
+from constants import Constants
+from game import Game, build_deck
+from random_gen import RandomGen
+
+NUM_CARD_IDS = Constants.NUM_COLORS * Constants.NUM_MAX_VALS
+NO_CARD = -1
+STALLED = -1
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("vector_engine needs numpy, install it with `pip install numpy`")
+
+
+class VectorResults:
+    """
+    Results of a batch played by the VectorEngine, one entry per seed.
+
+    Attributes:
+        winners: seat of the winner of every game, STALLED if the game could not go on or ran out of rounds
+        rounds: number of rounds of every game
+        draws: number of cards drawn in every game
+        reshuffles: number of reshuffles in every game
+    """
+    def __init__(self, winners, rounds, draws, reshuffles, num_players: int) -> None:
+        self.winners = winners
+        self.rounds = rounds
+        self.draws = draws
+        self.reshuffles = reshuffles
+        self.num_players = num_players
+
+    def win_counts(self):
+        """ Number of games won by every seat. Stalled games are not counted. """
+        finished = self.winners[self.winners != STALLED]
+        return np.bincount(finished, minlength=self.num_players)
+
+
+class VectorEngine:
+    """
+    Plays many games in lockstep, following the rules of Game.play_game, with the state of every
+    game held in NumPy arrays instead of Card, Player and stack objects.
+
+    A card is its card_id. Hands are counts per card id, so the first card of a sorted hand that
+    can be played is the smallest playable id. Each game has its own LCG state, stepped exactly like
+    RandomGen, so a game played from a seed here ends like Game does with RandomGen.set_seed(seed).
+
+    All the games of a batch have the same number of players. Every round is played by every game
+    that is still running with array operations; only reshuffles, which are rare, are done game by game.
+
+    Attributes (G games, P players, D cards):
+        rng (G,): LCG state of every game
+        hands (G, P, NUM_CARD_IDS): number of cards of every id in every hand
+        sizes (G, P): number of cards in every hand
+        draw_pile, discard_pile (G, D): card ids from the bottom up
+        draw_len, discard_len (G,): number of cards in the piles
+        color, label (G,): current color and label
+        seat, direction (G,): current seat and direction of play
+    """
+    def __init__(self, seeds, num_players: int, cards_at_init: int = None) -> None:
+        """
+        Constructor for the VectorEngine class. Deals every game like Game.initialise_game.
+
+        Args:
+            seeds: one seed per game, as would be given to RandomGen.set_seed
+            num_players (int): number of players at every table
+            cards_at_init (int): cards dealt to every player, defaults to Constants.NUM_CARDS_AT_INIT
+
+        Complexity:
+            Best Case Complexity: O(G * D log D) to shuffle the decks
+            Worst Case Complexity: O(G * D log D) to shuffle the decks
+        """
+        _require_numpy()
+        if cards_at_init is None:
+            cards_at_init = Constants.NUM_CARDS_AT_INIT
+        deck = build_deck()
+        deck_ids = np.array([card_id(deck[i]) for i in range(len(deck))], dtype=np.int64)
+        num_games = len(seeds)
+        num_cards = len(deck_ids)
+
+        self.num_games = num_games
+        self.num_players = num_players
+        self.mask = np.uint64(RandomGen.MOD - 1)
+        self.a = np.uint64(RandomGen.A)
+        self.c = np.uint64(RandomGen.C)
+        self.id_colors = np.arange(NUM_CARD_IDS) // Constants.NUM_MAX_VALS
+        self.id_labels = np.arange(NUM_CARD_IDS) % Constants.NUM_MAX_VALS
+
+        self.rng = np.array([seed % RandomGen.MOD for seed in seeds], dtype=np.uint64)
+        self.hands = np.zeros((num_games, num_players, NUM_CARD_IDS), dtype=np.int16)
+        self.sizes = np.zeros((num_games, num_players), dtype=np.int64)
+        self.draw_pile = np.zeros((num_games, num_cards), dtype=np.int64)
+        self.discard_pile = np.zeros((num_games, num_cards), dtype=np.int64)
+        self.draw_len = np.zeros(num_games, dtype=np.int64)
+        self.discard_len = np.zeros(num_games, dtype=np.int64)
+        self.seat = np.zeros(num_games, dtype=np.int64)
+        self.direction = np.ones(num_games, dtype=np.int64)
+
+        self.winners = np.full(num_games, STALLED, dtype=np.int64)
+        self.finished = np.zeros(num_games, dtype=bool)
+        self.stalled = np.zeros(num_games, dtype=bool)
+        self.rounds = np.zeros(num_games, dtype=np.int64)
+        self.max_rounds = Constants.MAX_ROUNDS_PER_PLAYER * num_players
+        self.draws = np.zeros(num_games, dtype=np.int64)
+        self.reshuffles = np.zeros(num_games, dtype=np.int64)
+        # Rounds in a row that left every hand the same size, and the reshuffles before them, see Game.steps
+        self.still_rounds = np.zeros(num_games, dtype=np.int64)
+        self.reshuffles_at_change = np.zeros(num_games, dtype=np.int64)
+
+        # Shuffle every deck like RandomGen.random_shuffle: sort by (random value, index)
+        randoms = np.empty((num_games, num_cards), dtype=np.uint64)
+        for i in range(num_cards):
+            self.rng = (self.a * self.rng + self.c) & self.mask
+            randoms[:, i] = self.rng >> np.uint64(16)
+        decks = deck_ids[np.argsort(randoms, axis=1, kind="stable")]
+
+        # Deal one card at a time to each player in order
+        games = np.arange(num_games)
+        dealt = 0
+        for _ in range(cards_at_init):
+            for player_seat in range(num_players):
+                self.hands[games, player_seat, decks[:, dealt]] += 1
+                dealt += 1
+        self.sizes[:, :] = cards_at_init
+
+        # The rest is the draw pile, then cards move to the discard pile until a number card is on top
+        num_draw = num_cards - dealt
+        self.draw_pile[:, :num_draw] = decks[:, dealt:]
+        self.draw_len[:] = num_draw
+        searching = games
+        while searching.size:
+            top = self.draw_pile[searching, self.draw_len[searching] - 1]
+            self.draw_len[searching] -= 1
+            self.discard_pile[searching, self.discard_len[searching]] = top
+            self.discard_len[searching] += 1
+            searching = searching[self.id_labels[top] >= CardLabel.SKIP]
+        top = self.discard_pile[games, self.discard_len - 1]
+        self.color = self.id_colors[top]
+        self.label = self.id_labels[top]
+
+    def _random(self, games):
+        """ Steps the LCG of the given games and returns RandomGen.random() for each. """
+        self.rng[games] = (self.a * self.rng[games] + self.c) & self.mask
+        return (self.rng[games] >> np.uint64(16)).astype(np.int64)
+
+    def _reshuffle(self, game: int) -> None:
+        """
+        Shuffles the discard pile of one game, except its top card, into its draw pile like Game.draw_card.
+        A game with nothing to reshuffle cannot go on and is marked as stalled.
+        """
+        n = int(self.discard_len[game])
+        if n <= 1:
+            self.stalled[game] = True
+            return
+        top = self.discard_pile[game, n - 1]
+        # Cards are popped from the discard pile into the temporary array, so they come in reverse
+        temp = self.discard_pile[game, n - 2::-1]
+        seed = int(self.rng[game])
+        randoms = np.empty(n - 1, dtype=np.int64)
+        for i in range(n - 1):
+            seed = (RandomGen.A * seed + RandomGen.C) % RandomGen.MOD
+            randoms[i] = seed >> 16
+        self.rng[game] = seed
+        self.draw_pile[game, :n - 1] = temp[np.argsort(randoms, kind="stable")]
+        self.draw_len[game] = n - 1
+        self.discard_pile[game, 0] = top
+        self.discard_len[game] = 1
+        self.reshuffles[game] += 1
+
+    def _draw(self, games):
+        """ Pops the top card of the draw pile of each game, reshuffling first if needed. NO_CARD if stalled. """
+        for game in games[self.draw_len[games] == 0]:
+            self._reshuffle(game)
+        cards = np.full(games.size, NO_CARD, dtype=np.int64)
+        ok = self.draw_len[games] > 0
+        drawing = games[ok]
+        self.draw_len[drawing] -= 1
+        cards[ok] = self.draw_pile[drawing, self.draw_len[drawing]]
+        self.draws[drawing] += 1
+        return cards
+
+    def _give(self, games, seats, cards) -> None:
+        """ Adds one card to the hand at the given seat of each game, ignoring NO_CARD. """
+        ok = cards != NO_CARD
+        games, seats, cards = games[ok], seats[ok], cards[ok]
+        self.hands[games, seats, cards] += 1
+        self.sizes[games, seats] += 1
+
+    def _penalty(self, games, seats, num_cards: int) -> None:
+        """ The players at the given seats draw num_cards cards each and keep them. """
+        for _ in range(num_cards):
+            self._give(games, seats, self._draw(games))
+
+    def _can_play(self, cards, color, label):
+        colors = self.id_colors[cards]
+        return (cards != NO_CARD) & ((colors == CardColor.CRAZY) | (colors == color) | (self.id_labels[cards] == label))
+
+    def _step(self, games) -> None:
+        """ Plays one round of every given game. """
+        players = self.num_players
+        seat = self.seat[games]
+        color = self.color[games]
+        label = self.label[games]
+        sizes = self.sizes[games]
+        self.rounds[games] += 1
+
+        # First playable card of the current hand: the smallest playable id held
+        playable = (self.hands[games, seat] > 0) & (
+            (self.id_colors == CardColor.CRAZY)
+            | (self.id_colors == color[:, None])
+            | (self.id_labels == label[:, None])
+        )
+        has_card = playable.any(axis=1)
+        played = np.where(has_card, playable.argmax(axis=1), NO_CARD)
+        playing = games[has_card]
+        self.hands[playing, seat[has_card], played[has_card]] -= 1
+        self.sizes[playing, seat[has_card]] -= 1
+
+        # Otherwise draw a card, play it if possible and keep it if not
+        drawing = ~has_card
+        if drawing.any():
+            drawn = self._draw(games[drawing])
+            can_play = self._can_play(drawn, color[drawing], label[drawing])
+            kept = ~can_play
+            self._give(games[drawing][kept], seat[drawing][kept], drawn[kept])
+            played[drawing] = np.where(can_play, drawn, NO_CARD)
+
+        # Put the played card on the discard pile
+        has_played = played != NO_CARD
+        on_pile = games[has_played]
+        self.discard_pile[on_pile, self.discard_len[on_pile]] = played[has_played]
+        self.discard_len[on_pile] += 1
+        played_color = np.where(has_played, self.id_colors[played], NO_CARD)
+        played_label = np.where(has_played, self.id_labels[played], NO_CARD)
+        self.color[on_pile] = played_color[has_played]
+        self.label[on_pile] = played_label[has_played]
+
+        # Special cards, in the same order as Game.play_game
+        has_cards_left = self.sizes[games, seat] != 0
+        reverse = played_label == CardLabel.REVERSE
+        self.direction[games[reverse]] *= -1
+        direction = self.direction[games]
+
+        skip = (played_label == CardLabel.SKIP) & has_cards_left
+        seat[skip] = (seat[skip] + direction[skip]) % players
+
+        crazy = played_color == CardColor.CRAZY
+        if crazy.any():
+            choosing = games[crazy]
+            self.color[choosing] = self._random(choosing) % (CardColor.YELLOW + 1)
+            draw_four = crazy & (played_label == CardLabel.DRAW_FOUR)
+            next_seat = (seat + direction) % players
+            self._penalty(games[draw_four], next_seat[draw_four], 4)
+            move = draw_four & has_cards_left
+            seat[move] = next_seat[move]
+
+        draw_two = ~crazy & (played_label == CardLabel.DRAW_TWO) & has_cards_left
+        if draw_two.any():
+            next_seat = (seat + direction) % players
+            self._penalty(games[draw_two], next_seat[draw_two], 2)
+            seat[draw_two] = next_seat[draw_two]
+
+        # A player without cards wins, after the next player drew for a final DRAW_TWO or DRAW_FOUR
+        won = self.sizes[games, seat] == 0
+        next_seat = (seat + direction) % players
+        for final_label, num_cards in ((CardLabel.DRAW_TWO, 2), (CardLabel.DRAW_FOUR, 4)):
+            final = won & (played_label == final_label)
+            if final.any():
+                self._penalty(games[final], next_seat[final], num_cards)
+        self.winners[games[won]] = seat[won]
+        self.finished[games[won]] = True
+
+        self.seat[games] = np.where(won, seat, next_seat)
+
+        # No hand changed size for a rotation while the pile was recycled, the STALLED rule of Game
+        changed = (self.sizes[games] != sizes).any(axis=1)
+        still_rounds = np.where(changed, 0, self.still_rounds[games] + 1)
+        self.still_rounds[games] = still_rounds
+        self.reshuffles_at_change[games[changed]] = self.reshuffles[games[changed]]
+        looping = (still_rounds >= players) & (
+            self.reshuffles[games] - self.reshuffles_at_change[games] >= Game.STALL_RESHUFFLES)
+        self.stalled[games[looping]] = True
+
+        # An emptied hand wins even if the cards ran out during the round
+        stalled = self.stalled[games] & ~won
+        self.stalled[games[won]] = False
+        self.winners[games[stalled]] = STALLED
+        self.finished[games[stalled]] = True
+
+        # Out of rounds, a draw like the ROUND_LIMIT of Game
+        self.finished[games[self.rounds[games] >= self.max_rounds]] = True
+
+    def run(self) -> VectorResults:
+        """
+        Plays every game to the end
+
+        Returns:
+            VectorResults: The results of every game, in the order of the seeds
+
+        Complexity:
+            Best Case Complexity: O(R * G * I) where R is the length of the longest game and I is NUM_CARD_IDS
+            Worst Case Complexity: O(R * G * (I + D)) with reshuffles
+        """
+        games = np.arange(self.num_games)
+        while games.size:
+            self._step(games)
+            games = games[~self.finished[games]]
+        return VectorResults(self.winners, self.rounds, self.draws, self.reshuffles, self.num_players)
+
+
+def simulate_vectorized(seeds, num_players: int, cards_at_init: int = None) -> VectorResults:
+    """
+    Method to play one game per seed with the VectorEngine
+
+    Args:
+        seeds: one seed per game, as would be given to RandomGen.set_seed
+        num_players (int): number of players at every table
+        cards_at_init (int): cards dealt to every player, defaults to Constants.NUM_CARDS_AT_INIT
+
+    Returns:
+        VectorResults: The results of every game, in the order of the seeds
+    """
+    return VectorEngine(seeds, num_players, cards_at_init).run()